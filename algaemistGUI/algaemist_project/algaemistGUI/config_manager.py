@@ -8,6 +8,12 @@ class ConfigManager:
         self.filename = os.path.join(os.path.dirname(__file__), filename)
         self.config = {
             "reactor_addr": 21,
+            "port": None,  # serial port, None = auto-detect FTDI
+            "daemon_socket": None,  # socket of a running reactor.daemon to attach to, None = own the reactor
+            "settings_cache_ttl": 60,  # seconds before unchanged setpoints are read again
+            "poll_intervals": {"sensors": 2, "pumps": 5, "settings": 60},  # seconds per poll channel
+            "trend_hours": 6,  # hours shown in the trend charts
+            "trend_capacity": 131072,  # samples kept for the trend charts (72 h at 2 s)
             "night_temp_sp2": 10.0,
             "chemostat_setpoint": 50,
             "external_ph_pump": 0
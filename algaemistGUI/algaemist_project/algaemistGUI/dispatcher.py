@@ -0,0 +1,111 @@
+# algaemistGUI/dispatcher.py
+import queue
+import time
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class CommandDispatcher:
+    """
+    Runs reactor commands for the GUI on a background worker, so the Tk main
+    thread never waits for the serial port. Results are handed back through a
+    thread-safe queue which the main thread drains with `after()`:
+
+        dispatcher.run(reactor.submit, "set_ph", 7.2, on_done=lambda ok: label.configure(...))
+
+    Commands run one at a time in the order they were issued. If `func` returns
+    a future (like `Reactor.submit`), `on_done` gets its result once it is done
+    and the worker moves on right away, so the reactor's command queue can
+    coalesce repeated writes to the same setpoint.
+    """
+
+    def __init__(self, root, poll_ms=50):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="GUIDispatch")
+        self._results = queue.Queue()   # (callback, args) to run on the main thread
+        self.root.after(self.poll_ms, self._drain)
+
+    def run(self, func, *args, on_done=None, on_error=None):
+        """
+        Call `func(*args)` on the worker. `on_done(result)` or `on_error(exception)`
+        is then called on the main thread. Returns the future of the call.
+        """
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(lambda f: self._finished(f, func, on_done, on_error))
+        return future
+
+    def post(self, callback, *args):
+        """Call `callback(*args)` on the main thread. Safe to use from any thread."""
+        self._results.put((callback, args))
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _finished(self, future, func, on_done, on_error):
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            if on_error is not None:
+                self.post(on_error, error)
+            else:
+                logging.error(f"GUI command {getattr(func, '__name__', func)} failed: {error}")
+        elif isinstance(future.result(), Future):
+            future.result().add_done_callback(lambda f: self._finished(f, func, on_done, on_error))
+        elif on_done is not None:
+            self.post(on_done, future.result())
+
+    def _drain(self):
+        """Main thread: run all callbacks posted since the last call."""
+        while True:
+            try:
+                callback, args = self._results.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                logging.error(f"GUI callback failed: {e}")
+        self.root.after(self.poll_ms, self._drain)
+
+
+class MainLoopMonitor:
+    """
+    Measures how long the Tk main loop is blocked. A callback is scheduled
+    every `interval_ms`; the delay beyond its due time is time the loop could
+    not react to the user. Delays above `threshold_ms` count as stalls.
+    """
+
+    def __init__(self, root, interval_ms=50, threshold_ms=100):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.started = time.monotonic()
+        self.ticks = 0
+        self.stalls = 0
+        self.stalled_s = 0.0
+        self.max_stall_s = 0.0
+        self._due = self.started + interval_ms / 1000
+        self.root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        now = time.monotonic()
+        delay = now - self._due
+        self.ticks += 1
+        self.max_stall_s = max(self.max_stall_s, delay)
+        if delay * 1000 > self.threshold_ms:
+            self.stalls += 1
+            self.stalled_s += delay
+        self._due = now + self.interval_ms / 1000
+        self.root.after(self.interval_ms, self._tick)
+
+    def stats(self) -> dict:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return {
+            "elapsed_s": round(elapsed, 1),
+            "stalls": self.stalls,
+            "stalled_s": round(self.stalled_s, 3),
+            "stalled_share": round(self.stalled_s / elapsed, 4),
+            "max_stall_ms": round(self.max_stall_s * 1000, 1),
+        }
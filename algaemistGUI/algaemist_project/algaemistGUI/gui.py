@@ -1,8 +1,9 @@
-import threading
 import sys
 import os
 from datetime import datetime
 import subprocess
+import threading
+import logging
 
 # add algaemist_project root to path
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
@@ -10,7 +11,11 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 import customtkinter as ctk
 import algaemistGUI.interface_subclasses as guiElements
 from algaemistGUI.config_manager import ConfigManager
+from algaemistGUI.dispatcher import CommandDispatcher, MainLoopMonitor
 from reactor.reactor import Reactor
+from reactor.acquisition import AcquisitionService
+# ReactorClient, the trend charts (numpy, matplotlib) and TrendBuffer are imported when needed,
+# so the window comes up first (see benchmarks/bench_startup.py)
 
 
 class AlgaemistGUI:
@@ -19,15 +24,20 @@ class AlgaemistGUI:
         # --- Initialize Configurations ---
         self.config_manger = ConfigManager()
         reactor_addr = self.config_manger.get("reactor_addr")
+        reactor_port = self.config_manger.get("port")  # e.g. the pty of reactor.virtual_device
         
         # --- Reactor setup ---
-        self.reactor = Reactor(addr=reactor_addr)
-        self.reactor.connect()  # auto-detect FTDI port
-        
-        now = datetime.now()  # current local date and time
-        hh = now.hour   # current hour (0-23)
-        mm = now.minute # current minute (0-59)
-        self.reactor.set_time(hh,mm)
+        # With "daemon_socket" a running `python -m reactor.daemon` owns the reactor, polls it and
+        # keeps the emergency log; the GUI is one of its clients and may be closed at any time
+        self.daemon_socket = self.config_manger.get("daemon_socket")
+        if self.daemon_socket:
+            from reactor.client import ReactorClient
+            self.reactor = ReactorClient(self.daemon_socket)
+        else:
+            self.reactor = Reactor(addr=reactor_addr, cache_ttl=self.config_manger.get("settings_cache_ttl", 60))
+        self.reactor_port = reactor_port
+        self.connect_retry = 10  # seconds between two attempts to find the reactor
+        self._closing = threading.Event()
 
         # --- GUI root ---
         self.root = ctk.CTk()
@@ -35,7 +45,17 @@ class AlgaemistGUI:
         self.root.geometry("1200x800")
         
         # --- handle threading ---
-        self.sensor_lock = threading.Lock()
+        self.dispatcher = CommandDispatcher(self.root)  # serial I/O of the frames runs off the main thread
+        self.loop_monitor = MainLoopMonitor(self.root)
+        self.acquisition = None
+        if not self.daemon_socket:
+            self.acquisition = AcquisitionService(self.reactor, intervals=self.config_manger.get("poll_intervals"))
+        self.gui_samples = self.reactor.samples.subscribe("gui")
+        self.display_interval = 250  # ms between two looks at the sample queue
+        self.trends = None  # TrendBuffer, made with the charts after the first frame
+        self.trend_charts = []
+        self._trend_read = None     # read time of the sensors last added to the trends
+        self.coalesced = 0  # samples superseded within one display tick, never shown
         
         # Track last logged time for hidden log
         self._last_log_time = None
@@ -68,86 +88,172 @@ class AlgaemistGUI:
 
         self.connection_frame = guiElements.ConnectionFrame(self.root, reactor=self.reactor)
         self.connection_frame.grid(row=1, column=0, padx=10, pady=(10,5), sticky='ew', columnspan=2)
+        self.connection_frame.connecting = True
+        self.connection_frame.set_connection_state()
 
-        self.temperature_frame = guiElements.TemperatureFrame(self.root, reactor=self.reactor, config_manger=self.config_manger, sensor_lock=self.sensor_lock)
+        self.temperature_frame = guiElements.TemperatureFrame(self.root, reactor=self.reactor, config_manger=self.config_manger, dispatcher=self.dispatcher)
         self.temperature_frame.grid(row=2, column=0, padx=10, pady=(10,5), sticky='nsew')
 
-        self.pH_frame = guiElements.PHFrame(self.root, reactor=self.reactor, sensor_lock=self.sensor_lock)
+        self.pH_frame = guiElements.PHFrame(self.root, reactor=self.reactor, dispatcher=self.dispatcher)
         self.pH_frame.grid(row=3, column=0, padx=10, pady=(5,10), sticky='nsew')
 
-        self.light_frame = guiElements.LightFrame(self.root, reactor=self.reactor, sensor_lock=self.sensor_lock)
+        self.light_frame = guiElements.LightFrame(self.root, reactor=self.reactor, dispatcher=self.dispatcher)
         self.light_frame.grid(row=2, column=1, padx=10, pady=(10,10), sticky='nsew', rowspan=2)
 
         self.gas_frame = guiElements.GasFrame(self.root, reactor=self.reactor)
         self.gas_frame.grid(row=3, column=2, padx=10, pady=(5,5), sticky='nsew')
 
-        self.reactor_frame = guiElements.ReactorFrame(self.root, reactor=self.reactor, config_manger=self.config_manger, sensor_lock=self.sensor_lock)
+        self.reactor_frame = guiElements.ReactorFrame(self.root, reactor=self.reactor, config_manger=self.config_manger, dispatcher=self.dispatcher)
         self.reactor_frame.grid(row=2, column=2, padx=10, pady=(5,10), sticky='nsew')
-        
+
+        # --- Reactor connection ---
+        # Port scan, open and set_time run in the background, the window shows "connecting..." meanwhile
+        threading.Thread(target=self._connect, name="ReactorConnect", daemon=True).start()
+
+    def _connect(self):
+        """Background thread: connect the reactor, retry every `connect_retry` s until it works or the window closes."""
+        while not self._closing.is_set():
+            try:
+                self.reactor.connect(self.reactor_port)  # auto-detect FTDI port if None, sets the reactor time
+                if self.daemon_socket:
+                    now = datetime.now()  # the daemon set the time when it connected, maybe days ago
+                    self.reactor.set_time(now.hour, now.minute)
+                self.dispatcher.post(self._on_connected)
+                return
+            except (ConnectionError, RuntimeError, OSError) as e:
+                logging.error(f"Could not connect the reactor, retrying in {self.connect_retry} s: {e}")
+            self._closing.wait(self.connect_retry)
+
+    def _on_connected(self):
+        """Main thread: the reactor is connected, show it and start polling."""
+        self.connection_frame.connecting = False
+        self.connection_frame.set_connection_state()
         self.poll_reactor_sensors()
 
-    def _read_and_update_sensors(self):
-        with self.sensor_lock:
-            if self.reactor.connected:
-                sensors = self.reactor.read_all_sensors()
-                pumps = self.reactor.read_all_pumps()
-                temp_setpoint1 = self.reactor.get_temp_setpoint()
-                temp_ctrl_on = self.reactor.is_temp_control_on()
-                temp_setpoint2 = self.config_manger.get("night_temp_sp2")
-                ph_setpoint = self.reactor.get_ph_setpoint()
-                ph_ctrl_on = self.reactor.get_ph_control_on()
-                ph_corr_fact = self.reactor.get_ph_correction()
-                light_brightness = self.reactor.get_brightness()
-                light_mode = self.reactor.get_light_mode()
-                light_on = self.reactor.get_light_on_time()
-                light_off = self.reactor.get_light_off_time()
-                sec_sens = self.reactor.get_sec_light_sensitivity()
-                turb_setpt = self.reactor.get_turb_setpoint()
-                reactor_mode = self.reactor.get_reactor_mode()
-                chemostat_per = self.config_manger.get("chemostat_setpoint")
-                
-                        
-        # Update GUI safely from the main thread
-        self.root.after(0, lambda: self._update_frames(
-        sensors, pumps, temp_setpoint1, temp_ctrl_on, temp_setpoint2,
-        ph_setpoint, ph_ctrl_on, ph_corr_fact,
-        light_brightness, light_mode, light_on, light_off, sec_sens, turb_setpt , reactor_mode, chemostat_per))
-        
-        # Auto-log every 10 minutes using DataLogger
-        now = datetime.now()
-        if self._last_log_time is None or (now - self._last_log_time).total_seconds() >= self.log_interval:
-            self.reactor.emergency_log(sensors, pumps, path=self.emergency_log_path)
-            self._last_log_time = now
-        
-    def _update_frames(self, sensors, pumps, t_sp1, t_ctrl, t_sp2,
-                ph_sp, ph_ctrl, ph_corr,
-                light_brightness, light_mode, light_on, light_off,
-                sec_sens, turb_setpt, reactor_mode, chemostat_per):
+    def build_trend_charts(self):
+        """Add the trend charts below the values of each frame (loads numpy and matplotlib)."""
+        from algaemistGUI.trend_chart import TrendChart
+        from reactor.trend_buffer import TrendBuffer
+
+        self.trends = TrendBuffer(capacity=self.config_manger.get("trend_capacity", 131072))
+        hours = self.config_manger.get("trend_hours", 6)
+        for frame, channels, row in [
+            (self.temperature_frame, ["temp"], 12),
+            (self.pH_frame, ["pH"], 10),
+            (self.light_frame, ["light_prim", "light_sec"], 12),
+            (self.gas_frame, ["air", "co2"], 3),
+            (self.reactor_frame, ["turb_pump"], 10),
+        ]:
+            chart = TrendChart(frame, self.trends, channels, hours=hours)
+            chart.grid(row=row, column=0, columnspan=2, padx=10, pady=(5, 10), sticky='ew')
+            self.trend_charts.append(chart)
+        self._prefill_trends()
+
+    def _show_snapshots(self):
+        """Main thread: show the newest sample published on the reactor's sample bus."""
+        try:
+            snapshots = self.gui_samples.drain()
+            self._add_to_trends(snapshots)
+            if snapshots:
+                snapshot = snapshots[-1]  # older ones were superseded before we got to them
+                self.coalesced += len(snapshots) - 1
+                if snapshot.sensors is None or snapshot.pumps is None:
+                    logging.debug("Skipping GUI update, no sensor or pump data received yet")
+                else:
+                    self._update_frames(snapshot, self.config_manger.get("night_temp_sp2"),
+                                        self.config_manger.get("chemostat_setpoint"))
+        except Exception as e:
+            logging.error(f"GUI update failed: {e}")
+        finally:
+            self.root.after(self.display_interval, self._show_snapshots)  # one bad sample must not stop the display
+
+    def _prefill_trends(self):
+        """Start the trend charts with what the emergency log holds (last 72 h, one sample per 10 min)."""
+        if self.daemon_socket:
+            rows = self.reactor.history()
+        else:
+            rows = self.reactor.data_logger.retention_rows(self.emergency_log_path)
+        for timestamp, values in rows:
+            self.trends.append(timestamp, values)
+        for chart in self.trend_charts:
+            chart.refresh()
+
+    def _add_to_trends(self, snapshots):
+        """Add the samples with newly read sensor values to the trends and redraw the charts."""
+        for snapshot in snapshots:
+            # A pump or settings read republishes the previous sensors, skip those repeats
+            read = snapshot.read_time("sensors")
+            if snapshot.sensors is None or (self._trend_read is not None and read <= self._trend_read):
+                continue
+            self._trend_read = read
+            self.trends.append(read, {**snapshot.sensors, **(snapshot.pumps or {})})
+        for chart in self.trend_charts:
+            chart.refresh()
+
+    def _write_emergency_log(self, snapshot):
+        """Auto-log the sensor and pump values of a sample every 10 minutes using DataLogger."""
+        self.reactor.emergency_log(snapshot.sensors, snapshot.pumps, path=self.emergency_log_path,
+                                   timestamp=snapshot.read_time("sensors"))
+        self._last_log_time = snapshot.timestamp
+
+    def _update_frames(self, snapshot, t_sp2, chemostat_per):
+        sensors = snapshot.sensors
+        pumps = snapshot.pumps
         
+        # Settings and states stay None until their channel was read once, the frames skip those
         self.temperature_frame.temperature_frame_display_update(
-            sensors["temp"], pumps["heater_pump"], pumps["cooler_pump"], t_sp1, t_ctrl, t_sp2
+            sensors.get("temp"), pumps.get("heater_pump"), pumps.get("cooler_pump"),
+            snapshot.temp_setpoint, snapshot.temp_control_on, t_sp2
         )
         self.pH_frame.ph_frame_display_update(
-            sensors["pH"], ph_sp, ph_ctrl, pumps["co2_pump"], ph_corr
+            sensors.get("pH"), snapshot.ph_setpoint, snapshot.ph_control_on, pumps.get("co2_pump"), snapshot.ph_correction
         )
         self.light_frame.light_frame_display_update(
-            light_brightness, sensors["light_prim"], light_mode, light_on, light_off, sec_sens, sensors["light_sec"]
+            snapshot.brightness, sensors.get("light_prim"), snapshot.light_mode,
+            snapshot.light_on_time, snapshot.light_off_time, snapshot.sec_light_sensitivity, sensors.get("light_sec")
         )
-        self.gas_frame.update_gas_values(sensors['air'], sensors['co2'])
+        self.gas_frame.update_gas_values(sensors.get('air'), sensors.get('co2'))
         
-        self.reactor_frame.update_reactor_status(pumps['turb_pump'], turb_setpt, reactor_mode, chemostat_per)
+        self.reactor_frame.update_reactor_status(pumps.get('turb_pump'), snapshot.turb_setpoint, snapshot.reactor_mode, chemostat_per)
         
 
     def poll_reactor_sensors(self):
-        if self.reactor.connected and not self.sensor_lock.locked():
-            threading.Thread(target=self._read_and_update_sensors, daemon=True).start()
-            
-        self.root.after(4000, self.poll_reactor_sensors)
-            
-            
-        
+        """
+        Start the acquisition service, every channel at its own rate (see "poll_intervals"
+        in the config). With a daemon, it already polls and publishes.
+        """
+        if self.acquisition is not None:
+            # Only log sensors and pumps that were read in the last two poll intervals
+            intervals = self.acquisition.intervals
+            self.reactor.samples.subscribe("emergency_log", callback=self._write_emergency_log,
+                                           every=self.log_interval, fields=("sensors", "pumps"),
+                                           max_age=2 * max(intervals["sensors"], intervals["pumps"]))
+            self.acquisition.start()
+
     def run(self):
+        self.root.update()  # first frame, before the trend charts load numpy and matplotlib
+        self.build_trend_charts()
+        self.root.after(self.display_interval, self._show_snapshots)
         self.root.mainloop()
+        self._closing.set()
+        self.dispatcher.shutdown()
+        if self.acquisition is None:
+            self.reactor.disconnect()  # the daemon keeps polling and logging
+        else:
+            self.acquisition.stop()
+            self.reactor.disconnect()  # close the serial port
+            self.reactor.data_logger.close()  # write the rows still queued for the CSV
+            logging.info(f"Acquisition statistics: {self.acquisition.stats()}")
+        logging.info(f"Main loop stalls: {self.loop_monitor.stats()}")
+        logging.info(f"Display updates: {self.display_stats()}")
+
+    def display_stats(self) -> dict:
+        """Widget updates done and skipped (unchanged) per frame, and the samples coalesced per tick."""
+        frames = {"temperature": self.temperature_frame, "pH": self.pH_frame, "light": self.light_frame,
+                  "gas": self.gas_frame, "reactor": self.reactor_frame}
+        stats = {name: frame.display.stats() for name, frame in frames.items()}
+        stats["coalesced_samples"] = self.coalesced
+        return stats
 
     def open_camera(self):
         if hasattr(self, "camera_process") and self.camera_process.poll() is None:
@@ -3,10 +3,44 @@ from tkinter import messagebox
 import logging
 
 
+class DisplayCache:
+    """
+    What the display updates of a frame last showed in each widget, so they
+    only touch widgets whose text or colour actually changed. Every
+    `configure()` makes CustomTkinter redraw (and often re-lay out) the
+    widget, even with the same text.
+    """
+
+    def __init__(self):
+        self._shown = {}            # widget -> options of its last configure()
+        self.updated = 0
+        self.skipped = 0
+
+    def configure(self, widget, **options):
+        if self._shown.get(widget) == options:
+            self.skipped += 1
+            return
+        widget.configure(**options)
+        self._shown[widget] = options
+        self.updated += 1
+
+    def set(self, menu, value: str):
+        """Option menus are compared with what they show, the user may have picked another entry."""
+        if menu.get() == value:
+            self.skipped += 1
+            return
+        menu.set(value)
+        self.updated += 1
+
+    def stats(self) -> dict:
+        return {"updated": self.updated, "skipped": self.skipped}
+
+
 class ConnectionFrame(customtkinter.CTkFrame):
     def __init__(self, master, reactor):
         super().__init__(master, height=32)
         self.reactor = reactor
+        self.connecting = False  # set by the GUI while it looks for the reactor in the background
         self.grid_propagate(False)
         self.grid_columnconfigure((0, 1, 2, 3), weight=1)
 
@@ -30,8 +64,11 @@ class ConnectionFrame(customtkinter.CTkFrame):
         if self.reactor.connected:
             self.con_state_value_label.configure(text="connected", text_color="green")
             # Show actual port if available
-            if self.reactor.ser:
-                self.port_value_label.configure(text=self.reactor.ser.port)
+            if self.reactor.port:
+                self.port_value_label.configure(text=self.reactor.port)
+        elif self.connecting:
+            self.con_state_value_label.configure(text="connecting...", text_color="orange")
+            self.port_value_label.configure(text="searching")
         else:
             self.con_state_value_label.configure(text="disconnected", text_color="red")
             self.port_value_label.configure(text="N/A")
@@ -43,12 +80,13 @@ class ConnectionFrame(customtkinter.CTkFrame):
 
 
 class TemperatureFrame(customtkinter.CTkScrollableFrame):
-    def __init__(self, master, reactor, config_manger, sensor_lock):
+    def __init__(self, master, reactor, config_manger, dispatcher):
         super().__init__(master)
         
         self.reactor = reactor
         self.config_manger = config_manger
-        self.sensor_lock = sensor_lock
+        self.dispatcher = dispatcher
+        self.display = DisplayCache()
         self.grid_columnconfigure((0,1), weight=1)
     
         self.title = customtkinter.CTkLabel(self, text='Temperature', fg_color="gray30", corner_radius=6)
@@ -111,66 +149,55 @@ class TemperatureFrame(customtkinter.CTkScrollableFrame):
     ### Methods for temperature frame ###
         
     def temperature_frame_display_update(self, temp_value: float, heater_power: float, cooler_power: float, temp_setpoint1: float,  control_on: bool, temp_setpoint2: float): 
-        """Update all temperature frame display elements."""
+        """Update all temperature frame display elements (values not read yet are None and skipped)."""
         
         # Current temperature
-        self.temp_label.configure(text=f"Current Temp: {temp_value:.2f} °C")
+        if temp_value is not None:
+            self.display.configure(self.temp_label, text=f"Current Temp: {temp_value:.2f} °C")
         
         # Heater / cooler powers
-        self.heat_label.configure(text=f"Heater power: {heater_power} %")
-        self.cool_label.configure(text=f"Cooler power: {cooler_power} %")
+        if heater_power is not None:
+            self.display.configure(self.heat_label, text=f"Heater power: {heater_power} %")
+        if cooler_power is not None:
+            self.display.configure(self.cool_label, text=f"Cooler power: {cooler_power} %")
         
         # Temperature setpoint
-        self.set_pt_label.configure(text=f"Current temp set point SP1: {temp_setpoint1:.2f} °C")
-        self.set_pt_label2.configure(text=f"Current temp set point SP2: {temp_setpoint2:.2f} °C")
+        if temp_setpoint1 is not None:
+            self.display.configure(self.set_pt_label, text=f"Current temp set point SP1: {temp_setpoint1:.2f} °C")
+        if temp_setpoint2 is not None:
+            self.display.configure(self.set_pt_label2, text=f"Current temp set point SP2: {temp_setpoint2:.2f} °C")
         
         # Control switch state
-        if control_on:
-            self.temp_ctrl_value_label.configure(text="ON", text_color="green")
+        if control_on is None:
+            pass
+        elif control_on:
+            self.display.configure(self.temp_ctrl_value_label, text="ON", text_color="green")
         else:
-            self.temp_ctrl_value_label.configure(text="OFF", text_color="red")
+            self.display.configure(self.temp_ctrl_value_label, text="OFF", text_color="red")
             
-    def apply_setpoint1(self, retry=0):
+    def apply_setpoint1(self):
         """Send the temperature day setpoint to the reactor."""
         
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.apply_setpoint1(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return        
-        
         temp_str = self.temp_set_pt.get()  # get value from entry
         if not temp_str:
             return  # nothing entered
 
         try:
             temp_val = float(temp_str)
-            # Send command via Reactor method
-            success = self.reactor.set_temp_day(temp_val)
-            if success:
-                logging.info(f"Day temperature setpoint sent: {temp_val} °C")
-            else:
-                messagebox.showwarning("Command Failed", f"Failed to set day temperature: {temp_val} °C")
+            # Send command via Reactor method on the dispatcher worker
+            def on_result(success):
+                if success:
+                    logging.info(f"Day temperature setpoint sent: {temp_val} °C")
+                else:
+                    messagebox.showwarning("Command Failed", f"Failed to set day temperature: {temp_val} °C")
+            self.dispatcher.run(self.reactor.submit, "set_temp_day", temp_val, on_done=on_result)
 
         except ValueError:
             # Show a pop-up error without halting the program
             messagebox.showerror("Invalid Input", "Please enter a valid number for the setpoint.")
 
-    def apply_setpoint2(self, retry=0):
+    def apply_setpoint2(self):
         """Send the temperature night setpoint to reactor and update config."""
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.apply_setpoint2(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return
         
         temp_str = self.temp_set_pt2.get()
         if not temp_str:
@@ -178,14 +205,15 @@ class TemperatureFrame(customtkinter.CTkScrollableFrame):
 
         try:
             temp_val = float(temp_str)
-            # Send command via Reactor method
-            success = self.reactor.set_temp_night(temp_val)
-            if success:
-                self.config_manger.set("night_temp_sp2", temp_val)
-                self.config_manger.save()
-                logging.info(f"Night temperature setpoint sent: {temp_val} °C (and saved to config)")
-            else:
-                messagebox.showwarning("Command Failed", f"Failed to set night temperature: {temp_val} °C")
+            # Send command via Reactor method on the dispatcher worker
+            def on_result(success):
+                if success:
+                    self.config_manger.set("night_temp_sp2", temp_val)
+                    self.config_manger.save()
+                    logging.info(f"Night temperature setpoint sent: {temp_val} °C (and saved to config)")
+                else:
+                    messagebox.showwarning("Command Failed", f"Failed to set night temperature: {temp_val} °C")
+            self.dispatcher.run(self.reactor.submit, "set_temp_night", temp_val, on_done=on_result)
 
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter a valid number for the setpoint.")    
@@ -193,11 +221,12 @@ class TemperatureFrame(customtkinter.CTkScrollableFrame):
 
 
 class PHFrame(customtkinter.CTkScrollableFrame):
-    def __init__(self, master, reactor, sensor_lock):
+    def __init__(self, master, reactor, dispatcher):
         super().__init__(master)
         
         self.reactor = reactor
-        self.sensor_lock = sensor_lock
+        self.dispatcher = dispatcher
+        self.display = DisplayCache()
         self.grid_columnconfigure((0,1), weight=1)
         # self.current_setpoint = '' # default set point 
         
@@ -252,57 +281,53 @@ class PHFrame(customtkinter.CTkScrollableFrame):
     ### Methods for pH frame ###    
         
     def ph_frame_display_update(self, ph_value: float, ph_setpoint: float, control_on: bool, ph_base_power: float, ph_correction : float):
-        """Update all pH frame display elements."""
+        """Update all pH frame display elements (values not read yet are None and skipped)."""
         
         # Current pH value
-        self.pH_label.configure(text=f"Current pH: {ph_value:.2f}")
+        if ph_value is not None:
+            self.display.configure(self.pH_label, text=f"Current pH: {ph_value:.2f}")
         
         # pH setpoint
-        self.set_pt_label.configure(text=f"Current pH set point: {ph_setpoint:.2f}")
+        if ph_setpoint is not None:
+            self.display.configure(self.set_pt_label, text=f"Current pH set point: {ph_setpoint:.2f}")
         
         # Pump powers
-        self.ph_base_label.configure(text=f"Base pump power: {ph_base_power:.1f} %")
-        self.ph_correction_label.configure(text=f"pH correction: {ph_correction:.1f}")
+        if ph_base_power is not None:
+            self.display.configure(self.ph_base_label, text=f"Base pump power: {ph_base_power:.1f} %")
+        if ph_correction is not None:
+            self.display.configure(self.ph_correction_label, text=f"pH correction: {ph_correction:.1f}")
 
         
         # Control switch state (or ON/OFF indicator)
-        if control_on:
-            self.pH_ctrl_value_label.configure(text="ON", text_color="green")
+        if control_on is None:
+            pass
+        elif control_on:
+            self.display.configure(self.pH_ctrl_value_label, text="ON", text_color="green")
         else:
-            self.pH_ctrl_value_label.configure(text="OFF", text_color="red")
+            self.display.configure(self.pH_ctrl_value_label, text="OFF", text_color="red")
             
-    def apply_setpointpH(self, retry=0):
+    def apply_setpointpH(self):
         """Send the pH setpoint to the reactor."""
         
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.apply_setpointpH(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return
-        
-        
         pH_str = self.pH_set_pt.get()  # get value from entry
         if not pH_str:
             return  # nothing entered
 
         try:
             pH_val = float(pH_str)
-            # Send command via Reactor method
-            success = self.reactor.set_ph(pH_val)
-            if success:
-                logging.info(f"pH setpoint sent: {pH_val}")
-            else:
-                messagebox.showwarning("Command Failed", f"Failed to set pH setpoint: {pH_val}")
+            # Send command via Reactor method on the dispatcher worker
+            def on_result(success):
+                if success:
+                    logging.info(f"pH setpoint sent: {pH_val}")
+                else:
+                    messagebox.showwarning("Command Failed", f"Failed to set pH setpoint: {pH_val}")
+            self.dispatcher.run(self.reactor.submit, "set_ph", pH_val, on_done=on_result)
 
         except ValueError:
             # Show a pop-up error without halting the program
             messagebox.showerror("Invalid Input", "Please enter a valid number for the setpoint.")
 
-    def on_ph_pump_selected(self, selected_mode, retry=0):
+    def on_ph_pump_selected(self, selected_mode):
         """Confirm and send command to select acid/base pump."""
         result = messagebox.askyesno(
             "Confirm pH Pump Mode",
@@ -310,37 +335,30 @@ class PHFrame(customtkinter.CTkScrollableFrame):
         )
         if result:
             
-            MAX_RETRIES = 10
-
-            # If another thread is using the serial connection, retry shortly
-            if self.sensor_lock.locked():
-                if retry < MAX_RETRIES:
-                    self.winfo_toplevel().after(1000, lambda: self.on_ph_pump_selected(retry + 1))
-                else:
-                    messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-                return
             
             
             mode_map = {"base": 0, "acid": 1}
             mode_value = mode_map.get(selected_mode)
 
-            success = self.reactor.set_external_ph_pump(mode_value)
-            if success:
-                logging.info(f"External pH pump set to: {selected_mode.upper()}")
-            else:
-                messagebox.showwarning(
-                    "Command Failed",
-                    f"Failed to change external pH pump to '{selected_mode}'."
-                )
+            def on_result(success):
+                if success:
+                    logging.info(f"External pH pump set to: {selected_mode.upper()}")
+                else:
+                    messagebox.showwarning(
+                        "Command Failed",
+                        f"Failed to change external pH pump to '{selected_mode}'."
+                    )
+            self.dispatcher.run(self.reactor.submit, "set_external_ph_pump", mode_value, on_done=on_result)
                 
                 
 
 class LightFrame(customtkinter.CTkScrollableFrame):
-    def __init__(self, master,reactor, sensor_lock):
+    def __init__(self, master,reactor, dispatcher):
         super().__init__(master)
         
         self.reactor = reactor
-        self.sensor_lock = sensor_lock
+        self.dispatcher = dispatcher
+        self.display = DisplayCache()
         self.grid_columnconfigure((0,1), weight=1)
         
         # Light frame title
@@ -413,103 +431,84 @@ class LightFrame(customtkinter.CTkScrollableFrame):
         self.set_button3.grid(row=11, column=1, padx=(5, 20), pady=(0, 10), sticky="w")
     
     def light_frame_display_update(self, brightness: float, prim_light: float, mode: int, on_time: str, off_time: str, sec_sensitivity: int, sec_value: float):
-        """Update all display elements in the light frame."""
+        """Update all display elements in the light frame (values not read yet are None and skipped)."""
         
         # Brightness %
-        self.set_pt_label.configure(text=f"Current brightness: {brightness:.1f} %")
+        if brightness is not None:
+            self.display.configure(self.set_pt_label, text=f"Current brightness: {brightness:.1f} %")
 
         # Primary light sensor reading
-        self.lisens1_label.configure(text=f"Sensor 1: {prim_light:.1f} ")
+        if prim_light is not None:
+            self.display.configure(self.lisens1_label, text=f"Sensor 1: {prim_light:.1f} ")
 
         # Mode (translate number to readable text)
-        mode_text = {1: "continuous", 2: "timed", 3: "sinus"}.get(mode, f"unknown ({mode})")
-        self.light_ctrl_menu.set(mode_text)
+        if mode is not None:
+            mode_text = {1: "continuous", 2: "timed", 3: "sinus"}.get(mode, f"unknown ({mode})")
+            self.display.set(self.light_ctrl_menu, mode_text)
 
         # Timed On/Off
-        self.on_set_pt_label.configure(text=f"ON time: {on_time[:2]}:{on_time[2:]}")
-        self.off_set_pt_label.configure(text=f"OFF time: {off_time[:2]}:{off_time[2:]}")
+        if on_time is not None:
+            self.display.configure(self.on_set_pt_label, text=f"ON time: {on_time[:2]}:{on_time[2:]}")
+        if off_time is not None:
+            self.display.configure(self.off_set_pt_label, text=f"OFF time: {off_time[:2]}:{off_time[2:]}")
 
         # Secondary light info
-        self.lisens2_label.configure(text=f"Sensor 2: {sec_value:.1f}")
+        if sec_value is not None:
+            self.display.configure(self.lisens2_label, text=f"Sensor 2: {sec_value:.1f}")
         
         # Set dropdown to current value
-        if sec_sensitivity == 0:
-            self.sec_sens_menu.set("Low")
+        if sec_sensitivity is None:
+            pass
+        elif sec_sensitivity == 0:
+            self.display.set(self.sec_sens_menu, "Low")
         elif sec_sensitivity == 1:
-            self.sec_sens_menu.set("High")
+            self.display.set(self.sec_sens_menu, "High")
         else:
-            self.sec_sens_menu.set("Unknown")
+            self.display.set(self.sec_sens_menu, "Unknown")
 
         
         
         
-    def on_sec_sens_selected(self, selected_value: str, retry=0):
+    def on_sec_sens_selected(self, selected_value: str):
         """Send command to reactor when user selects sensitivity."""
         
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.on_sec_sens_selected(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return
-        
         mode_map = {"Low": 0, "High": 1}
         mode_value = mode_map.get(selected_value)
         
         if mode_value is not None:
-            success = self.reactor.set_secondary_light_sensitivity(mode_value)
-            if success:
-                logging.info(f"Secondary light sensitivity set to {selected_value}")
-            else:
-                messagebox.showwarning(
-                    "Command Failed",
-                    f"Failed to set secondary light sensitivity to {selected_value}"
-                )
+            def on_result(success):
+                if success:
+                    logging.info(f"Secondary light sensitivity set to {selected_value}")
+                else:
+                    messagebox.showwarning(
+                        "Command Failed",
+                        f"Failed to set secondary light sensitivity to {selected_value}"
+                    )
+            self.dispatcher.run(self.reactor.submit, "set_secondary_light_sensitivity", mode_value, on_done=on_result)
                 
-    def apply_brightness(self, retry=0):
+    def apply_brightness(self):
         """Send the brightness setpoint to the reactor."""
         
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.apply_brightness(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return   
-        
         brigth_str = self.bright_set_pt.get()  # get value from entry
         if not brigth_str:
             return  # nothing entered
 
         try:
             bri_val = int(brigth_str)      
-            # Send command via Reactor method
-            success = self.reactor.set_brightness(bri_val)
-            if success:
-                logging.info(f"New brightness sent: {bri_val}")
-            else:
-                messagebox.showwarning("Command Failed", f"Failed to set brightness: {bri_val}")
+            # Send command via Reactor method on the dispatcher worker
+            def on_result(success):
+                if success:
+                    logging.info(f"New brightness sent: {bri_val}")
+                else:
+                    messagebox.showwarning("Command Failed", f"Failed to set brightness: {bri_val}")
+            self.dispatcher.run(self.reactor.submit, "set_brightness", bri_val, on_done=on_result)
 
         except ValueError:
             # Show a pop-up error without halting the program
             messagebox.showerror("Invalid Input", "Please enter a valid number for the setpoint.")
     
-    def apply_light_on_time(self, retry=0):
+    def apply_light_on_time(self):
         
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.apply_light_on_time(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return
         
         time_str = self.on_set_pt.get().strip()
         if not time_str:
@@ -528,29 +527,21 @@ class LightFrame(customtkinter.CTkScrollableFrame):
             if not (0 <= hh <= 23 and 0 <= mm <= 59):
                 raise ValueError("Hours must be 0-23 and minutes 0-59")
 
-            # Send command via Reactor method
-            success = self.reactor.set_light_on_time(hh,mm)
-            if success:
-                logging.info(f"New ON time sent: {hh}:{mm}")
-            else:
-                messagebox.showwarning("Command Failed", f"Failed to set ON time: {hh}:{mm}")
+            # Send command via Reactor method on the dispatcher worker
+            def on_result(success):
+                if success:
+                    logging.info(f"New ON time sent: {hh}:{mm}")
+                else:
+                    messagebox.showwarning("Command Failed", f"Failed to set ON time: {hh}:{mm}")
+            self.dispatcher.run(self.reactor.submit, "set_light_on_time", hh,mm, on_done=on_result)
 
         except ValueError as e:
             messagebox.showerror("Invalid Input", f"Please enter a valid time in HH:MM format.\n{e}")
         
     
     
-    def apply_light_off_time(self, retry=0):
+    def apply_light_off_time(self):
         
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.apply_light_off_time(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return
         
         time_str = self.off_set_pt.get().strip()
         if not time_str:
@@ -569,18 +560,19 @@ class LightFrame(customtkinter.CTkScrollableFrame):
             if not (0 <= hh <= 23 and 0 <= mm <= 59):
                 raise ValueError("Hours must be 0-23 and minutes 0-59")
 
-            # Send command via Reactor method
-            success = self.reactor.set_light_off_time(hh,mm)
-            if success:
-                logging.info(f"New OFF time sent: {hh}:{mm}")
-            else:
-                messagebox.showwarning("Command Failed", f"Failed to set OFF time: {hh}:{mm}")
+            # Send command via Reactor method on the dispatcher worker
+            def on_result(success):
+                if success:
+                    logging.info(f"New OFF time sent: {hh}:{mm}")
+                else:
+                    messagebox.showwarning("Command Failed", f"Failed to set OFF time: {hh}:{mm}")
+            self.dispatcher.run(self.reactor.submit, "set_light_off_time", hh,mm, on_done=on_result)
 
         except ValueError as e:
             messagebox.showerror("Invalid Input", f"Please enter a valid time in HH:MM format.\n{e}")
         
     
-    def on_mode_selected(self, selected_mode, retry=0):
+    def on_mode_selected(self, selected_mode):
         """Ask user if they want to change the mode and send command."""
         result = messagebox.askyesno(
             "Confirm Mode Change",
@@ -589,35 +581,27 @@ class LightFrame(customtkinter.CTkScrollableFrame):
         
         if result:
             
-            MAX_RETRIES = 10
-
-            # If another thread is using the serial connection, retry shortly
-            if self.sensor_lock.locked():
-                if retry < MAX_RETRIES:
-                    self.winfo_toplevel().after(1000, lambda: self.on_mode_selected(retry + 1))
-                else:
-                    messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-                return
             
             # Map string to mode number
             mode_map = {"continuous": 1, "timed": 2, "sinus": 3}
             mode_value = mode_map.get(selected_mode)
             
-            success = self.reactor.set_light_mode(mode_value)
-            
-            if success:
-                logging.info(f"Light mode set to: {selected_mode.upper()}")
-            else:
-                messagebox.showwarning(
-                    "Command Failed",
-                    f"Failed to change light mode to '{selected_mode}'."
-                )
+            def on_result(success):
+                if success:
+                    logging.info(f"Light mode set to: {selected_mode.upper()}")
+                else:
+                    messagebox.showwarning(
+                        "Command Failed",
+                        f"Failed to change light mode to '{selected_mode}'."
+                    )
+            self.dispatcher.run(self.reactor.submit, "set_light_mode", mode_value, on_done=on_result)
 
 class GasFrame(customtkinter.CTkScrollableFrame):
     def __init__(self, master,reactor):
         super().__init__(master, height=60)
         
         self.reactor = reactor
+        self.display = DisplayCache()
         self.grid_columnconfigure((0,1), weight=1)
 
         
@@ -634,18 +618,21 @@ class GasFrame(customtkinter.CTkScrollableFrame):
         
     def update_gas_values(self, value1, value2):
         """Update the displayed light sensor values."""
-        self.air_label.configure(text=f"Airflow: {value1:.2f} l/min")
-        self.co2_label.configure(text=f"CO2: {value2:.2f} l/min")
+        if value1 is not None:
+            self.display.configure(self.air_label, text=f"Airflow: {value1:.2f} l/min")
+        if value2 is not None:
+            self.display.configure(self.co2_label, text=f"CO2: {value2:.2f} l/min")
     
     
 
 class ReactorFrame(customtkinter.CTkScrollableFrame):
-    def __init__(self, master, reactor, config_manger, sensor_lock):
+    def __init__(self, master, reactor, config_manger, dispatcher):
         super().__init__(master)
         
         self.reactor = reactor
         self.config_manager = config_manger
-        self.sensor_lock = sensor_lock
+        self.dispatcher = dispatcher
+        self.display = DisplayCache()
         self.grid_columnconfigure((0,1), weight=1)    
         
         self.title = customtkinter.CTkLabel(self, text='Reactor Control', fg_color="gray30", corner_radius=6)
@@ -702,14 +689,14 @@ class ReactorFrame(customtkinter.CTkScrollableFrame):
         
         # Update pump power if provided
         if pump_power is not None:
-            self.turb_pump_label.configure(text=f"Pump power: {pump_power:.2f} %")
+            self.display.configure(self.turb_pump_label, text=f"Pump power: {pump_power:.2f} %")
         
         # Update turbidity setpoint if provided
         if turb_setpoint is not None:
-            self.turb_set_pt_label.configure(text=f"Current Turb set point: {turb_setpoint:.2f}")
+            self.display.configure(self.turb_set_pt_label, text=f"Current Turb set point: {turb_setpoint:.2f}")
             
         if chemostat_per is not None:
-            self.chemo_label.configure(text=f"Chemostat: {chemostat_per} %")
+            self.display.configure(self.chemo_label, text=f"Chemostat: {chemostat_per} %")
 
         # Update reactor mode if provided
         if reactor_mode is not None:
@@ -720,12 +707,12 @@ class ReactorFrame(customtkinter.CTkScrollableFrame):
                 3: "Timed Chemostat"
             }
             mode_str = mode_map.get(reactor_mode, "Chemostat")
-            self.reactor_ctrl_menu.set(mode_str)
+            self.display.set(self.reactor_ctrl_menu, mode_str)
 
         
     
         
-    def on_reactor_mode_selected(self, selected_mode, retry=0):
+    def on_reactor_mode_selected(self, selected_mode):
         """Ask user if they want to change the reactor mode and send command."""
         result = messagebox.askyesno(
             "Confirm Mode Change",
@@ -735,15 +722,6 @@ class ReactorFrame(customtkinter.CTkScrollableFrame):
         if not result:
             return  # user cancelled
         
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.on_reactor_mode_selected(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return
 
         # Map string mode names to numeric codes expected by reactor
         mode_mapping = {
@@ -758,30 +736,20 @@ class ReactorFrame(customtkinter.CTkScrollableFrame):
             messagebox.showerror("Error", f"Unknown mode: {selected_mode}")
             return
 
-        success = self.reactor.set_reactor_mode(mode_value)
-
-        if success:
-            logging.info(f"Reactor mode set to: {selected_mode}")
-        else:
-            messagebox.showwarning(
-                "Command Failed",
-                f"Failed to change reactor mode to '{selected_mode}'."
-            )
+        def on_result(success):
+            if success:
+                logging.info(f"Reactor mode set to: {selected_mode}")
+            else:
+                messagebox.showwarning(
+                    "Command Failed",
+                    f"Failed to change reactor mode to '{selected_mode}'."
+                )
+        self.dispatcher.run(self.reactor.submit, "set_reactor_mode", mode_value, on_done=on_result)
                 
                 
-    def apply_turbidity(self, retry=0):
+    def apply_turbidity(self):
         """Send the turbidostat setpoint to the reactor."""
         
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.apply_turbidity(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return
-        
         turb_str = self.turb_set_pt.get()  # get value from entry
         if not turb_str:
             return  # nothing entered
@@ -789,29 +757,21 @@ class ReactorFrame(customtkinter.CTkScrollableFrame):
         try:
             turb_val = int(turb_str)
             
-            # Send command via Reactor method
-            success = self.reactor.set_turbidity(turb_val)
-            if success:
-                logging.info(f"New turbidity sent: {turb_val}")
-            else:
-                messagebox.showwarning("Command Failed", f"Failed to set turbidity: {turb_val}")
+            # Send command via Reactor method on the dispatcher worker
+            def on_result(success):
+                if success:
+                    logging.info(f"New turbidity sent: {turb_val}")
+                else:
+                    messagebox.showwarning("Command Failed", f"Failed to set turbidity: {turb_val}")
+            self.dispatcher.run(self.reactor.submit, "set_turbidity", turb_val, on_done=on_result)
 
         except ValueError:
             # Show a pop-up error without halting the program
             messagebox.showerror("Invalid Input", "Please enter a valid number for the setpoint.")
     
     
-    def apply_chemostat(self, retry=0):
-        """Send the chemostat setpoint to the reactor (auto retries if busy)."""
-        MAX_RETRIES = 10
-
-        # If another thread is using the serial connection, retry shortly
-        if self.sensor_lock.locked():
-            if retry < MAX_RETRIES:
-                self.winfo_toplevel().after(1000, lambda: self.apply_chemostat(retry + 1))
-            else:
-                messagebox.showwarning("Please Try Again", "System is busy. Try again in a moment.")
-            return
+    def apply_chemostat(self):
+        """Send the chemostat setpoint to the reactor."""
         chemo_str = self.chemo_set_pt.get()  # get value from entry
         if not chemo_str:
             return  # nothing entered
@@ -821,14 +781,15 @@ class ReactorFrame(customtkinter.CTkScrollableFrame):
 
             
             # print(cmd_value)
-            # Send command via Reactor method
-            success = self.reactor.set_chemostat(chemo_val)                
-            if success:
-                self.config_manager.set("chemostat_setpoint", chemo_val)
-                self.config_manager.save()
-                logging.info(f"New chemostat setpoint sent: {chemo_val} (and saved to config)")
-            else:
-                messagebox.showwarning("Command Failed", f"Failed to set chemostat: {chemo_val}")
+            # Send command via Reactor method on the dispatcher worker
+            def on_result(success):
+                if success:
+                    self.config_manager.set("chemostat_setpoint", chemo_val)
+                    self.config_manager.save()
+                    logging.info(f"New chemostat setpoint sent: {chemo_val} (and saved to config)")
+                else:
+                    messagebox.showwarning("Command Failed", f"Failed to set chemostat: {chemo_val}")
+            self.dispatcher.run(self.reactor.submit, "set_chemostat", chemo_val, on_done=on_result)
 
         except ValueError:
             # Show a pop-up error without halting the program
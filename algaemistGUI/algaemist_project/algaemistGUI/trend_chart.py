@@ -0,0 +1,100 @@
+# algaemistGUI/trend_chart.py
+import time
+
+import numpy as np
+import customtkinter
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+from reactor.trend_buffer import TrendBuffer, minmax_decimate
+
+
+class TrendChart(customtkinter.CTkFrame):
+    """
+    Live trend of some channels of a `TrendBuffer` over the last `hours`.
+
+    The x axis is fixed (hours before now), so a refresh only draws the
+    lines onto a saved copy of the empty axes (blitting). Axes, ticks and
+    labels are drawn again only after a resize or when a value leaves the y
+    range. Every line is min/max decimated to the pixel width of the plot,
+    so a refresh costs about the same for 10 minutes or 72 hours of data.
+    """
+
+    def __init__(self, master, buffer: TrendBuffer, channels: list[str], hours: float = 6.0,
+                 labels: dict | None = None, height: int = 140):
+        super().__init__(master, fg_color="transparent")
+        self.buffer = buffer
+        self.hours = hours
+        self._version = None        # buffer version of the last refresh
+        self._background = None     # the axes without lines, from the last full draw
+        self.full_draws = 0
+        self.blits = 0
+
+        self.figure = Figure(figsize=(4, height / 100), dpi=100, facecolor="#2b2b2b")
+        self.ax = self.figure.add_subplot(facecolor="#212121")
+        self.ax.set_xlim(-hours, 0)
+        self.ax.set_ylim(0, 1)
+        self.ax.tick_params(colors="gray70", labelsize=7)
+        self.ax.set_xlabel("hours ago", color="gray70", fontsize=7)
+        for spine in self.ax.spines.values():
+            spine.set_color("gray40")
+        labels = labels or {}
+        self.lines = {}
+        for channel in channels:
+            line, = self.ax.plot([], [], linewidth=1, label=labels.get(channel, channel))
+            line.set_animated(True)     # left out of full draws, drawn by _draw_lines()
+            self.lines[channel] = line
+        if len(channels) > 1:
+            self.ax.legend(loc="upper left", fontsize=7, labelcolor="gray80", facecolor="#2b2b2b", edgecolor="gray40")
+        self.figure.tight_layout(pad=0.4)
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self)
+        self.canvas.get_tk_widget().configure(height=height)
+        self.canvas.get_tk_widget().pack(fill="both", expand=True)
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+
+    def refresh(self, force: bool = False):
+        """Show the buffer's new samples (no-op if there are none)."""
+        if not force and self._version == self.buffer.version:
+            return
+        self._version = self.buffer.version
+        now = time.time()
+        t0 = now - self.hours * 3600
+        width = max(int(self.ax.bbox.width), 1)
+        low, high = np.inf, -np.inf
+        for channel, line in self.lines.items():
+            times, values = self.buffer.window(channel, t0)
+            times, values = minmax_decimate(times, values, width, t0, now)
+            line.set_data((times - now) / 3600, values)
+            valid = values[np.isfinite(values)]
+            if len(valid):
+                low, high = min(low, float(valid.min())), max(high, float(valid.max()))
+
+        if self._rescale(low, high) or self._background is None:
+            self.canvas.draw()      # _on_draw saves the new background and draws the lines
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_lines()
+            self.canvas.blit(self.ax.bbox)
+            self.blits += 1
+
+    def _rescale(self, low: float, high: float) -> bool:
+        """New y limits if the values left the current ones or fill less than a quarter of them."""
+        if not np.isfinite(low):
+            return False
+        margin = max((high - low) * 0.1, abs(high) * 0.01, 0.05)
+        y0, y1 = self.ax.get_ylim()
+        if y0 <= low and high <= y1 and y1 - y0 <= 4 * (high - low + 2 * margin):
+            return False
+        self.ax.set_ylim(low - margin, high + margin)
+        return True
+
+    def _on_draw(self, event):
+        """After every full draw (also on resize): keep the empty axes, add the lines."""
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_lines()
+        self.full_draws += 1
+
+    def _draw_lines(self):
+        for line in self.lines.values():
+            self.ax.draw_artist(line)
@@ -0,0 +1,82 @@
+# benchmarks/bench_async.py
+#
+# Aggregate polls/sec for N simulated reactors:
+#   threaded: one Reactor + one thread per device (as poll_reactor_sensors does)
+#   asyncio:  N AsyncReactors driven from a single event loop
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_async --devices 12
+
+import argparse
+import asyncio
+import os
+import tempfile
+import threading
+import time
+
+from reactor.reactor import Reactor
+from reactor.async_reactor import AsyncReactor
+from reactor.connection import AsyncSerial
+from reactor.virtual_device import VirtualReactor, VirtualSerial
+
+
+def bench_threaded(devices, duration, latency):
+    polls = [0] * devices
+    stop = threading.Event()
+
+    def worker(i):
+        reactor = Reactor(addr=21)
+        reactor.ser = VirtualSerial(VirtualReactor(addr=21), latency=latency)
+        reactor._connected = True
+        while not stop.is_set():
+            reactor.read_snapshot()
+            polls[i] += 1
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(devices)]
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    return sum(polls) / duration, devices
+
+
+async def bench_asyncio(devices, duration, latency):
+    reactors = []
+    for _ in range(devices):
+        reactor = AsyncReactor(addr=21)
+        reactor.attach(AsyncSerial(VirtualSerial(VirtualReactor(addr=21), latency=latency), poll_interval=0.001))
+        reactors.append(reactor)
+
+    polls = 0
+    deadline = time.monotonic() + duration
+
+    async def worker(reactor):
+        nonlocal polls
+        while time.monotonic() < deadline:
+            await reactor.read_snapshot()
+            polls += 1
+
+    await asyncio.gather(*(worker(r) for r in reactors))
+    return polls / duration, 0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, nargs="+", default=[1, 4, 12])
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds per run")
+    parser.add_argument("--latency", type=float, default=0.01, help="simulated device round trip in s")
+    args = parser.parse_args()
+
+    # Reactor() creates a DataLogger CSV in the working directory
+    os.chdir(tempfile.mkdtemp())
+    print(f"{'devices':>7} {'threaded polls/s':>17} {'+threads':>8} {'asyncio polls/s':>16} {'+threads':>8}")
+    for n in args.devices:
+        threaded, t_threads = bench_threaded(n, args.duration, args.latency)
+        aio, a_threads = asyncio.run(bench_asyncio(n, args.duration, args.latency))
+        print(f"{n:>7} {threaded:>17.2f} {t_threads:>8} {aio:>16.2f} {a_threads:>8}")
+
+
+if __name__ == "__main__":
+    main()
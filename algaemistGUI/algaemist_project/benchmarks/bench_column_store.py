@@ -0,0 +1,79 @@
+# benchmarks/bench_column_store.py
+#
+# Time to load a long experiment for analysis: the DataLogger CSV with
+# pandas (read_csv + to_datetime, like data/algae_report.py) against the
+# column store (memory-mapped, whole DataFrame and a single channel).
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_column_store --days 7
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from reactor.column_store import CHANNELS, load_columns, load_dataframe, import_csv
+
+
+def write_csv(path, rows):
+    """Synthetic DataLogger CSV with one row per second."""
+    start = datetime(2025, 1, 1)
+    rng = np.random.default_rng(0)
+    values = rng.normal(20, 5, size=(rows, len(CHANNELS))).round(2)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp", *CHANNELS, "comments"])
+        for i in range(rows):
+            timestamp = (start + timedelta(seconds=i)).strftime("%Y-%m-%d %H:%M:%S")
+            writer.writerow([timestamp, *values[i], "Temp set to 20" if i % 10000 == 0 else ""])
+
+
+def timed(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=float, default=2)
+    args = parser.parse_args()
+
+    rows = int(args.days * 86400)
+    directory = tempfile.mkdtemp()
+    csv_path = os.path.join(directory, "experiment.csv")
+    cols_path = os.path.join(directory, "experiment.cols")
+    write_csv(csv_path, rows)
+    import_csv(csv_path, cols_path)
+
+    def load_csv():
+        df = pd.read_csv(csv_path)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        return df
+
+    def mean_temp():
+        return float(np.nanmean(load_columns(cols_path)["temp"]))
+
+    size_csv = os.path.getsize(csv_path)
+    size_cols = sum(os.path.getsize(os.path.join(cols_path, f)) for f in os.listdir(cols_path))
+    print(f"{rows} rows   csv {size_csv / 1e6:.1f} MB   column store {size_cols / 1e6:.1f} MB")
+
+    t_csv, df_csv = timed(load_csv)
+    t_cols, df_cols = timed(lambda: load_dataframe(cols_path))
+    t_temp, _ = timed(mean_temp)
+    assert (df_csv["timestamp"].values == df_cols["timestamp"].values).all()
+    print(f"csv          read_csv + to_datetime  {t_csv * 1e3:8.1f} ms")
+    print(f"column store load_dataframe          {t_cols * 1e3:8.1f} ms   ({t_csv / t_cols:.0f}x)")
+    print(f"column store one channel (mean temp) {t_temp * 1e3:8.1f} ms   ({t_csv / t_temp:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
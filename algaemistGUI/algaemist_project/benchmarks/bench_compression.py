@@ -0,0 +1,73 @@
+# benchmarks/bench_compression.py
+#
+# Rows written with deadband / swinging door compression and the largest
+# reconstruction error per channel, for the logs in data/ and for a 1 s
+# sampled synthetic day (what auto logging with a short interval produces).
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_compression
+
+import argparse
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from reactor.compression import CompressionFilter, DEFAULT_DEADBANDS, reconstruct
+
+
+def synthetic_day():
+    """One day at 1 s: slow temperature / pH drift with sensor noise, pumps switching every few hours."""
+    rng = np.random.default_rng(0)
+    n = 86400
+    t = np.arange(n)
+    return pd.DataFrame({
+        "timestamp": pd.date_range(datetime(2025, 1, 1), periods=n, freq="1s"),
+        "temp": (20 + 1.5 * np.sin(t / 7000) + rng.normal(0, 0.01, n)).round(2),
+        "pH": (7 + 0.3 * np.sin(t / 20000) + rng.normal(0, 0.003, n)).round(2),
+        "light_prim": np.full(n, 64.0),
+        "air": (260 + rng.normal(0, 0.5, n)).round(2),
+        "turb_pump": np.where((t // 10800) % 2 == 0, 100.0, 0.0),
+    })
+
+
+def compress(df, mode):
+    channels = [c for c in df.columns if c in DEFAULT_DEADBANDS]
+    f = CompressionFilter(mode, heartbeat=600)
+    rows = []
+    for record in df[["timestamp", *channels]].itertuples(index=False):
+        values = {c: (None if v != v else float(v)) for c, v in zip(channels, record[1:])}
+        rows += f.add(record[0].to_pydatetime(), values)
+    rows += f.flush()
+    return pd.DataFrame([{"timestamp": t, **v} for t, v, _ in rows]), channels
+
+
+def report(name, df):
+    print(f"{name}: {len(df)} rows")
+    for mode, method in [("deadband", "step"), ("swinging_door", "linear")]:
+        kept, channels = compress(df, mode)
+        rebuilt = reconstruct(kept, timestamps=df["timestamp"], method=method, channels=channels)
+        errors = []
+        for c in channels:
+            error = np.nanmax(np.abs(rebuilt[c].to_numpy() - df[c].to_numpy(dtype=float)), initial=0)
+            errors.append(f"{c} {error:.3g}/{DEFAULT_DEADBANDS[c]:g}")
+        print(f"  {mode:<14} {len(kept):>7} rows ({len(df) / len(kept):5.1f}x)   max error / deadband: "
+              + ", ".join(errors))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("logs", nargs="*", default=["data/weekend_longrun_1.csv", "data/growth_data1.csv",
+                                                    "data/exp_data.csv"])
+    args = parser.parse_args()
+    for path in args.logs:
+        if os.path.exists(path):
+            df = pd.read_csv(path)
+            df["timestamp"] = pd.to_datetime(df["timestamp"])
+            report(path, df.drop_duplicates("timestamp", keep="last"))
+    report("synthetic day at 1 s", synthetic_day())
+
+
+if __name__ == "__main__":
+    main()
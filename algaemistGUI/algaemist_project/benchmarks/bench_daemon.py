@@ -0,0 +1,84 @@
+# benchmarks/bench_daemon.py
+#
+# A ReactorDaemon on a virtual reactor with 1 ... 16 attached ReactorClients
+# following its samples: serial commands per second (the same for any number
+# of clients), how late the snapshots arrive at the clients, and the round
+# trip of a command sent through the daemon.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_daemon --seconds 10
+
+import argparse
+import os
+import statistics
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from reactor.client import ReactorClient
+from reactor.daemon import ReactorDaemon
+from reactor.reactor import Reactor
+from reactor.virtual_device import VirtualReactor, VirtualSerial
+
+
+def bench(clients, seconds, latency, directory):
+    reactor = Reactor(addr=21)
+    reactor.ser = VirtualSerial(VirtualReactor(addr=21), latency=latency)
+    reactor._connected = True
+    socket_path = os.path.join(directory, f"daemon_{clients}.sock")
+    daemon = ReactorDaemon(reactor, socket_path, emergency_log_path=os.path.join(directory, ".data", "log.csv"))
+    daemon.start()
+
+    lags = []
+    lock = threading.Lock()
+
+    def on_sample(snapshot):
+        with lock:
+            lags.append((datetime.now() - snapshot.timestamp).total_seconds())
+
+    attached = []
+    for _ in range(clients):
+        client = ReactorClient(socket_path)
+        client.connect()
+        client.samples.subscribe("bench", callback=on_sample)
+        attached.append(client)
+
+    time.sleep(1)       # first polls
+    with lock:
+        lags.clear()
+    commands = reactor.ser.stats["commands"]
+    start = time.perf_counter()
+    round_trips = []
+    while time.perf_counter() - start < seconds:
+        t = time.perf_counter()
+        attached[0].get_temp_setpoint()     # from the daemon's settings cache, no serial traffic
+        round_trips.append(time.perf_counter() - t)
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - start
+    commands = reactor.ser.stats["commands"] - commands
+
+    for client in attached:
+        client.disconnect()
+    daemon.stop()
+    with lock:
+        delivered = len(lags)
+        lag = 1e3 * statistics.median(lags) if lags else float("nan")
+    print(f"{clients:>7} {commands / elapsed:>13.1f} {delivered / clients / elapsed:>14.2f} "
+          f"{lag:>14.2f} {1e3 * statistics.median(round_trips):>16.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--latency", type=float, default=0.02, help="virtual serial answer delay (s)")
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    print(f"{'clients':>7} {'serial cmd/s':>13} {'samples/s each':>14} {'median lag ms':>14} {'call round trip ms':>16}")
+    for clients in (1, 4, 16):
+        bench(clients, args.seconds, args.latency, directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# benchmarks/bench_follower.py
+#
+# Watching a growing experiment log: re-reading the whole CSV after every
+# batch of new rows (what the notebooks do) against a LogFollower that
+# only parses the appended rows. The cost of the reload grows with the
+# file, the follower's with the batch.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_follower --days 2
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from reactor.follower import LogFollower
+from benchmarks.bench_column_store import write_csv
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=float, default=2)
+    parser.add_argument("--batch", type=int, default=60, help="rows appended between two reads")
+    parser.add_argument("--reads", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = int(args.days * 86400)
+    directory = tempfile.mkdtemp()
+    source = os.path.join(directory, "source.csv")
+    write_csv(source, rows + args.batch * args.reads)
+    with open(source, "rb") as f:
+        lines = f.readlines()
+
+    live = os.path.join(directory, "live.csv")
+    with open(live, "wb") as f:
+        f.writelines(lines[:rows + 1])
+    follower = LogFollower(live)
+    follower.read()
+
+    reload_times, follow_times = [], []
+    position = rows + 1
+    for _ in range(args.reads):
+        with open(live, "ab") as f:
+            f.writelines(lines[position:position + args.batch])
+        position += args.batch
+
+        start = time.perf_counter()
+        df = pd.read_csv(live)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        reload_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        chunk = follower.read()
+        follow_times.append(time.perf_counter() - start)
+        assert len(chunk) == args.batch
+
+    reload_ms = 1e3 * sum(reload_times) / args.reads
+    follow_ms = 1e3 * sum(follow_times) / args.reads
+    print(f"{rows} rows in the log, {args.batch} new rows per read, {args.reads} reads")
+    print(f"full reload   {reload_ms:8.2f} ms per read")
+    print(f"LogFollower   {follow_ms:8.2f} ms per read   ({reload_ms / follow_ms:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_gui_stall.py
+#
+# Main-loop stall time while the operator sends setpoints to a reactor that
+# does not answer (1 s readline timeout), with the setter called directly in
+# the event handler (old GUI) and through the CommandDispatcher (new GUI).
+#
+# Tk needs a display, so the handlers run on a minimal single threaded
+# after() loop with the same MainLoopMonitor the GUI uses.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_gui_stall
+
+import argparse
+import heapq
+import itertools
+import os
+import tempfile
+import time
+
+from algaemistGUI.dispatcher import CommandDispatcher, MainLoopMonitor
+from reactor.reactor import Reactor
+from reactor.virtual_device import VirtualReactor, VirtualSerial
+
+
+class HeadlessLoop:
+    """Stand-in for the Tk root: `after()` and a single threaded main loop."""
+
+    def __init__(self):
+        self._timers = []
+        self._seq = itertools.count()
+
+    def after(self, ms, func, *args):
+        heapq.heappush(self._timers, (time.monotonic() + ms / 1000, next(self._seq), func, args))
+
+    def mainloop(self, seconds):
+        end = time.monotonic() + seconds
+        while time.monotonic() < end:
+            due, _, func, args = self._timers[0]
+            if due > time.monotonic():
+                time.sleep(min(due - time.monotonic(), 0.005))
+                continue
+            heapq.heappop(self._timers)
+            func(*args)
+
+
+def bench(name, dispatched, args):
+    reactor = Reactor(addr=21, cache_ttl=0)
+    reactor.ser = VirtualSerial(VirtualReactor(addr=21), drop_rate=args.drop_rate)
+    reactor._connected = True
+
+    root = HeadlessLoop()
+    dispatcher = CommandDispatcher(root)
+    monitor = MainLoopMonitor(root)
+    results = []
+
+    def on_click():
+        # What apply_setpointpH does with the entered value
+        if dispatched:
+            dispatcher.run(reactor.set_ph, 7.0, on_done=results.append)
+        else:
+            results.append(reactor.set_ph(7.0))
+        root.after(int(args.click_interval * 1000), on_click)
+
+    root.after(100, on_click)
+    root.mainloop(args.seconds)
+    dispatcher.shutdown()
+    stats = monitor.stats()
+    print(f"{name:<12} done {len(results):3d}   stalls {stats['stalls']:3d}   "
+          f"stalled {stats['stalled_share'] * 100:5.1f} % of the time   max stall {stats['max_stall_ms']:7.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--click-interval", type=float, default=0.5, help="s between setpoint changes")
+    parser.add_argument("--drop-rate", type=float, default=1.0, help="share of unanswered commands")
+    args = parser.parse_args()
+
+    # Reactor() creates a DataLogger CSV in the working directory
+    os.chdir(tempfile.mkdtemp())
+    print(f"{args.seconds:.0f} s main loop, a setpoint every {args.click_interval} s, "
+          f"{args.drop_rate * 100:.0f} % of the answers lost")
+    bench("direct", False, args)
+    bench("dispatched", True, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# benchmarks/bench_loader.py
+#
+# Loading a DataLogger CSV the way the scripts and notebooks did
+# (read_csv + to_datetime) against `log_loader.load()`: the first call
+# parses and writes the sidecar cache, later calls only read the cache.
+# Also compares the memory of the frames (float32 / categorical vs. defaults).
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_loader --days 2
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from reactor.log_loader import load, clear_cache
+from benchmarks.bench_column_store import write_csv, timed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=float, default=2)
+    args = parser.parse_args()
+
+    rows = int(args.days * 86400)
+    csv_path = os.path.join(tempfile.mkdtemp(), "experiment.csv")
+    write_csv(csv_path, rows)
+
+    def read_csv():
+        df = pd.read_csv(csv_path)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        return df
+
+    t_plain, plain = timed(read_csv)
+    clear_cache(csv_path)
+    start = time.perf_counter()
+    load(csv_path)
+    t_first = time.perf_counter() - start
+    t_cached, cached = timed(lambda: load(csv_path))
+
+    def mb(df):
+        return df.memory_usage(deep=True).sum() / 1e6
+
+    print(f"{rows} rows")
+    print(f"read_csv + to_datetime  {t_plain * 1e3:8.1f} ms   {mb(plain):6.1f} MB")
+    print(f"load(), first (parse)   {t_first * 1e3:8.1f} ms")
+    print(f"load(), cached          {t_cached * 1e3:8.1f} ms   {mb(cached):6.1f} MB   ({t_plain / t_cached:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# benchmarks/bench_logger.py
+#
+# Time the caller of DataLogger.log_values spends per row (i.e. how long the
+# acquisition thread is held up) with direct writes (open / append / close
+# per row) and with the buffered background writer.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_logger
+
+import argparse
+import os
+import tempfile
+import time
+
+from reactor.utils import DataLogger
+
+
+SENSORS = {"temp": 20.5, "pH": 7.1, "light_prim": 120.0, "light_sec": 300.0, "air": 1.2, "co2": 0.1}
+PUMPS = {"heater_pump": 10.0, "cooler_pump": 0.0, "co2_pump": 5.0, "turb_pump": 0.0}
+
+
+def bench(name, logger, rows):
+    caller = []
+    start = time.perf_counter()
+    for i in range(rows):
+        t = time.perf_counter()
+        logger.log_values(SENSORS, PUMPS, comment=f"row {i}")
+        caller.append(time.perf_counter() - t)
+    logger.close()                          # includes the final flush
+    total = time.perf_counter() - start
+    caller.sort()
+    with open(logger.path) as f:
+        written = sum(1 for _ in f) - 1
+    print(f"{name:<10} caller mean {sum(caller) / rows * 1e6:7.1f} us   "
+          f"max {caller[-1] * 1e3:6.2f} ms   total {total:5.2f} s   rows in file {written}")
+    return logger
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    print(f"{args.rows} rows")
+    bench("direct", DataLogger(os.path.join(directory, "direct.csv"), buffered=False), args.rows)
+    logger = bench("buffered", DataLogger(os.path.join(directory, "buffered.csv")), args.rows)
+    print(f"writer: {logger.writer_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_offset_index.py
+#
+# "Temperature during one hour / one day of a long run": read_csv on the
+# whole log and filter, against a range query through the sparse offset
+# index, which only parses the bytes of that window. Also reports how long
+# building the index takes once.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_offset_index --days 7
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from reactor.offset_index import OffsetIndex
+from benchmarks.bench_column_store import write_csv, timed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=float, default=7)
+    args = parser.parse_args()
+
+    rows = int(args.days * 86400)
+    csv_path = os.path.join(tempfile.mkdtemp(), "experiment.csv")
+    write_csv(csv_path, rows)
+
+    start = time.perf_counter()
+    index = OffsetIndex(csv_path)
+    index.update()
+    build = time.perf_counter() - start
+
+    def full(t0, t1):
+        df = pd.read_csv(csv_path)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        return df[(df["timestamp"] >= t0) & (df["timestamp"] < t1)]["temp"]
+
+    t_full = None
+    print(f"{rows} rows ({os.path.getsize(csv_path) / 1e6:.0f} MB), index built in {build * 1e3:.0f} ms "
+          f"({index.stats()['entries']} entries)")
+    for span in (timedelta(hours=1), timedelta(days=1)):
+        t0 = datetime(2025, 1, 1) + timedelta(days=args.days / 2)
+        t1 = t0 + span
+        if t_full is None:
+            t_full, expected = timed(lambda: full(t0, t1), repeat=1)
+        t_index, result = timed(lambda: OffsetIndex(csv_path).range(t0, t1, ["temp"]))
+        assert len(result) == span.total_seconds()
+        print(f"{str(span):>15}   read_csv + filter {t_full * 1e3:8.1f} ms   "
+              f"offset index {t_index * 1e3:7.1f} ms   ({t_full / t_index:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# benchmarks/bench_query_many.py
+#
+# Compare one GUI poll done with the 16 single getters against
+# one batched Reactor.read_snapshot() call.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_query_many           # in-process virtual reactor
+#     python -m benchmarks.bench_query_many --pty     # virtual reactor on a pseudo-terminal
+
+import argparse
+import os
+import tempfile
+import time
+
+from reactor.reactor import Reactor
+from reactor.virtual_device import VirtualDevice, VirtualReactor, VirtualSerial
+
+
+def poll_per_getter(reactor):
+    """The poll as done by AlgaemistGUI before the batched API."""
+    return (
+        reactor.read_all_sensors(),
+        reactor.read_all_pumps(),
+        reactor.get_temp_setpoint(),
+        reactor.is_temp_control_on(),
+        reactor.get_ph_setpoint(),
+        reactor.get_ph_control_on(),
+        reactor.get_ph_correction(),
+        reactor.get_brightness(),
+        reactor.get_light_mode(),
+        reactor.get_light_on_time(),
+        reactor.get_light_off_time(),
+        reactor.get_sec_light_sensitivity(),
+        reactor.get_turb_setpoint(),
+        reactor.get_reactor_mode(),
+    )
+
+
+def poll_snapshot(reactor):
+    return reactor.read_snapshot()
+
+
+def make_reactor(line, cache_ttl):
+    reactor = Reactor(addr=21, cache_ttl=cache_ttl)
+    if isinstance(line, VirtualDevice):
+        reactor.connect(line.port)
+    else:
+        reactor.ser = line
+        reactor._connected = True
+    return reactor
+
+
+def bench(name, poll, reactor, line, rounds):
+    commands = line.stats["commands"]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        poll(reactor)
+    elapsed = (time.perf_counter() - start) / rounds
+    sent = (line.stats["commands"] - commands) / rounds
+    print(f"{name:<18} {elapsed * 1000:8.1f} ms per poll {sent:6.1f} commands per poll")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated device round trip in s")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--pty", action="store_true", help="talk to the virtual reactor through a pty")
+    args = parser.parse_args()
+
+    # Reactor() creates a DataLogger CSV in the working directory
+    os.chdir(tempfile.mkdtemp())
+    if args.pty:
+        line = VirtualDevice(VirtualReactor(addr=21), latency=args.latency).start()
+    else:
+        line = VirtualSerial(VirtualReactor(addr=21), latency=args.latency)
+
+    print(f"Simulated round trip: {args.latency * 1000:.0f} ms, {args.rounds} polls each")
+    old = bench("per-getter", poll_per_getter, make_reactor(line, cache_ttl=0), line, args.rounds)
+    new = bench("snapshot", poll_snapshot, make_reactor(line, cache_ttl=0), line, args.rounds)
+    cached_reactor = make_reactor(line, cache_ttl=60)
+    cached = bench("snapshot + cache", poll_snapshot, cached_reactor, line, args.rounds)
+    print(f"speed-up: {old / new:.1f}x batched, {old / cached:.1f}x batched + cached")
+    print(f"settings cache: {cached_reactor.cache_stats()}")
+    if args.pty:
+        line.stop()
+
+
+if __name__ == "__main__":
+    main()
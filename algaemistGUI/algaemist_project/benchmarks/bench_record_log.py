@@ -0,0 +1,80 @@
+# benchmarks/bench_record_log.py
+#
+# Open a months-long run logged as fixed-width records: time to map the
+# file, to compute one channel's mean and the resident memory it costs,
+# compared with reading the same run from the DataLogger CSV.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_record_log --days 90 --interval 10
+
+import argparse
+import os
+import resource
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from reactor.record_log import RecordLog, load_records
+from reactor.utils import DataLogger
+
+
+SENSORS = {"temp": 20.5, "pH": 7.1, "light_prim": 120.0, "light_sec": 300.0, "air": 1.2, "co2": 0.1}
+PUMPS = {"heater_pump": 10.0, "cooler_pump": 0.0, "co2_pump": 5.0, "turb_pump": 0.0}
+
+
+def max_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=float, default=90)
+    parser.add_argument("--interval", type=float, default=10, help="seconds between samples")
+    args = parser.parse_args()
+
+    rows = int(args.days * 86400 / args.interval)
+    directory = tempfile.mkdtemp()
+    csv_path = os.path.join(directory, "run.csv")
+    rec_path = os.path.join(directory, "run.rec")
+
+    start = datetime(2025, 1, 1)
+    logger = DataLogger(csv_path, buffered=False)
+    log = RecordLog(rec_path, flush_rows=1000)
+    t = time.perf_counter()
+    for i in range(rows):
+        log.append(start + timedelta(seconds=i * args.interval), SENSORS, PUMPS)
+    append = time.perf_counter() - t
+    log.close()
+    # CSV of the same run, written in one go (writing it row by row would dominate the benchmark)
+    with open(csv_path, "a") as f:
+        line = ",".join(str(v) for v in [*SENSORS.values(), *PUMPS.values()])
+        for i in range(rows):
+            f.write(f"{(start + timedelta(seconds=i * args.interval)):%Y-%m-%d %H:%M:%S},{line},\n")
+    logger.close()
+
+    print(f"{rows} records   record log {os.path.getsize(rec_path) / 1e6:.1f} MB   "
+          f"csv {os.path.getsize(csv_path) / 1e6:.1f} MB   append {rows / append:,.0f} records/s")
+
+    rss = max_rss_mb()
+    t = time.perf_counter()
+    records, _ = load_records(rec_path)
+    opened = time.perf_counter() - t
+    mean = float(np.nanmean(records["temp"]))
+    first_channel = time.perf_counter() - t
+    print(f"record log  open {opened * 1e3:7.2f} ms   mean temp {first_channel * 1e3:7.1f} ms   "
+          f"peak memory +{max_rss_mb() - rss:.0f} MB")
+
+    rss = max_rss_mb()
+    t = time.perf_counter()
+    df = pd.read_csv(csv_path)
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    assert abs(df["temp"].mean() - mean) < 1e-3
+    print(f"csv         load {(time.perf_counter() - t) * 1e3:7.1f} ms   "
+          f"peak memory +{max_rss_mb() - rss:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
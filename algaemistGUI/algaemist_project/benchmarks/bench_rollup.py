@@ -0,0 +1,58 @@
+# benchmarks/bench_rollup.py
+#
+# Data preparation for plotting a multi-week run: all samples of the CSV
+# against `load_for_plot()` picking a rollup tier for ~2000 points. Also
+# reports what keeping the rollups costs per logged sample.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_rollup --days 21 --interval 5
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from reactor.rollup import Rollups, build, load_for_plot, load_log
+from reactor.log_loader import clear_cache
+from benchmarks.bench_column_store import timed
+from benchmarks.bench_record_log import SENSORS, PUMPS
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=float, default=21)
+    parser.add_argument("--interval", type=float, default=5, help="seconds between samples")
+    parser.add_argument("--points", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = int(args.days * 86400 / args.interval)
+    directory = tempfile.mkdtemp()
+    csv_path = os.path.join(directory, "run.csv")
+    start = datetime(2025, 1, 1)
+    line = ",".join(str(v) for v in [*SENSORS.values(), *PUMPS.values()])
+    with open(csv_path, "w") as f:
+        f.write("timestamp,temp,pH,light_prim,light_sec,air,co2,heater_pump,cooler_pump,co2_pump,turb_pump,comments\n")
+        for i in range(rows):
+            f.write(f"{(start + timedelta(seconds=i * args.interval)):%Y-%m-%d %H:%M:%S},{line},\n")
+    build(csv_path)
+
+    # Incremental cost while logging
+    rollups = Rollups(os.path.join(directory, "live.rollups"))
+    t = time.perf_counter()
+    for i in range(rows):
+        rollups.append(start + timedelta(seconds=i * args.interval), SENSORS, PUMPS)
+    per_sample = (time.perf_counter() - t) / rows
+    rollups.close()
+
+    clear_cache(csv_path)   # first plot of the run: the CSV still has to be parsed
+    t_raw, raw = timed(lambda: load_log(csv_path), repeat=1)
+    t_tier, tier = timed(lambda: load_for_plot(csv_path, points=args.points))
+    print(f"{rows} samples over {args.days:g} days, rollups cost {per_sample * 1e6:.1f} us per logged sample")
+    print(f"all samples        {t_raw * 1e3:8.1f} ms   {len(raw):>8} points")
+    print(f"{tier.attrs['tier']:>4} rollup tier     {t_tier * 1e3:8.1f} ms   {len(tier):>8} points   "
+          f"({len(raw) / len(tier):.0f}x fewer points to draw)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_sqlite_store.py
+#
+# Time to answer "what happened in this hour" for a long experiment: load
+# the whole DataLogger CSV with pandas and filter it, against an indexed
+# range query on the SQLite store. Also reports the append rate of the
+# store with batched inserts.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_sqlite_store --days 7
+
+import argparse
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from reactor.sqlite_store import SQLiteStore
+from benchmarks.bench_column_store import write_csv, timed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=float, default=2)
+    args = parser.parse_args()
+
+    rows = int(args.days * 86400)
+    directory = tempfile.mkdtemp()
+    csv_path = os.path.join(directory, "experiment.csv")
+    write_csv(csv_path, rows)
+
+    store = SQLiteStore(os.path.join(directory, "experiment.sqlite"), batch_rows=50)
+    start = time.perf_counter()
+    store.import_csv(csv_path)
+    insert = time.perf_counter() - start
+
+    t0 = datetime(2025, 1, 1) + timedelta(seconds=rows // 2)
+    t1 = t0 + timedelta(hours=1)
+
+    def csv_range():
+        df = pd.read_csv(csv_path)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        return df[(df["timestamp"] >= t0) & (df["timestamp"] < t1)][["timestamp", "temp", "pH"]]
+
+    t_csv, expected = timed(csv_range)
+    t_sql, result = timed(lambda: store.range(t0, t1, ["temp", "pH"]))
+    assert len(result) == len(expected) == 3600
+    store.close()
+
+    print(f"{rows} rows, appended at {rows / insert:,.0f} rows/s (batches of 50)")
+    print(f"one hour from csv     {t_csv * 1e3:8.1f} ms")
+    print(f"one hour from sqlite  {t_sql * 1e3:8.1f} ms   ({t_csv / t_sql:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+# benchmarks/bench_startup.py
+#
+# Start-up cost of the GUI, as a regression guard:
+#
+#   1. `python -X importtime -c "import algaemistGUI.gui"` (best of --repeat runs)
+#      against an import budget, the slowest packages, and a check that the
+#      lazily loaded modules (numpy, pandas, matplotlib, plotly, asyncio,
+#      sqlite3) are not imported with the GUI.
+#   2. `Reactor()` as the GUI creates it, plus one logged row, in an empty
+#      directory: no lazy module may be loaded and nothing but the CSV log
+#      may be created (the extra stores are opt-in).
+#   3. Time to first frame in a fresh interpreter: process start until the
+#      window is drawn, until the trend charts are in and until the
+#      (virtual, slow answering) reactor is connected in the background.
+#      Needs a display, skipped without one.
+#
+# Exits with status 1 if the budget is exceeded, a lazy module is loaded or
+# `Reactor()` creates more than its CSV log.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_startup --budget-ms 300
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+from reactor.virtual_device import VirtualDevice, VirtualReactor
+
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LAZY_MODULES = ["numpy", "pandas", "matplotlib", "plotly", "asyncio", "sqlite3"]
+
+REACTOR = r"""
+import os, sys
+sys.path.insert(0, sys.argv[1])
+from reactor.reactor import Reactor
+
+reactor = Reactor()
+reactor.data_logger.log_values({"temp": 20.0}, {"heater_pump": 0}, "bench")
+reactor.data_logger.close()
+loaded = [m for m in sys.argv[2:] if m in sys.modules]
+created = sorted(os.path.relpath(os.path.join(root, name))
+                 for root, dirs, files in os.walk(".") for name in dirs + files)
+print(" ".join(loaded) or "-", " ".join(created))
+"""
+
+FIRST_FRAME = r"""
+import sys, time
+start, project, port = float(sys.argv[1]), sys.argv[2], sys.argv[3]
+sys.path.insert(0, project)
+import algaemistGUI.gui as gui
+
+class BenchConfig(gui.ConfigManager):
+    def __init__(self):
+        super().__init__()
+        self.config.update(port=port, daemon_socket=None)
+
+gui.ConfigManager = BenchConfig
+try:
+    app = gui.AlgaemistGUI()
+except Exception as e:      # TclError without a display
+    print("skipped", e)
+    sys.exit(0)
+app.root.update()
+first = time.time() - start
+app.build_trend_charts()
+app.root.update()
+charts = time.time() - start
+while app.connection_frame.connecting and time.time() - start < 60:
+    app.root.update()
+    time.sleep(0.01)
+connected = time.time() - start
+app._closing.set()
+app.acquisition.stop()
+app.root.destroy()
+print(first, charts, connected)
+"""
+
+
+def import_times(repeat):
+    """Best cumulative import time of the GUI (ms) and the self time per top-level package of that run."""
+    best, packages = None, None
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import algaemistGUI.gui"],
+                                cwd=PROJECT_DIR, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip().splitlines()[-1])
+        per_package = defaultdict(float)
+        total = None
+        for line in result.stderr.splitlines():
+            if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+                continue
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            per_package[name.strip().split(".")[0]] += int(self_us) / 1e3
+            if name.strip() == "algaemistGUI.gui":
+                total = int(cumulative_us) / 1e3
+        if best is None or total < best:
+            best, packages = total, per_package
+    return best, packages
+
+
+def lazy_modules_loaded() -> list[str]:
+    code = f"import sys, algaemistGUI.gui; print(' '.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True)
+    return result.stdout.split()
+
+
+def reactor_start() -> tuple[list[str], list[str]]:
+    """(lazy modules loaded, files and directories created) by `Reactor()` and one logged row."""
+    with tempfile.TemporaryDirectory() as directory:
+        result = subprocess.run([sys.executable, "-c", REACTOR, PROJECT_DIR, *LAZY_MODULES],
+                                cwd=directory, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    loaded, created = result.stdout.strip().splitlines()[-1].split(" ", 1)
+    return [m for m in loaded.split() if m != "-"], created.split()
+
+
+def first_frame(latency):
+    """(first frame, charts, connected) in seconds after process start, None without a display."""
+    with VirtualDevice(VirtualReactor(addr=21), latency=latency) as device, \
+            tempfile.TemporaryDirectory() as directory:     # the GUI's data/ and .data/ logs go there
+        start = time.time()
+        result = subprocess.run([sys.executable, "-c", FIRST_FRAME, str(start), PROJECT_DIR, device.port],
+                                cwd=directory, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    output = result.stdout.strip().splitlines()[-1]
+    if output.startswith("skipped"):
+        print(f"Time to first frame: {output}")
+        return None
+    return [float(value) for value in output.split()]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--budget-ms", type=float, default=300, help="import budget of algaemistGUI.gui")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.5, help="virtual reactor answer delay (s)")
+    args = parser.parse_args()
+
+    total, packages = import_times(args.repeat)
+    print(f"import algaemistGUI.gui: {total:.1f} ms (budget {args.budget_ms:.0f} ms, best of {args.repeat})")
+    for name, ms in sorted(packages.items(), key=lambda item: -item[1])[:8]:
+        print(f"  {name:<24} {ms:>7.1f} ms")
+    loaded = lazy_modules_loaded()
+    print(f"lazy modules loaded by the import: {', '.join(loaded) or 'none'}")
+
+    reactor_loaded, created = reactor_start()
+    extra = [path for path in created if path != "data" and not path.endswith(".csv")]
+    print(f"Reactor() and one logged row: lazy modules loaded: {', '.join(reactor_loaded) or 'none'}, "
+          f"created: {', '.join(created)}")
+
+    times = first_frame(args.latency)
+    if times is not None:
+        first, charts, connected = times
+        print(f"first frame {1e3 * first:.0f} ms, trend charts {1e3 * charts:.0f} ms, "
+              f"reactor connected {1e3 * connected:.0f} ms after process start "
+              f"(reactor answers after {1e3 * args.latency:.0f} ms)")
+
+    if total > args.budget_ms or loaded or reactor_loaded or extra:
+        print("FAILED: start-up regression")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# benchmarks/bench_trend.py
+#
+# Cost of one trend chart refresh before drawing: taking a window of a full
+# TrendBuffer (72 h at 2 s) and min/max decimating it to the plot width,
+# for windows from 15 minutes to 72 hours. The number of points handed to
+# matplotlib stays at most 2 per pixel column, however long the window.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_trend --width 400
+
+import argparse
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from reactor.trend_buffer import TrendBuffer, minmax_decimate
+from benchmarks.bench_column_store import timed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=400, help="plot width in pixels")
+    parser.add_argument("--interval", type=float, default=2, help="seconds between samples")
+    args = parser.parse_args()
+
+    buffer = TrendBuffer()
+    rng = np.random.default_rng(0)
+    now = datetime.now()
+    start = time.perf_counter()
+    for i in range(buffer.capacity):
+        t = now - timedelta(seconds=args.interval * (buffer.capacity - i))
+        buffer.append(t, {"temp": 20 + np.sin(i / 5000) + rng.normal(0, 0.02), "pH": 7 + rng.normal(0, 0.01)})
+    fill = time.perf_counter() - start
+    print(f"{buffer.capacity} samples appended in {fill:.2f} s ({1e6 * fill / buffer.capacity:.1f} us per sample)")
+
+    end = now.timestamp()
+    print(f"{'window':>8} {'samples':>9} {'plotted':>8} {'window + decimate':>18}")
+    for hours in (0.25, 1, 6, 24, 72):
+        t0 = end - hours * 3600
+
+        def refresh():
+            times, values = buffer.window("temp", t0)
+            return len(times), minmax_decimate(times, values, args.width, t0, end)
+
+        seconds, (samples, (_, plotted)) = timed(refresh, repeat=20)
+        print(f"{hours:>7g}h {samples:>9} {len(plotted):>8} {1e3 * seconds:>15.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+# benchmarks/bench_web.py
+#
+# Load test of the web dashboard: a virtual reactor polled by an
+# AcquisitionService (sensors every 0.5 s) with 1 ... 200 concurrent
+# WebSocket viewers. Serial commands per second stay the same for any number
+# of viewers; shows the messages and bytes each viewer gets (deltas vs. the
+# full state) and how late they arrive.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_web --seconds 10
+
+import argparse
+import base64
+import json
+import os
+import socket
+import statistics
+import struct
+import threading
+import time
+from datetime import datetime
+
+from reactor.acquisition import AcquisitionService
+from reactor.reactor import Reactor
+from reactor.virtual_device import VirtualReactor, VirtualSerial
+from reactor.web import WebDashboard
+
+
+class Viewer(threading.Thread):
+    """Minimal WebSocket client that records size and lag of every message."""
+
+    def __init__(self, port):
+        super().__init__(daemon=True)
+        self.port = port
+        self.sizes = []
+        self.lags = []
+        self.full_size = 0
+        self.sock = socket.create_connection(("127.0.0.1", port))
+
+    def stop(self):
+        self.sock.shutdown(socket.SHUT_RDWR)
+
+    def run(self):
+        with self.sock as sock:
+            key = base64.b64encode(os.urandom(16)).decode()
+            sock.sendall((f"GET /ws HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                          f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n").encode())
+            reader = sock.makefile("rb")
+            assert reader.readline().split()[1] == b"101"
+            while reader.readline() not in (b"\r\n", b""):
+                pass
+            while True:
+                header = reader.read(2)
+                if len(header) < 2:
+                    return
+                length = header[1] & 0x7F
+                if length == 126:
+                    length = struct.unpack(">H", reader.read(2))[0]
+                elif length == 127:
+                    length = struct.unpack(">Q", reader.read(8))[0]
+                payload = reader.read(length)
+                message = json.loads(payload)
+                if "full" in message:
+                    self.full_size = length
+                    continue
+                self.sizes.append(length)
+                self.lags.append((datetime.now() - datetime.fromisoformat(message["t"])).total_seconds())
+
+
+def bench(viewers, seconds, latency):
+    reactor = Reactor(addr=21)
+    reactor.ser = VirtualSerial(VirtualReactor(addr=21), latency=latency)
+    reactor._connected = True
+    acquisition = AcquisitionService(reactor, intervals={"sensors": 0.5, "pumps": 1, "settings": 5})
+    dashboard = WebDashboard([reactor], host="127.0.0.1", port=0)
+    dashboard.start()
+    acquisition.start()
+    time.sleep(1)
+
+    clients = [Viewer(dashboard.port) for _ in range(viewers)]
+    for client in clients:
+        client.start()
+    time.sleep(0.5)
+    commands = reactor.ser.stats["commands"]
+    start = time.perf_counter()
+    time.sleep(seconds)
+    elapsed = time.perf_counter() - start
+    commands = reactor.ser.stats["commands"] - commands
+
+    stats = dashboard.stats()
+    for client in clients:
+        client.stop()
+    acquisition.stop()
+    dashboard.stop()
+    for client in clients:
+        client.join(timeout=2)
+
+    sizes = [s for c in clients for s in c.sizes]
+    lags = [lag for c in clients for lag in c.lags]
+    print(f"{viewers:>7} {commands / elapsed:>13.1f} {len(sizes) / viewers / elapsed:>13.2f} "
+          f"{statistics.mean(sizes):>11.0f} B {clients[0].full_size:>10} B "
+          f"{1e3 * statistics.median(lags):>10.2f} {1e3 * max(lags):>10.2f} {stats['dropped']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--latency", type=float, default=0.02, help="virtual serial answer delay (s)")
+    args = parser.parse_args()
+
+    print(f"{'viewers':>7} {'serial cmd/s':>13} {'msgs/s each':>13} {'delta size':>13} {'full state':>12} "
+          f"{'lag ms med':>10} {'lag ms max':>10} {'dropped':>8}")
+    for viewers in (1, 10, 50, 200):
+        bench(viewers, args.seconds, args.latency)
+
+
+if __name__ == "__main__":
+    main()
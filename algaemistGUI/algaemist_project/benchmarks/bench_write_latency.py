@@ -0,0 +1,102 @@
+# benchmarks/bench_write_latency.py
+#
+# End-to-end latency of an operator write (set_ph) while two threads keep
+# the port busy with snapshot polls (GUI + logger), once queued behind the
+# polls in FIFO order (like the old serial lock) and once through the
+# prioritised command queue. Also shows coalescing of a burst of writes.
+#
+# Run from algaemist_project/:
+#     python -m benchmarks.bench_write_latency
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+from reactor.command_queue import READ
+from reactor.protocol import SETTERS
+from reactor.reactor import Reactor
+from reactor.virtual_device import VirtualReactor, VirtualSerial
+
+
+def make_reactor(latency):
+    reactor = Reactor(addr=21, cache_ttl=0)   # no cache: every poll is a full batch
+    reactor.ser = VirtualSerial(VirtualReactor(addr=21), latency=latency)
+    reactor._connected = True
+    return reactor
+
+
+def write_fifo(reactor, value):
+    """A write queued like a read, i.e. behind every poll already waiting."""
+    resp = reactor.send(SETTERS["set_ph"].command(reactor.addr, value), priority=READ)
+    return SETTERS["set_ph"].accepted(resp)
+
+
+def write_priority(reactor, value):
+    return reactor.set_ph(value)
+
+
+def bench(name, write, latency, writes):
+    reactor = make_reactor(latency)
+    stop = threading.Event()
+
+    def poller():
+        while not stop.is_set():
+            reactor.read_snapshot()
+
+    pollers = [threading.Thread(target=poller, daemon=True) for _ in range(2)]
+    for t in pollers:
+        t.start()
+
+    rng = random.Random(1)
+    latencies = []
+    for _ in range(writes):
+        time.sleep(rng.uniform(0.05, 0.3))
+        start = time.perf_counter()
+        assert write(reactor, round(rng.uniform(6.0, 8.0), 1))
+        latencies.append(time.perf_counter() - start)
+
+    stop.set()
+    for t in pollers:
+        t.join()
+    latencies.sort()
+    print(f"{name:<10} mean {statistics.mean(latencies) * 1000:7.1f} ms   "
+          f"p95 {latencies[int(0.95 * (len(latencies) - 1))] * 1000:7.1f} ms   "
+          f"max {latencies[-1] * 1000:7.1f} ms")
+    return reactor
+
+
+def bench_coalescing(latency, burst):
+    reactor = make_reactor(latency)
+    poll = threading.Thread(target=reactor.read_snapshot)
+    poll.start()
+    time.sleep(latency)                         # the poll holds the port
+    futures = [reactor.submit("set_brightness", value) for value in range(burst)]
+    results = [f.result() for f in futures]
+    poll.join()
+    coalesced = reactor.command_stats()["coalesced"]
+    print(f"burst of {burst} set_brightness: all confirmed={all(results)}, "
+          f"sent {burst - coalesced}, coalesced {coalesced}, "
+          f"final brightness={reactor.get_brightness()}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.02, help="simulated device round trip in s")
+    parser.add_argument("--writes", type=int, default=20)
+    args = parser.parse_args()
+
+    # Reactor() creates a DataLogger CSV in the working directory
+    os.chdir(tempfile.mkdtemp())
+    print(f"Simulated round trip: {args.latency * 1000:.0f} ms, {args.writes} writes, 2 polling threads")
+    bench("fifo", write_fifo, args.latency, args.writes)
+    reactor = bench("priority", write_priority, args.latency, args.writes)
+    print(f"command queue: {reactor.command_stats()}")
+    bench_coalescing(args.latency, burst=20)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,13 @@
 # Generate a report on the algaemist system
 
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+import os
+import sys
 
-file = r'.\turb_test.csv'
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from reactor.rollup import load_for_plot
+
+file = r'.\turb_test.csv'   # CSV log, column store (.cols directory) or record log (.rec)
+points = 2000               # plot resolution, long runs use the coarsest rollup tier that still gives this many points
 columns = ['temp', 'pH',   'air', 'co2', 'turb_pump', 'light_prim', 'light_sec',]
 
 y_axis_ranges = {
@@ -27,39 +30,48 @@ y_axis_units = {
     "turb_pump": "Power in [%]"
 }
 
-data = pd.read_csv(file)
-
-data['timestamp'] = pd.to_datetime(data['timestamp'])
-
-# Get first and last timestamps
-first_ts = data['timestamp'].min().strftime("%Y-%m-%d %H:%M")
-last_ts = data['timestamp'].max().strftime("%Y-%m-%d %H:%M")
-
-fig, axes = plt.subplots(3,2, figsize=(12,15), sharex=True)
-
-# Rename the window
-fig.canvas.manager.set_window_title("System Report Algaemist")
-
-ax = axes.flatten()
-
-for i in range(6):
-    ax[i].plot(data['timestamp'], data[columns[i]], '.', label=columns[i])
-    ax[i].set_ylim(y_axis_ranges[columns[i]])
-    ax[i].set_ylabel(y_axis_units[columns[i]])
-    ax[i].grid()
-    if i == 5:
-        ax[i].plot(data['timestamp'], data[columns[i+1]], '.', label=columns[i+1])
-        ax[i].legend()
-        ax[i].set_xlabel('timestamp')
-    if i == 4:
-        ax[i].set_xlabel('timestamp')
-        
-    # Format X-axis: major ticks every 12 hours
-    ax[i].xaxis.set_major_locator(mdates.HourLocator(interval=12))
-    ax[i].xaxis.set_major_formatter(mdates.DateFormatter('%H:%M\n%Y-%m-%d'))
-    
-# Set overall title with first and last timestamp
-plt.suptitle(f"System report from {first_ts} to {last_ts}", size=18, weight='bold')
-
-# plt.tight_layout()
-plt.show()
+
+def plot_report(data):
+    """Plot the channels of a loaded log (matplotlib is imported here, not with the module)."""
+    import matplotlib.pyplot as plt
+    import matplotlib.dates as mdates
+
+    # Get first and last timestamps
+    first_ts = data['timestamp'].min().strftime("%Y-%m-%d %H:%M")
+    last_ts = data['timestamp'].max().strftime("%Y-%m-%d %H:%M")
+
+    fig, axes = plt.subplots(3,2, figsize=(12,15), sharex=True)
+
+    # Rename the window
+    fig.canvas.manager.set_window_title("System Report Algaemist")
+
+    ax = axes.flatten()
+
+    for i in range(6):
+        ax[i].plot(data['timestamp'], data[columns[i]], '.', label=columns[i])
+        if f"{columns[i]}_min" in data:
+            # Rollup tier: show the range of each bucket around its mean
+            ax[i].fill_between(data['timestamp'], data[f"{columns[i]}_min"], data[f"{columns[i]}_max"], alpha=0.3)
+        ax[i].set_ylim(y_axis_ranges[columns[i]])
+        ax[i].set_ylabel(y_axis_units[columns[i]])
+        ax[i].grid()
+        if i == 5:
+            ax[i].plot(data['timestamp'], data[columns[i+1]], '.', label=columns[i+1])
+            ax[i].legend()
+            ax[i].set_xlabel('timestamp')
+        if i == 4:
+            ax[i].set_xlabel('timestamp')
+
+        # Format X-axis: major ticks every 12 hours
+        ax[i].xaxis.set_major_locator(mdates.HourLocator(interval=12))
+        ax[i].xaxis.set_major_formatter(mdates.DateFormatter('%H:%M\n%Y-%m-%d'))
+
+    # Set overall title with first and last timestamp
+    plt.suptitle(f"System report from {first_ts} to {last_ts}", size=18, weight='bold')
+
+    # plt.tight_layout()
+    plt.show()
+
+
+if __name__ == "__main__":
+    plot_report(load_for_plot(file, points=points))
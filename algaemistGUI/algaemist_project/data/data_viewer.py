@@ -1,6 +1,8 @@
-import pandas as pd
-import plotly.express as px
 import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from reactor.rollup import load_for_plot
 
 
 # Define Y-axis ranges for each variable
@@ -27,13 +29,15 @@ y_axis_units = {
 
 def main():
     # Ask user for CSV path
-    csv_path = input("Enter path to CSV file: ").strip()
+    csv_path = input("Enter path to CSV file or .cols store: ").strip()
     if not os.path.exists(csv_path):
         print("File not found.")
         return
 
-    # Load CSV
-    df = pd.read_csv(csv_path)
+    # Load CSV (or column store), the coarsest rollup tier that still gives ~5000 points for long runs
+    df = load_for_plot(csv_path, points=5000)
+    if df.attrs["tier"]:
+        print(f"Showing {df.attrs['tier']} rollups (<column>_min / _max hold the range of each bucket)")
 
     # Ask user which columns to plot
     print("\nAvailable columns:", list(df.columns))
@@ -54,7 +58,8 @@ def main():
     if y_col in y_axis_units and y_axis_units[y_col]:
         y_label += f" [{y_axis_units[y_col]}]"
     
-    # Create scatter/point plot
+    # Create scatter/point plot (plotly is only imported once there is something to plot)
+    import plotly.express as px
     fig = px.scatter(df, x=x_col, y=y_col, hover_data=[hover_col] if hover_col else None,
                      title=f"{y_col} vs {x_col}", labels={y_col: y_label})
     
@@ -0,0 +1,81 @@
+# reactor/acquisition.py
+
+import logging
+from .protocol import CACHED_QUERIES
+from .scheduler import PollScheduler
+from .snapshot import ReactorSnapshot
+
+
+# Seconds between two reads of each channel
+DEFAULT_INTERVALS = {"sensors": 2, "pumps": 5, "settings": 60}
+
+
+class AcquisitionService:
+    """
+    Long-lived read cycle of one reactor.
+
+    The service polls the reactor on a `PollScheduler` (sensors, pumps and
+    settings at their own rates) and publishes every result on the reactor's
+    `SampleBus` (`reactor.samples`) as an immutable `ReactorSnapshot` that
+    merges the newest value of each channel:
+
+    * `latest()` returns the newest snapshot (latest-value slot)
+    * `reactor.samples.subscribe(...)` gives a consumer its own bounded queue
+      or callback; samples lost because it fell behind are counted in `stats()`
+
+        acquisition = AcquisitionService(reactor)
+        gui = reactor.samples.subscribe("gui")
+        acquisition.start()
+        ...
+        for snapshot in gui.drain():
+            print(snapshot.sensors)
+    """
+
+    def __init__(self, reactor, intervals: dict | None = None):
+        self.reactor = reactor
+        self.samples = reactor.samples
+        self.intervals = dict(DEFAULT_INTERVALS, **(intervals or {}))
+        self.scheduler = PollScheduler()
+        self._add_channels()
+
+    def _add_channels(self):
+        # Settings are only read on the slow channel; a setpoint changed through the
+        # reactor is published by the setter right away (Reactor._update_cache)
+        settings = [name for name in ReactorSnapshot.query_names() if name in CACHED_QUERIES]
+        # Snapshot values that are read every time, not served from the settings cache
+        states = [name for name in ReactorSnapshot.query_names()
+                  if name not in CACHED_QUERIES and name not in ("sensors", "pumps", "brightness")]
+        self.scheduler.add_channel("settings", self.intervals["settings"],
+                                   lambda: self._read(settings, use_cache=False))
+        self.scheduler.add_channel("sensors", self.intervals["sensors"],
+                                   lambda: self._read(["sensors"]))
+        self.scheduler.add_channel("pumps", self.intervals["pumps"],
+                                   lambda: self._read(["pumps", "brightness"] + states))
+
+    def start(self):
+        self.scheduler.start()
+
+    def stop(self):
+        self.scheduler.stop()
+
+    def _read(self, queries, use_cache=True):
+        if not self.reactor.connected:
+            return
+        values = self.reactor.query_many(queries, use_cache=use_cache)
+        # Keep the last good value of everything the reactor did not answer; its read time
+        # stays the old one, so sample(), the loggers and subscribers with max_age skip it
+        values = {name: value for name, value in values.items() if value is not None}
+        if not values:
+            logging.warning(f"No answer from reactor {self.reactor.addr} for {queries}")
+            return
+        self.samples.update(values)
+
+    def latest(self) -> ReactorSnapshot | None:
+        """The newest snapshot (fields are None until their channel was read once)."""
+        return self.samples.latest()
+
+    def stats(self) -> dict:
+        """Published samples, per subscriber delivered / dropped / queued, and the scheduler statistics."""
+        result = self.samples.stats()
+        result["channels"] = self.scheduler.stats()
+        return result
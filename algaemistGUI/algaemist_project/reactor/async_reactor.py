@@ -0,0 +1,167 @@
+# reactor/async_reactor.py
+
+import asyncio
+import logging
+from datetime import datetime
+from .connection import list_ports, open_async_connection
+from .protocol import QUERIES, SETTERS, GETTERS
+from .snapshot import ReactorSnapshot
+
+
+class AsyncReactor:
+    """
+    asyncio counterpart of `Reactor`.
+
+    Offers the same getters and setters as coroutines, e.g.
+    `await r.get_ph_setpoint()` or `await r.set_brightness(50)`.
+    Several AsyncReactors can be driven concurrently from one event loop
+    without a thread per device:
+
+        reactors = [AsyncReactor(addr=a) for a in (21, 22, 23)]
+        snapshots = await asyncio.gather(*(r.read_snapshot() for r in reactors))
+    """
+
+    def __init__(self, addr=1):
+        self.addr = addr
+        self.ser = None
+        self._connected = False
+        self._lock = asyncio.Lock()  # one command at a time per reactor
+        self.time = datetime.now()
+
+    @property
+    def connected(self):
+        """Return True if serial is connected."""
+        return self._connected
+
+    async def connect(self, port=None):
+        """Auto-detect FTDI port if not specified."""
+        if port is None:
+            port = list_ports(manufacturer="FTDI")
+            if not port:
+                raise ConnectionError("No FTDI device found")
+            port = port[0]
+
+        self.ser = open_async_connection(port)
+        self._connected = True
+        logging.info(f"Connected to {port}")
+        await self.set_time(self.time.hour, self.time.minute)
+        logging.info(f"Set reactor time to {self.time}")
+
+    def attach(self, transport):
+        """Use an already open `connection.AsyncSerial` (or compatible) transport."""
+        self.ser = transport
+        self._connected = True
+
+    async def disconnect(self):
+        if self.ser and self.ser.is_open:
+            self.ser.close()
+        self._connected = False
+        logging.info("Disconnected")
+
+    async def wait(self, interval: float):
+        await asyncio.sleep(interval)
+
+    async def send(self, cmd: str, read_response=True, timeout=1) -> str | None:
+        """Send a command and await the answer without blocking the event loop."""
+        if not self._connected or not self.ser:
+            logging.error("Send called while reactor not connected")
+            return None
+
+        async with self._lock:
+            try:
+                await self.ser.write(cmd.encode())
+                if read_response:
+                    resp = await self.ser.readline(timeout)
+                    return resp.decode(errors="ignore").strip()
+                return None
+            except Exception as e:
+                logging.error(f"Serial error sending command '{cmd}': {e}")
+                return None
+
+    async def query(self, name: str, timeout=1):
+        """Send the read command `name` from `protocol.QUERIES` and return the parsed value."""
+        query = QUERIES[name]
+        resp = await self.send(query.command(self.addr), timeout=timeout)
+        if resp:
+            try:
+                return query.parse_response(resp)
+            except Exception as e:
+                logging.error(f"Failed to parse {query.label}: {resp} -> {e}")
+        return None
+
+    async def apply(self, name: str, *args) -> bool:
+        """
+        Send the write command `name` from `protocol.SETTERS`.
+        Returns True if the reactor confirmed the command.
+        """
+        setter = SETTERS[name]
+        resp = await self.send(setter.command(self.addr, *args))
+        if setter.accepted(resp):
+            return True
+        logging.warning(f"Failed to {setter.action}: {resp}")
+        return False
+
+    async def query_many(self, queries: list[str], timeout=1) -> dict:
+        """Coroutine version of `Reactor.query_many`."""
+        results = {q: None for q in queries}
+        if not self._connected or not self.ser:
+            logging.error("Query called while reactor not connected")
+            return results
+
+        async with self._lock:
+            self.ser.reset_input_buffer()
+            for q in queries:
+                query = QUERIES.get(q)
+                cmd = q if query is None else query.command(self.addr)
+                try:
+                    await self.ser.write(cmd.encode())
+                    resp = (await self.ser.readline(timeout)).decode(errors="ignore").strip()
+                    if query is None:
+                        results[q] = resp or None
+                        continue
+                    if resp and not query.matches(self.addr, resp):
+                        # Out of step with the device, give it one more line
+                        logging.warning(f"Unexpected answer to '{cmd}': {resp}")
+                        resp = (await self.ser.readline(timeout)).decode(errors="ignore").strip()
+                    if not query.matches(self.addr, resp):
+                        logging.error(f"No valid response from reactor for {query.label}: {resp}")
+                        continue
+                    results[q] = query.parse_response(resp)
+                except Exception as e:
+                    logging.error(f"Failed to query {q} ('{cmd}'): {e}")
+        return results
+
+    async def read_snapshot(self, timeout=1) -> ReactorSnapshot:
+        values = await self.query_many(ReactorSnapshot.query_names(), timeout=timeout)
+        return ReactorSnapshot(timestamp=datetime.now(), **values)
+
+    async def change_address(self, new_addr: int) -> bool:
+        """Change the reactor device address."""
+        if await self.apply("change_address", new_addr):
+            self.addr = new_addr  # update internal address if successful
+            return True
+        return False
+
+
+def _make_getter(method, name):
+    async def getter(self):
+        return await self.query(name)
+    getter.__name__ = method
+    getter.__doc__ = f"Coroutine reading the {QUERIES[name].label}."
+    return getter
+
+
+def _make_setter(name):
+    async def setter(self, *args):
+        return await self.apply(name, *args)
+    setter.__name__ = name
+    setter.__doc__ = f"Coroutine to {SETTERS[name].action}."
+    return setter
+
+
+# Same getter / setter names as Reactor, generated from the protocol tables
+for _method, _query in GETTERS.items():
+    setattr(AsyncReactor, _method, _make_getter(_method, _query))
+for _method in SETTERS:
+    if not hasattr(AsyncReactor, _method):
+        setattr(AsyncReactor, _method, _make_setter(_method))
@@ -0,0 +1,203 @@
+# reactor/bus.py
+
+import threading
+import time
+import logging
+from collections import deque
+from concurrent.futures import Future
+from .connection import list_ports, open_connection
+from .reactor import Reactor
+
+
+class ReactorBus:
+    """
+    One serial port (RS-485 / FTDI line) shared by several reactors.
+
+    Every reactor on the line gets a `Reactor` handle from `bus.reactor(addr)`.
+    Commands of a handle are queued per address and a single bus thread
+    executes them in fair round-robin order, so a busy reactor cannot
+    starve the others. Each handle hands its commands over one at a time from
+    its own `CommandQueue`, so its writes still go ahead of its reads and
+    coalesce:
+
+        bus = ReactorBus()
+        bus.open()                      # auto-detect FTDI port
+        r21, r22 = bus.reactor(21), bus.reactor(22)
+        r21.read_snapshot(); r22.set_brightness(40)
+        print(bus.stats())
+    """
+
+    def __init__(self, port=None, baudrate=9600):
+        self.port = port
+        self.baudrate = baudrate
+        self.ser = None
+        self._connected = False
+        self._reactors = {}             # addr -> Reactor handle
+        self._queues = {}               # addr -> deque of (job, future, queued_at)
+        self._order = deque()           # round-robin order of addresses with pending jobs
+        self._cond = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._reset_stats()
+
+    @property
+    def connected(self):
+        """Return True if the shared port is open."""
+        return self._connected
+
+    def open(self, port=None):
+        """Open the shared port (auto-detect FTDI if not specified) and start the bus thread."""
+        port = port or self.port
+        if port is None:
+            port = list_ports(manufacturer="FTDI")
+            if not port:
+                raise ConnectionError("No FTDI device found")
+            port = port[0]
+
+        self.attach(open_connection(port, baudrate=self.baudrate))
+        logging.info(f"Reactor bus connected to {port}")
+
+    def attach(self, ser):
+        """Use an already open serial port (or compatible object) for the bus."""
+        self.ser = ser
+        self.port = getattr(ser, "port", self.port)
+        self._connected = True
+        for reactor in self._reactors.values():
+            reactor.ser = ser
+            reactor._connected = True
+        self._reset_stats()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ReactorBus", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """Stop the bus thread, fail queued commands and close the port."""
+        with self._cond:
+            self._connected = False     # refuse new commands from here on
+            self._stop_event.set()
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join()
+        with self._cond:
+            for queue in self._queues.values():
+                while queue:
+                    _, future, _ = queue.popleft()
+                    future.set_exception(ConnectionError("Reactor bus closed"))
+            self._order.clear()
+        for reactor in self._reactors.values():
+            reactor._connected = False
+        if self.ser and self.ser.is_open:
+            self.ser.close()
+        logging.info("Reactor bus disconnected")
+
+    def reactor(self, addr: int):
+        """Return the `Reactor` handle for device address `addr` on this bus."""
+        if addr not in self._reactors:
+            reactor = Reactor(addr=addr, bus=self)
+            reactor.ser = self.ser
+            reactor._connected = self._connected
+            self._reactors[addr] = reactor
+        return self._reactors[addr]
+
+    def readdress(self, old_addr: int, new_addr: int):
+        """The reactor at `old_addr` now answers to `new_addr` (see `Reactor.change_address`)."""
+        with self._cond:
+            reactor = self._reactors.pop(old_addr, None)
+            if reactor is None:
+                return
+            if new_addr in self._reactors:
+                logging.warning(f"Address {new_addr} was already in use on the bus, replacing its handle")
+            self._reactors[new_addr] = reactor
+
+    # --- Scheduling ---
+
+    def submit(self, addr: int, job) -> Future:
+        """
+        Queue `job(ser)` for address `addr`. The job runs on the bus thread
+        with exclusive access to the port, its return value resolves the future.
+        """
+        future = Future()
+        with self._cond:
+            if not self._connected:
+                future.set_exception(ConnectionError("Reactor bus not connected"))
+                return future
+            queue = self._queues.setdefault(addr, deque())
+            if not queue:
+                self._order.append(addr)
+            queue.append((job, future, time.monotonic()))
+            self._cond.notify()
+        return future
+
+    def _next_job(self):
+        """Pop the oldest job of the next address in round-robin order."""
+        with self._cond:
+            while not self._order and not self._stop_event.is_set():
+                self._cond.wait()
+            if self._stop_event.is_set():
+                return None
+            addr = self._order.popleft()
+            queue = self._queues[addr]
+            job = queue.popleft()
+            if queue:
+                self._order.append(addr)  # back of the line, the others go first
+            return addr, job
+
+    def _run(self):
+        """Bus thread: execute queued jobs one at a time."""
+        while True:
+            item = self._next_job()
+            if item is None:
+                return
+            addr, (job, future, queued_at) = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = time.monotonic()
+            try:
+                result = job(self.ser)
+            except Exception as e:
+                logging.error(f"Reactor bus job for address {addr} failed: {e}")
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+            self._record(addr, queued_at, started, time.monotonic())
+
+    # --- Statistics ---
+
+    def _reset_stats(self):
+        self._opened_at = time.monotonic()
+        self._busy = 0.0
+        self._per_addr = {}
+
+    def _record(self, addr, queued_at, started, finished):
+        with self._cond:
+            self._busy += finished - started
+            entry = self._per_addr.setdefault(addr, {"jobs": 0, "busy_s": 0.0, "wait_s": 0.0, "max_wait_s": 0.0})
+            entry["jobs"] += 1
+            entry["busy_s"] += finished - started
+            entry["wait_s"] += started - queued_at
+            entry["max_wait_s"] = max(entry["max_wait_s"], started - queued_at)
+
+    def stats(self) -> dict:
+        """
+        Bus utilisation since the port was opened.
+
+        utilisation: share of wall time the port was busy (0-1)
+        per_address: jobs, busy seconds, mean/max queue wait and current queue depth
+        """
+        with self._cond:
+            elapsed = max(time.monotonic() - self._opened_at, 1e-9)
+            per_address = {}
+            for addr, entry in self._per_addr.items():
+                per_address[addr] = {
+                    "jobs": entry["jobs"],
+                    "busy_s": round(entry["busy_s"], 3),
+                    "mean_wait_s": round(entry["wait_s"] / entry["jobs"], 4),
+                    "max_wait_s": round(entry["max_wait_s"], 4),
+                    "queued": len(self._queues.get(addr, ())),
+                }
+            return {
+                "elapsed_s": round(elapsed, 3),
+                "busy_s": round(self._busy, 3),
+                "utilisation": round(self._busy / elapsed, 3),
+                "per_address": per_address,
+            }
@@ -0,0 +1,65 @@
+# reactor/cache.py
+
+import threading
+import time
+
+
+class SettingsCache:
+    """
+    Thread-safe cache for reactor settings (setpoints, modes, ...).
+
+    Entries are written when a value is read from the reactor and updated
+    (or dropped) by the setters once the reactor confirmed a command.
+    `ttl` bounds how long a value may be served without asking the reactor
+    again, e.g. after a change on the device itself. ttl=0 disables the cache.
+    """
+
+    _MISSING = object()
+
+    def __init__(self, ttl: float = 60):
+        self.ttl = ttl
+        self._values = {}               # name -> (value, stored_at)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, name: str, default=None):
+        """Return the cached value of `name`, or `default` on a miss."""
+        with self._lock:
+            value, stored_at = self._values.get(name, (self._MISSING, 0.0))
+            if value is self._MISSING or time.monotonic() - stored_at > self.ttl:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def contains(self, name: str) -> bool:
+        """True if `name` has a fresh entry (does not count as hit or miss)."""
+        with self._lock:
+            entry = self._values.get(name)
+            return entry is not None and time.monotonic() - entry[1] <= self.ttl
+
+    def put(self, name: str, value):
+        if value is None or not self.ttl:
+            return
+        with self._lock:
+            self._values[name] = (value, time.monotonic())
+
+    def invalidate(self, name: str | None = None):
+        """Drop the entry `name`, or all entries if no name is given."""
+        with self._lock:
+            if name is None:
+                self._values.clear()
+            else:
+                self._values.pop(name, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 3) if total else 0.0,
+                "entries": len(self._values),
+                "ttl_s": self.ttl,
+            }
@@ -0,0 +1,223 @@
+# reactor/client.py
+
+import json
+import socket
+import threading
+import time
+import logging
+from concurrent.futures import Future
+from datetime import datetime
+
+from .daemon import DEFAULT_SOCKET, LOGGER_METHODS, encode, remote_method
+from .sample_bus import SampleBus
+from .snapshot import ReactorSnapshot
+
+
+class ReactorClient:
+    """
+    The `Reactor` API of a reactor run by a `ReactorDaemon` (reactor/daemon.py).
+
+    Getters, setters and the logging methods are forwarded to the daemon's
+    reactor and return what it returned (None / False if the daemon could
+    not be reached). `samples` is a local `SampleBus` that a background
+    thread fills with the snapshots the daemon publishes, so subscribers work
+    as with a local reactor and reading them costs no serial traffic:
+
+        algaemist = ReactorClient()         # instead of Reactor(addr=21)
+        algaemist.connect()
+        algaemist.set_temp_day(20.5)
+        print(algaemist.sample().sensors)
+        algaemist.data_logger.set_path("./experiment/run.csv")   # a path of the daemon
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET, timeout: float = 10.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.samples = SampleBus()
+        self.data_logger = _RemoteDataLogger(self)
+        self._lock = threading.Lock()       # one request at a time on the request connection
+        self._sock = None
+        self._reader = None
+        self._status = {}                   # updated by the daemon's stream
+        self._streaming = False
+        self._stream_sock = None
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def __getattr__(self, name):
+        if not remote_method(name):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        def call(*args):
+            return self._call("reactor", name, args)
+        call.__name__ = name
+        return call
+
+    # --- Connection ---
+
+    def connect(self, port=None):
+        """Attach to the daemon and follow its samples (it owns the serial port, `port` is ignored)."""
+        self._status = self.request({"op": "status"})
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._follow, name="ReactorClient", daemon=True)
+        self._thread.start()
+        logging.info(f"Attached to reactor daemon {self.socket_path} ({self._status})")
+
+    def disconnect(self):
+        self._stop_event.set()
+        for sock in (self._stream_sock, self._sock):
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+        with self._lock:
+            self._close()
+
+    @property
+    def connected(self) -> bool:
+        """True if the daemon is followed and its reactor connected (as last streamed, no request)."""
+        return self._streaming and bool(self._status.get("connected"))
+
+    @property
+    def addr(self) -> int | None:
+        return self._status.get("addr")
+
+    @property
+    def port(self) -> str | None:
+        return self._status.get("port")
+
+    # --- Requests ---
+
+    def request(self, message: dict):
+        """Send one request and return its result, ConnectionError / RuntimeError if it failed."""
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._open()
+                self._sock.sendall(encode(message))
+            except OSError:
+                # The daemon may have been restarted since the last request: one new connection
+                self._close()
+                try:
+                    self._open()
+                    self._sock.sendall(encode(message))
+                except OSError as e:
+                    self._close()
+                    raise ConnectionError(f"Reactor daemon at {self.socket_path} not reachable: {e}") from e
+            try:
+                line = self._reader.readline()
+            except OSError as e:
+                self._close()
+                raise ConnectionError(f"No answer from reactor daemon: {e}") from e
+            if not line:
+                self._close()
+                raise ConnectionError("Reactor daemon closed the connection")
+        reply = json.loads(line)
+        if "error" in reply:
+            raise RuntimeError(reply["error"])
+        return reply["result"]
+
+    def _open(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self.socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self._sock, self._reader = sock, sock.makefile("rb")
+
+    def _close(self):
+        if self._sock is not None:
+            self._reader.close()
+            self._sock.close()
+        self._sock = self._reader = None
+
+    def _call(self, target: str, method: str, args):
+        try:
+            return self.request({"op": "call", "target": target, "method": method, "args": list(args)})
+        except (ConnectionError, RuntimeError) as e:
+            logging.error(f"{method} through the reactor daemon failed: {e}")
+            return None
+
+    def submit(self, name: str, *args) -> Future:
+        """Like `Reactor.submit`, but the daemon has confirmed the command when the future is returned."""
+        future = Future()
+        future.set_result(bool(self._call("reactor", "apply", (name, *args))))
+        return future
+
+    def sample(self, max_age: float = 5.0) -> ReactorSnapshot:
+        """Like `Reactor.sample`: the followed sample if fresh enough, else the daemon reads the reactor."""
+        latest = self.samples.latest()
+        if latest is not None and latest.fresh(("sensors", "pumps"), max_age):
+            return latest
+        try:
+            return ReactorSnapshot.from_dict(self.request({"op": "sample", "max_age": max_age}))
+        except (ConnectionError, RuntimeError) as e:
+            logging.error(f"No sample from the reactor daemon: {e}")
+            return ReactorSnapshot(timestamp=datetime.now())
+
+    def history(self, since: datetime | None = None) -> list[tuple[datetime, dict]]:
+        """(timestamp, values) of the daemon's emergency log, oldest first."""
+        try:
+            rows = self.request({"op": "history", "since": since.isoformat() if since else None})
+        except (ConnectionError, RuntimeError) as e:
+            logging.error(f"No history from the reactor daemon: {e}")
+            return []
+        return [(datetime.fromisoformat(timestamp), values) for timestamp, values in rows]
+
+    def stats(self) -> dict:
+        """The daemon's statistics (clients, requests, acquisition, command queue)."""
+        return self.request({"op": "stats"})
+
+    def wait(self, interval: float):
+        time.sleep(interval)
+
+    # --- Samples ---
+
+    def _follow(self):
+        """Background thread: publish the daemon's snapshots on `self.samples`, keep its status, reconnect if it goes away."""
+        while not self._stop_event.is_set():
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                    sock.connect(self.socket_path)
+                    sock.sendall(encode({"op": "subscribe"}))
+                    self._stream_sock = sock
+                    if not self._streaming:
+                        logging.info(f"Following the samples of reactor daemon {self.socket_path}")
+                    self._streaming = True
+                    for line in sock.makefile("rb"):
+                        message = json.loads(line)
+                        if "status" in message:
+                            self._status = message["status"]
+                        else:
+                            self._publish(ReactorSnapshot.from_dict(message))
+            except OSError as e:
+                if self._streaming and not self._stop_event.is_set():
+                    logging.warning(f"Lost the reactor daemon {self.socket_path}: {e}")
+            self._streaming = False
+            self._stream_sock = None
+            self._stop_event.wait(2.0)
+
+    def _publish(self, snapshot: ReactorSnapshot):
+        values = {name: getattr(snapshot, name) for name in ReactorSnapshot.query_names()}
+        self.samples.update(values, snapshot.timestamp, read_at={name: snapshot.read_time(name) for name in values})
+
+
+class _RemoteDataLogger:
+    """The daemon's `reactor.data_logger` (methods in `daemon.LOGGER_METHODS`)."""
+
+    def __init__(self, client: ReactorClient):
+        self._client = client
+
+    def __getattr__(self, name):
+        if name not in LOGGER_METHODS:
+            raise AttributeError(f"'{name}' of the data logger cannot be called through the daemon")
+
+        def call(*args):
+            return self._client._call("data_logger", name, args)
+        call.__name__ = name
+        return call
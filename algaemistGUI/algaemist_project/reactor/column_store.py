@@ -0,0 +1,231 @@
+# reactor/column_store.py
+
+import argparse
+import csv
+import json
+import os
+import threading
+import logging
+from datetime import datetime, timedelta
+
+import numpy as np
+
+
+# Channels in the order of the DataLogger CSV
+CHANNELS = ("temp", "pH", "light_prim", "light_sec", "air", "co2",
+            "heater_pump", "cooler_pump", "co2_pump", "turb_pump")
+
+_EPOCH = datetime(1970, 1, 1)
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def to_epoch_ms(timestamp: datetime) -> int:
+    """Milliseconds since 1970-01-01 in local wall-clock time, like the CSV timestamps (no time zone shift)."""
+    return (timestamp - _EPOCH) // timedelta(milliseconds=1)
+
+
+def from_epoch_ms(ms: int) -> datetime:
+    return _EPOCH + timedelta(milliseconds=int(ms))
+
+
+class ColumnStore:
+    """
+    Appendable columnar store for logged reactor data.
+
+    A store is a directory with one raw little-endian file per column,
+    `timestamp.i8` (int64 epoch milliseconds) and `<channel>.f4` (float32,
+    NaN = missing), plus the sparse `comments.jsonl` (row index and text).
+    Rows are buffered and appended as chunks of `chunk_rows`, loading
+    memory-maps the columns instead of parsing text:
+
+        store = ColumnStore("data/experiment.cols")
+        store.append(datetime.now(), sensors, pumps, comment="Temp set to 20")
+        store.flush()
+
+        columns = load_columns("data/experiment.cols")    # dict of numpy arrays
+        df = load_dataframe("data/experiment.cols")       # pandas, datetime64 timestamps
+    """
+
+    def __init__(self, path: str, channels=CHANNELS, chunk_rows: int = 256):
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+        meta_path = os.path.join(self.path, "meta.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                self.channels = tuple(json.load(f)["channels"])
+        else:
+            self.channels = tuple(channels)
+            with open(meta_path, "w") as f:
+                json.dump({"version": 1, "channels": list(self.channels)}, f)
+
+        self.rows = _stored_rows(self.path, self.channels)
+        self._drop_torn_chunk()
+        self._timestamps = []
+        self._values = []
+        self._comments = []
+
+    def _drop_torn_chunk(self):
+        """Cut every column and the comments back to `rows` (crash mid-chunk) so appends stay aligned."""
+        for name, itemsize in [("timestamp.i8", 8)] + [(f"{c}.f4", 4) for c in self.channels]:
+            file = os.path.join(self.path, name)
+            if os.path.exists(file) and os.path.getsize(file) != self.rows * itemsize:
+                logging.warning(f"Truncating incomplete chunk at the end of {file}")
+                os.truncate(file, self.rows * itemsize)
+        comments_path = os.path.join(self.path, "comments.jsonl")
+        if not os.path.exists(comments_path):
+            return
+        with open(comments_path) as f:
+            lines = f.readlines()
+        kept = []
+        for line in lines:
+            try:
+                if json.loads(line)["row"] < self.rows:
+                    kept.append(line)
+            except (ValueError, KeyError):
+                pass                            # torn last line
+        if len(kept) != len(lines):
+            with open(comments_path, "w") as f:
+                f.writelines(kept)
+
+    def append(self, timestamp: datetime, sensors: dict, pumps: dict, comment: str | None = None):
+        """Buffer one row, the chunk is written once `chunk_rows` rows are buffered."""
+        values = {**(sensors or {}), **(pumps or {})}
+        row = [values.get(c) for c in self.channels]
+        with self._lock:
+            self._timestamps.append(to_epoch_ms(timestamp))
+            self._values.append([np.nan if v is None else v for v in row])
+            if comment:
+                self._comments.append({"row": self.rows + len(self._timestamps) - 1, "text": comment})
+            if len(self._timestamps) >= self.chunk_rows:
+                self._write_chunk()
+
+    def flush(self):
+        with self._lock:
+            self._write_chunk()
+
+    def close(self):
+        self.flush()
+
+    def _write_chunk(self):
+        """Append the buffered rows to the column files. Caller holds the lock."""
+        if not self._timestamps:
+            return
+        try:
+            values = np.asarray(self._values, dtype="<f4")
+            with open(os.path.join(self.path, "timestamp.i8"), "ab") as f:
+                np.asarray(self._timestamps, dtype="<i8").tofile(f)
+            for i, channel in enumerate(self.channels):
+                with open(os.path.join(self.path, f"{channel}.f4"), "ab") as f:
+                    values[:, i].tofile(f)
+            if self._comments:
+                with open(os.path.join(self.path, "comments.jsonl"), "a") as f:
+                    for comment in self._comments:
+                        f.write(json.dumps(comment) + "\n")
+            self.rows += len(self._timestamps)
+        except Exception as e:
+            logging.error(f"Failed to write chunk to {self.path}: {e}")
+        self._timestamps, self._values, self._comments = [], [], []
+
+
+def _stored_rows(path, channels) -> int:
+    """Number of complete rows (a crash mid-chunk may leave some columns longer)."""
+    sizes = []
+    for name, itemsize in [("timestamp.i8", 8)] + [(f"{c}.f4", 4) for c in channels]:
+        file = os.path.join(path, name)
+        sizes.append(os.path.getsize(file) // itemsize if os.path.exists(file) else 0)
+    return min(sizes)
+
+
+def load_columns(path: str, mmap: bool = True) -> dict:
+    """
+    Load a `ColumnStore` as a dict of numpy arrays ("timestamp" int64 epoch ms,
+    one float32 array per channel, "comments" dict row -> text). With `mmap`
+    the columns are memory-mapped read-only and only read when touched.
+    """
+    with open(os.path.join(path, "meta.json")) as f:
+        channels = json.load(f)["channels"]
+    rows = _stored_rows(path, channels)
+
+    def column(name, dtype):
+        file = os.path.join(path, name)
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        if mmap:
+            return np.memmap(file, dtype=dtype, mode="r", shape=(rows,))
+        return np.fromfile(file, dtype=dtype, count=rows)
+
+    columns = {"timestamp": column("timestamp.i8", "<i8")}
+    for channel in channels:
+        columns[channel] = column(f"{channel}.f4", "<f4")
+
+    comments = {}
+    comments_path = os.path.join(path, "comments.jsonl")
+    if os.path.exists(comments_path):
+        with open(comments_path) as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry["row"] < rows:
+                    comments[entry["row"]] = entry["text"]
+    columns["comments"] = comments
+    return columns
+
+
+def load_dataframe(path: str):
+    """Load a `ColumnStore` as a pandas DataFrame with the columns of the DataLogger CSV."""
+    import pandas as pd
+
+    columns = load_columns(path)
+    comments = columns.pop("comments")
+    df = pd.DataFrame({name: np.asarray(values) for name, values in columns.items()})
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
+    df["comments"] = pd.Series(comments, index=list(comments), dtype=object).reindex(df.index)
+    return df
+
+
+def export_csv(path: str, csv_path: str):
+    """Write a `ColumnStore` as a DataLogger compatible CSV file."""
+    columns = load_columns(path)
+    comments = columns.pop("comments")
+    timestamps = columns.pop("timestamp")
+    channels = list(columns)
+    with open(csv_path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["timestamp"] + channels + ["comments"])
+        for i, ms in enumerate(timestamps):
+            row = [from_epoch_ms(ms).strftime(TIME_FORMAT)]
+            row += ["" if np.isnan(columns[c][i]) else round(float(columns[c][i]), 4) for c in channels]
+            writer.writerow(row + [comments.get(i, "")])
+
+
+def import_csv(csv_path: str, path: str, chunk_rows: int = 4096) -> ColumnStore:
+    """Convert a DataLogger CSV (any subset of the channels) into a `ColumnStore`."""
+    store = ColumnStore(path, chunk_rows=chunk_rows)
+    with open(csv_path, newline="") as f:
+        for r in csv.DictReader(f):
+            try:
+                timestamp = datetime.strptime(r["timestamp"], TIME_FORMAT)
+            except (ValueError, KeyError, TypeError):
+                continue
+            values = {c: float(r[c]) for c in store.channels if r.get(c) not in (None, "")}
+            store.append(timestamp, values, {}, comment=r.get("comments") or None)
+    store.flush()
+    return store
+
+
+if __name__ == "__main__":
+    # python -m reactor.column_store data/main_exp.csv            -> data/main_exp.cols
+    # python -m reactor.column_store data/main_exp.cols --csv out.csv
+    parser = argparse.ArgumentParser(description="Convert between DataLogger CSV files and column stores")
+    parser.add_argument("source")
+    parser.add_argument("--csv", help="export the column store SOURCE to this CSV file")
+    args = parser.parse_args()
+    if args.csv:
+        export_csv(args.source, args.csv)
+        print(f"Exported {args.source} to {args.csv}")
+    else:
+        target = os.path.splitext(args.source)[0] + ".cols"
+        store = import_csv(args.source, target)
+        print(f"Imported {store.rows} rows into {target}")
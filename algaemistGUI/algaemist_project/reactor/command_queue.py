@@ -0,0 +1,167 @@
+# reactor/command_queue.py
+
+import heapq
+import itertools
+import threading
+import time
+import logging
+from collections import deque
+from concurrent.futures import Future
+
+
+# Priorities, lower runs first
+WRITE = 0   # operator commands (setpoints, modes, ...)
+READ = 1    # polling
+
+
+class CommandQueue:
+    """
+    Prioritised queue of serial jobs, executed one at a time by a worker thread.
+
+    Writes jump ahead of queued reads, jobs of equal priority run in the
+    order they were submitted. A job submitted with a `key` replaces a
+    still queued job with the same key, so only the last of several
+    writes to the same setpoint is sent and all callers get its result:
+
+        queue = CommandQueue()
+        future = queue.submit(lambda: reactor._transfer(...), WRITE, key="set_ph")
+        future.result()
+        print(queue.stats())
+
+    A long job (e.g. a batched poll) can call `run_urgent(READ)` between
+    its commands to let queued writes through right away.
+    """
+
+    def __init__(self, name="CommandQueue"):
+        self.name = name
+        self._heap = []                 # [priority, seq, job, future, queued_at, key]
+        self._seq = itertools.count()
+        self._keyed = {}                # coalescing key -> queued entry
+        self._cond = threading.Condition()
+        self._stop = False
+        self._thread: threading.Thread | None = None
+        self._worker_ident = None
+        # --- Statistics ---
+        self.coalesced = 0
+        self.preempted = 0              # jobs run in between the commands of a longer job
+        self._latency = {WRITE: deque(maxlen=1000), READ: deque(maxlen=1000)}
+        self._jobs = {WRITE: 0, READ: 0}
+
+    def in_worker(self) -> bool:
+        """True if called from the worker thread (i.e. from inside a job)."""
+        return threading.get_ident() == self._worker_ident
+
+    def submit(self, job, priority=READ, key=None) -> Future:
+        """Queue `job()` and return a future resolved with its return value."""
+        if self.in_worker():
+            # A job submitting another job would wait for itself, run it inline
+            future = Future()
+            self._execute([priority, 0, job, future, time.monotonic(), None])
+            return future
+
+        with self._cond:
+            if key is not None and key in self._keyed:
+                entry = self._keyed[key]
+                entry[2] = job          # keep the place in the queue, send the newest value
+                self.coalesced += 1
+                return entry[3]
+
+            entry = [priority, next(self._seq), job, Future(), time.monotonic(), key]
+            heapq.heappush(self._heap, entry)
+            if key is not None:
+                self._keyed[key] = entry
+            self._start()
+            self._cond.notify()
+            return entry[3]
+
+    def run_urgent(self, priority=READ):
+        """From inside a job: run queued jobs with a higher priority than `priority` now."""
+        if not self.in_worker():
+            return
+        while True:
+            with self._cond:
+                if not self._heap or self._heap[0][0] >= priority:
+                    return
+                entry = self._pop()
+            self.preempted += 1
+            self._execute(entry)
+
+    def close(self, reason="Command queue closed"):
+        """Stop the worker and fail all queued jobs. The next `submit` starts it again."""
+        with self._cond:
+            self._stop = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread and not self.in_worker():
+            thread.join()
+        with self._cond:
+            while self._heap:
+                entry = self._pop()
+                if entry[3].set_running_or_notify_cancel():
+                    entry[3].set_exception(ConnectionError(reason))
+            self._thread = None
+            self._worker_ident = None
+
+    # --- Worker ---
+
+    def _start(self):
+        """Start the worker if needed. Caller holds the condition."""
+        if self._thread and self._thread.is_alive() and not self._stop:
+            return
+        self._stop = False
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def _pop(self):
+        """Remove the next entry from the heap. Caller holds the condition."""
+        entry = heapq.heappop(self._heap)
+        if entry[5] is not None:
+            self._keyed.pop(entry[5], None)
+        return entry
+
+    def _run(self):
+        self._worker_ident = threading.get_ident()
+        while True:
+            with self._cond:
+                while not self._heap and not self._stop:
+                    self._cond.wait()
+                if self._stop:
+                    return
+                entry = self._pop()
+            self._execute(entry)
+
+    def _execute(self, entry):
+        priority, _, job, future, queued_at, _ = entry
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = job()
+        except Exception as e:
+            logging.error(f"{self.name} job failed: {e}")
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        with self._cond:
+            self._jobs[priority] = self._jobs.get(priority, 0) + 1
+            self._latency.setdefault(priority, deque(maxlen=1000)).append(time.monotonic() - queued_at)
+
+    # --- Statistics ---
+
+    def stats(self) -> dict:
+        """
+        End-to-end latency (submit -> done) of writes and reads over the last
+        1000 jobs each, plus coalesced writes, preemptions and queue depth.
+        """
+        with self._cond:
+            result = {"queued": len(self._heap), "coalesced": self.coalesced, "preempted": self.preempted}
+            for priority, label in ((WRITE, "write"), (READ, "read")):
+                latencies = sorted(self._latency.get(priority, ()))
+                entry = {"jobs": self._jobs.get(priority, 0)}
+                if latencies:
+                    entry.update({
+                        "mean_ms": round(1000 * sum(latencies) / len(latencies), 2),
+                        "p95_ms": round(1000 * latencies[int(0.95 * (len(latencies) - 1))], 2),
+                        "max_ms": round(1000 * latencies[-1], 2),
+                    })
+                result[label] = entry
+            return result
@@ -0,0 +1,155 @@
+# reactor/compression.py
+
+from datetime import datetime
+
+
+# Tolerance per channel, about the resolution of the sensors / pump settings
+DEFAULT_DEADBANDS = {
+    "temp": 0.05, "pH": 0.02, "light_prim": 2.0, "light_sec": 2.0, "air": 2.0, "co2": 0.2,
+    "heater_pump": 0.5, "cooler_pump": 0.5, "co2_pump": 0.5, "turb_pump": 0.5,
+}
+
+
+class CompressionFilter:
+    """
+    Decides which samples are worth a log row.
+
+    mode "deadband":      write a sample once a channel moved more than its
+                          deadband from the last written value. Reconstruct
+                          with `reconstruct(df, method="step")`.
+    mode "swinging_door": write the corner points of a piecewise linear
+                          approximation; every sample stays within its
+                          deadband of the line between the written rows.
+                          Reconstruct with `reconstruct(df, method="linear")`.
+
+    A sample is always written if it carries a comment, a channel appears or
+    disappears, or the last row is `heartbeat` seconds old. Channels without
+    a deadband must match exactly.
+
+        f = CompressionFilter("swinging_door", heartbeat=600)
+        for timestamp, values, comment in f.add(datetime.now(), {"temp": 20.5, ...}):
+            ...  # write the row
+    """
+
+    def __init__(self, mode: str = "deadband", deadbands: dict | None = None, heartbeat: float = 600):
+        if mode not in ("deadband", "swinging_door"):
+            raise ValueError(f"Unknown compression mode: {mode}")
+        self.mode = mode
+        self.deadbands = {**DEFAULT_DEADBANDS, **(deadbands or {})}
+        self.heartbeat = heartbeat
+        self._anchor = None         # (timestamp, values) of the last written row
+        self._held = None           # (timestamp, values) of the last sample, not written yet
+        self._doors = {}            # channel -> [lowest upper slope, highest lower slope]
+        self.seen = 0
+        self.written = 0
+
+    def add(self, timestamp: datetime, values: dict, comment: str | None = None) -> list[tuple]:
+        """Feed one sample, returns the rows (timestamp, values, comment) to write now, oldest first."""
+        self.seen += 1
+        values = dict(values)
+        if self._anchor is None:
+            return self._write([(timestamp, values, comment)])
+
+        t_anchor, anchor = self._anchor
+        changed = {c for c, v in values.items() if v is not None} != {c for c, v in anchor.items() if v is not None}
+        forced = comment is not None or changed or (timestamp - t_anchor).total_seconds() >= self.heartbeat
+
+        if self.mode == "deadband":
+            if forced or any(self._outside(c, v, anchor.get(c)) for c, v in values.items()):
+                return self._write([(timestamp, values, comment)])
+            return []
+
+        # Swinging door: does the line anchor -> this sample still cover every sample since the anchor?
+        if forced:
+            rows = []
+            if self._held is not None and (changed or not self._narrow_doors(timestamp, values)):
+                rows.append((*self._held, None))
+            rows.append((timestamp, values, comment))
+            return self._write(rows)
+        if self._narrow_doors(timestamp, values):
+            self._held = (timestamp, values)
+            return []
+        if self._held is None:
+            return self._write([(timestamp, values, comment)])
+        # A door closed: the held sample is the corner point, the doors restart from it
+        rows = self._write([(*self._held, None)])
+        if not self._narrow_doors(timestamp, values):
+            return rows + self._write([(timestamp, values, comment)])
+        self._held = (timestamp, values)
+        return rows
+
+    def flush(self) -> list[tuple]:
+        """The held sample (swinging door), so the end of the logged run is not lost."""
+        if self._held is None:
+            return []
+        rows = [(*self._held, None)]
+        self._held = None
+        return self._write(rows)
+
+    def reset(self):
+        """Start a new series (e.g. a new file), the next sample is written. Call `flush()` first."""
+        self._anchor, self._held, self._doors = None, None, {}
+
+    def _write(self, rows: list) -> list[tuple]:
+        timestamp, values, _ = rows[-1]
+        self._anchor, self._held, self._doors = (timestamp, values), None, {}
+        self.written += len(rows)
+        return rows
+
+    def _outside(self, channel, value, reference) -> bool:
+        if value is None or reference is None:
+            return value is not reference
+        return abs(value - reference) > self.deadbands.get(channel, 0.0)
+
+    def _narrow_doors(self, timestamp, values) -> bool:
+        """Narrow each channel's door by this sample. False if a door closed (sample not on a common line)."""
+        t_anchor, anchor = self._anchor
+        dt = (timestamp - t_anchor).total_seconds()
+        if dt <= 0:
+            return not any(self._outside(c, v, anchor.get(c)) for c, v in values.items())
+        doors = {}
+        for channel, value in values.items():
+            if value is None:
+                continue
+            # Half the deadband: the corner points are actual samples, not on the ideal line,
+            # which costs up to another door width between them
+            band = self.deadbands.get(channel, 0.0) / 2
+            upper = (value + band - anchor[channel]) / dt
+            lower = (value - band - anchor[channel]) / dt
+            door = self._doors.get(channel)
+            if door is not None:
+                upper, lower = min(upper, door[0]), max(lower, door[1])
+            if lower > upper:
+                return False
+            doors[channel] = [upper, lower]
+        self._doors = doors
+        return True
+
+    def stats(self) -> dict:
+        return {"mode": self.mode, "seen": self.seen, "written": self.written,
+                "ratio": round(self.seen / self.written, 1) if self.written else None}
+
+
+def reconstruct(df, timestamps=None, every: str | None = None, method: str = "step", channels=None):
+    """
+    Values of a compressed log at `timestamps` (or on a regular grid `every`, e.g. "10s").
+
+    method "step" holds each written value until the next row (deadband logs),
+    "linear" interpolates between the rows (swinging door logs).
+    `df` is a DataLogger DataFrame with a datetime64 "timestamp" column.
+    """
+    import pandas as pd
+
+    channels = list(channels or [c for c in df.columns if c in DEFAULT_DEADBANDS])
+    series = df.set_index("timestamp")[channels].astype(float)
+    series = series[~series.index.duplicated(keep="last")]
+    if timestamps is None:
+        timestamps = pd.date_range(series.index.min(), series.index.max(), freq=every or "1s")
+    timestamps = pd.DatetimeIndex(timestamps)
+    if method == "step":
+        result = series.reindex(series.index.union(timestamps)).ffill()
+    elif method == "linear":
+        result = series.reindex(series.index.union(timestamps)).interpolate(method="time", limit_area="inside")
+    else:
+        raise ValueError(f"Unknown reconstruction method: {method}")
+    return result.loc[timestamps].rename_axis("timestamp").reset_index()
@@ -1,9 +1,10 @@
 # reactor/connection.py
+import time
 import serial
-import serial.tools.list_ports
 
 def list_ports(manufacturer=None):
     """Return list of matching ports."""
+    import serial.tools.list_ports  # only needed to auto-detect the port
     ports = []
     for port in serial.tools.list_ports.comports():
         if manufacturer and manufacturer not in (port.manufacturer or ""):
@@ -20,4 +21,96 @@ def open_connection(port, baudrate=9600, timeout=1):
         parity=serial.PARITY_NONE,
         stopbits=serial.STOPBITS_ONE,
         timeout=timeout,
-    )
\ No newline at end of file
+    )
+
+
+class AsyncSerial:
+    """
+    Non-blocking asyncio wrapper around an open serial port.
+
+    The port is switched to non-blocking reads (timeout=0). On POSIX the
+    file descriptor is watched by the event loop, elsewhere (or for ports
+    without a file descriptor) the input buffer is polled every `poll_interval`
+    seconds. Either way no thread is blocked while waiting for the reactor.
+    """
+
+    def __init__(self, ser, poll_interval=0.005):
+        self.ser = ser
+        self.ser.timeout = 0
+        self.poll_interval = poll_interval
+        self._buffer = bytearray()
+
+    @property
+    def port(self):
+        return self.ser.port
+
+    @property
+    def is_open(self):
+        return self.ser.is_open
+
+    def close(self):
+        self.ser.close()
+
+    def reset_input_buffer(self):
+        self._buffer.clear()
+        self.ser.reset_input_buffer()
+
+    async def write(self, data: bytes):
+        self.ser.write(data)
+
+    def _read_available(self):
+        waiting = self.ser.in_waiting
+        if waiting:
+            self._buffer.extend(self.ser.read(waiting))
+
+    def _pop_line(self) -> bytes | None:
+        idx = self._buffer.find(b"\n")
+        if idx < 0:
+            return None
+        line = bytes(self._buffer[:idx + 1])
+        del self._buffer[:idx + 1]
+        return line
+
+    def _fileno(self):
+        try:
+            return self.ser.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+
+    async def readline(self, timeout=1) -> bytes:
+        """Return the next line, or whatever was received when `timeout` expires."""
+        import asyncio  # not loaded by the threaded Reactor
+        deadline = time.monotonic() + timeout
+        loop = asyncio.get_running_loop()
+        fd = self._fileno()
+        while True:
+            self._read_available()
+            line = self._pop_line()
+            if line is not None:
+                return line
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                partial = bytes(self._buffer)
+                self._buffer.clear()
+                return partial
+            if fd is None:
+                await asyncio.sleep(min(self.poll_interval, remaining))
+                continue
+            readable = loop.create_future()
+            try:
+                loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+            except NotImplementedError:
+                # e.g. the Windows proactor loop, fall back to polling
+                fd = None
+                continue
+            try:
+                await asyncio.wait_for(readable, remaining)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                loop.remove_reader(fd)
+
+
+def open_async_connection(port, baudrate=9600):
+    """Open a serial connection and wrap it for use with asyncio."""
+    return AsyncSerial(open_connection(port, baudrate=baudrate, timeout=0))
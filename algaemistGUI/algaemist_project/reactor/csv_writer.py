@@ -0,0 +1,189 @@
+# reactor/csv_writer.py
+
+import atexit
+import csv
+import os
+import queue
+import threading
+import time
+import logging
+from collections import deque
+
+
+class BufferedCSVWriter:
+    """
+    Appends CSV rows from any thread without blocking the caller.
+
+    Producers `write()` rows into a bounded queue. One writer thread keeps
+    the files open, writes the rows in batches and flushes (and optionally
+    fsyncs) once `flush_rows` rows are pending or the oldest pending row is
+    `flush_interval` seconds old. `close()` (also run at interpreter exit)
+    writes everything still queued.
+
+        writer = BufferedCSVWriter(flush_rows=50, flush_interval=5)
+        writer.write("data/log.csv", [timestamp, 20.5, 7.1])
+        print(writer.stats())
+    """
+
+    _FLUSH = object()   # queue marker: flush now and signal the event that follows
+    _CLOSE = object()   # queue marker: flush, close the file of the path that follows and signal the event
+
+    def __init__(self, flush_rows=50, flush_interval=5.0, fsync=True, maxsize=10000):
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._files = {}                # path -> (file, csv writer)
+        self._pending = []              # enqueue times of rows written but not yet flushed
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # --- Statistics ---
+        self.written = 0
+        self.dropped = 0
+        self.flushes = 0
+        self.max_depth = 0
+        self._latency = deque(maxlen=1000)     # enqueue -> flushed, per row
+        self._flush_time = deque(maxlen=1000)  # duration of flush + fsync
+
+    def write(self, path: str, row: list) -> bool:
+        """Queue `row` for `path`. Returns False if the queue is full and the row was dropped."""
+        self._start()
+        try:
+            self._queue.put_nowait((path, row, time.monotonic()))
+        except queue.Full:
+            self.dropped += 1
+            logging.error(f"CSV writer queue full, row for {path} dropped")
+            return False
+        self.max_depth = max(self.max_depth, self._queue.qsize())
+        return True
+
+    def flush(self, timeout=5.0) -> bool:
+        """Block until every row queued so far is written and flushed."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put((self._FLUSH, done, None))
+        return done.wait(timeout)
+
+    def close_path(self, path: str, timeout=5.0) -> bool:
+        """Block until the rows queued for `path` are flushed and its file is closed (e.g. the log moved on)."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put((self._CLOSE, done, path))
+        return done.wait(timeout)
+
+    def close(self):
+        """Write and flush all queued rows, close the files and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.put((None, None, None))
+            self._thread.join()
+        atexit.unregister(self.close)
+
+    # --- Writer thread ---
+
+    def _start(self):
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._closed = False
+            atexit.register(self.close)     # flush on interpreter exit
+            self._thread = threading.Thread(target=self._run, name="CSVWriter", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            timeout = None
+            if self._pending:
+                timeout = max(0.0, self._pending[0] + self.flush_interval - time.monotonic())
+            try:
+                path, row, queued_at = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                self._flush()           # oldest pending row is flush_interval old
+                continue
+
+            if path is None:            # close
+                self._flush()
+                self._close_files()
+                return
+            if path is self._FLUSH:
+                self._flush()
+                row.set()
+                continue
+            if path is self._CLOSE:
+                self._flush()
+                self._close_file(queued_at)
+                row.set()
+                continue
+
+            # Rows collect in the file buffers, the flush policy decides when they hit the disk
+            self._write_row(path, row, queued_at)
+            if len(self._pending) >= self.flush_rows:
+                self._flush()
+
+    def _write_row(self, path, row, queued_at):
+        try:
+            if path not in self._files:
+                dir_path = os.path.dirname(path)
+                if dir_path:
+                    os.makedirs(dir_path, exist_ok=True)
+                f = open(path, "a", newline="")
+                self._files[path] = (f, csv.writer(f))
+            self._files[path][1].writerow(row)
+            self._pending.append(queued_at)
+        except Exception as e:
+            logging.error(f"Failed to write row to {path}: {e}")
+
+    def _flush(self):
+        if not self._pending:
+            return
+        started = time.monotonic()
+        for path, (f, _) in list(self._files.items()):
+            try:
+                f.flush()
+                if self.fsync:
+                    os.fsync(f.fileno())
+            except Exception as e:
+                logging.error(f"Failed to flush {path}: {e}")
+        finished = time.monotonic()
+        with self._lock:
+            self.written += len(self._pending)
+            self.flushes += 1
+            self._latency.extend(finished - t for t in self._pending)
+            self._flush_time.append(finished - started)
+        self._pending = []
+
+    def _close_file(self, path):
+        if path not in self._files:
+            return
+        f, _ = self._files.pop(path)
+        try:
+            f.close()
+        except Exception as e:
+            logging.error(f"Failed to close {path}: {e}")
+
+    def _close_files(self):
+        for path in list(self._files):
+            self._close_file(path)
+
+    def stats(self) -> dict:
+        """Queue depth, rows written / dropped, flushes and row latency (queued -> on disk)."""
+        with self._lock:
+            latency = sorted(self._latency)
+            result = {
+                "queued": self._queue.qsize(),
+                "max_queued": self.max_depth,
+                "written": self.written,
+                "dropped": self.dropped,
+                "flushes": self.flushes,
+            }
+            if latency:
+                result["latency_mean_ms"] = round(1000 * sum(latency) / len(latency), 2)
+                result["latency_max_ms"] = round(1000 * latency[-1], 2)
+                result["flush_mean_ms"] = round(1000 * sum(self._flush_time) / len(self._flush_time), 2)
+            return result
@@ -0,0 +1,300 @@
+# reactor/daemon.py
+#
+# Headless acquisition: one process owns the reactor's serial port, polls it,
+# keeps the emergency log and serves samples and commands to any number of
+# clients (GUI, experiment scripts, notebooks) over a Unix socket:
+#
+#     python -m reactor.daemon --addr 21 --port /dev/ttyUSB0 [--http 8080]
+#     >>> Reactor daemon listening on /tmp/algaemist.sock
+#
+#     client = ReactorClient(); client.connect()      (see reactor/client.py)
+#
+# Protocol: one JSON object per line in both directions.
+#     {"op": "call", "method": "set_temp_day", "args": [20.5]}  -> {"result": true}
+#     {"op": "call", "target": "data_logger", "method": "set_path", "args": ["data/run.csv"]}
+#     {"op": "latest"} / {"op": "sample", "max_age": 5}         -> {"result": snapshot dict}
+#     {"op": "status"} / {"op": "stats"} / {"op": "history", "since": iso or null}
+#     {"op": "subscribe", "every": 0}  -> the connection streams every published snapshot,
+#                                          and {"status": {...}} when it changes or every 2 s
+# Failed requests are answered with {"error": "..."}.
+
+import argparse
+import json
+import os
+import queue
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+import logging
+from datetime import datetime
+
+from .reactor import Reactor
+from .acquisition import AcquisitionService
+
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), "algaemist.sock")
+
+# Reactor methods clients may call: the getters / setters and these
+REMOTE_PREFIXES = ("get_", "set_", "is_", "read_")
+REMOTE_METHODS = {
+    "apply", "query", "query_many", "log_current_values", "start_auto_logging", "stop_auto_logging",
+    "change_address", "switch_off_master_modes", "reset_communication", "cache_stats", "command_stats",
+}
+LOGGER_METHODS = {"set_path", "flush"}      # of reactor.data_logger
+
+
+def remote_method(name: str) -> bool:
+    """True if clients may call the Reactor method `name` through the daemon."""
+    return (name in REMOTE_METHODS or name.startswith(REMOTE_PREFIXES)) and callable(getattr(Reactor, name, None))
+
+
+def encode(message) -> bytes:
+    """One protocol line, datetimes as ISO strings."""
+    return (json.dumps(message, default=_to_json) + "\n").encode()
+
+
+def _to_json(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class ReactorDaemon:
+    """
+    Runs a connected `Reactor` without a GUI: an `AcquisitionService` polls
+    it, a sample bus subscriber writes the emergency log every `log_interval`
+    seconds, and clients attach over the Unix socket at `socket_path`.
+
+    Every client gets the same published snapshots, so any number of readers
+    cause no extra serial traffic. Commands of all clients go through the
+    reactor's command queue like those of threads in one process.
+    """
+
+    def __init__(self, reactor: Reactor, socket_path: str = DEFAULT_SOCKET, intervals: dict | None = None,
+                 emergency_log_path: str | None = None, log_interval: float = 600, stream_queue: int = 64):
+        self.reactor = reactor
+        self.socket_path = socket_path
+        self.acquisition = AcquisitionService(reactor, intervals=intervals)
+        self.emergency_log_path = emergency_log_path or os.path.join(os.getcwd(), ".data", "emergency_log.csv")
+        self.log_interval = log_interval
+        self.stream_queue = stream_queue    # snapshots queued per streaming client before dropping
+        self._server = None
+        self._stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._connections = set()   # sockets of the connected clients
+        self.clients = 0            # connections open now
+        self.requests = 0
+        self.dropped = 0            # snapshots not streamed because a client fell behind
+
+    # --- Lifecycle ---
+
+    def start(self):
+        os.makedirs(os.path.dirname(self.emergency_log_path), exist_ok=True)
+        if os.path.exists(self.socket_path):
+            if _listening(self.socket_path):
+                raise RuntimeError(f"Another reactor daemon is listening on {self.socket_path}")
+            os.remove(self.socket_path)     # left over from a daemon that was killed
+        self._server = _Server(self.socket_path, _Handler)
+        self._server.reactor_daemon = self
+
+        # Only log sensors and pumps that were read in the last two poll intervals
+        max_age = 2 * max(self.acquisition.intervals["sensors"], self.acquisition.intervals["pumps"])
+        self.reactor.samples.subscribe("emergency_log", callback=self._write_emergency_log,
+                                       every=self.log_interval, fields=("sensors", "pumps"), max_age=max_age)
+        self.acquisition.start()
+        threading.Thread(target=self._server.serve_forever, name="ReactorDaemon", daemon=True).start()
+        logging.info(f"Reactor daemon listening on {self.socket_path}")
+
+    def run(self):
+        """Serve (after `start()`) until SIGINT / SIGTERM or `stop()`, then stop."""
+        signal.signal(signal.SIGTERM, lambda *_: self._stop_event.set())
+        try:
+            while not self._stop_event.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            with self._lock:
+                connections = list(self._connections)
+            for connection in connections:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)     # clients notice and reconnect later
+                except OSError:
+                    pass
+            self._server = None
+            try:
+                os.remove(self.socket_path)
+            except FileNotFoundError:
+                pass
+        self.acquisition.stop()
+        self.reactor.data_logger.close()
+        logging.info(f"Reactor daemon stopped: {self.stats()}")
+
+    def _write_emergency_log(self, snapshot):
+        self.reactor.emergency_log(snapshot.sensors, snapshot.pumps, path=self.emergency_log_path,
+                                   timestamp=snapshot.read_time("sensors"))
+
+    # --- Requests ---
+
+    def handle(self, request: dict) -> dict:
+        """Answer one request (everything but "subscribe")."""
+        op = request.get("op")
+        with self._lock:
+            self.requests += 1
+        try:
+            if op == "call":
+                result = self._call(request.get("target", "reactor"), request.get("method", ""),
+                                    request.get("args", []))
+            elif op == "latest":
+                snapshot = self.reactor.samples.latest()
+                result = snapshot.to_dict() if snapshot is not None else None
+            elif op == "sample":
+                result = self.reactor.sample(request.get("max_age", 5.0)).to_dict()
+            elif op == "status":
+                result = self.status()
+            elif op == "history":
+                since = request.get("since")
+                since = datetime.fromisoformat(since) if since else None
+                result = self.reactor.data_logger.retention_rows(self.emergency_log_path, since)
+            elif op == "stats":
+                result = self.stats()
+            else:
+                return {"error": f"Unknown request: {op}"}
+        except Exception as e:
+            logging.error(f"Daemon request {request} failed: {e}")
+            return {"error": str(e)}
+        return {"result": result}
+
+    def _call(self, target: str, method: str, args: list):
+        if target == "reactor" and remote_method(method):
+            return getattr(self.reactor, method)(*args)
+        if target == "data_logger" and method in LOGGER_METHODS:
+            return getattr(self.reactor.data_logger, method)(*args)
+        raise ValueError(f"{target}.{method} cannot be called through the daemon")
+
+    def status(self) -> dict:
+        return {"connected": self.reactor.connected, "addr": self.reactor.addr, "port": self.reactor.port}
+
+    def stream(self, wfile, request: dict):
+        """Write every published snapshot and the reactor's status to a subscribed client until it disconnects."""
+        samples = queue.Queue(maxsize=self.stream_queue)
+
+        def enqueue(snapshot):
+            try:
+                samples.put_nowait(snapshot)
+            except queue.Full:
+                with self._lock:
+                    self.dropped += 1
+
+        subscription = self.reactor.samples.subscribe("client", callback=enqueue, every=request.get("every", 0.0))
+        status, status_time = None, 0.0
+        try:
+            latest = self.reactor.samples.latest()
+            if latest is not None:
+                wfile.write(encode(latest.to_dict()))   # the client has a value before the next poll
+            while not self._stop_event.is_set():
+                # The clients' `connected` is answered from this, without a request per check
+                if self.status() != status or time.monotonic() - status_time > 2.0:
+                    status, status_time = self.status(), time.monotonic()
+                    wfile.write(encode({"status": status}))
+                try:
+                    snapshot = samples.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+                wfile.write(encode(snapshot.to_dict()))
+        except OSError:
+            pass        # client went away
+        finally:
+            subscription.close()
+
+    def stats(self) -> dict:
+        return {
+            "clients": self.clients, "requests": self.requests, "dropped": self.dropped,
+            "acquisition": self.acquisition.stats(), "commands": self.reactor.command_stats(),
+        }
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    reactor_daemon: ReactorDaemon
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """One client connection, requests answered in order."""
+
+    def handle(self):
+        daemon = self.server.reactor_daemon
+        with daemon._lock:
+            daemon.clients += 1
+            daemon._connections.add(self.connection)
+        try:
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                except ValueError as e:
+                    self.wfile.write(encode({"error": f"Invalid request: {e}"}))
+                    continue
+                if request.get("op") == "subscribe":
+                    daemon.stream(self.wfile, request)
+                    return
+                self.wfile.write(encode(daemon.handle(request)))
+        except OSError:
+            pass
+        finally:
+            with daemon._lock:
+                daemon.clients -= 1
+                daemon._connections.discard(self.connection)
+
+
+def _listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(socket_path)
+            return True
+        except OSError:
+            return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a reactor headless and serve it to GUI / script clients")
+    parser.add_argument("--addr", type=int, default=21)
+    parser.add_argument("--port", default=None, help="serial port, default: auto-detect the FTDI device")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    parser.add_argument("--cache-ttl", type=float, default=60)
+    parser.add_argument("--emergency-log", default=None, help="default: .data/emergency_log.csv")
+    parser.add_argument("--log-interval", type=float, default=600, help="seconds between emergency log rows")
+    parser.add_argument("--http", type=int, default=None, metavar="PORT", help="also serve the web dashboard")
+    args = parser.parse_args()
+
+    from .logger import setup_logger
+    setup_logger()
+    reactor = Reactor(addr=args.addr, cache_ttl=args.cache_ttl)
+    reactor.connect(args.port)
+    daemon = ReactorDaemon(reactor, args.socket, emergency_log_path=args.emergency_log,
+                           log_interval=args.log_interval)
+    daemon.start()
+    print(f"Reactor daemon listening on {args.socket}")
+    dashboard = None
+    if args.http is not None:
+        from .web import WebDashboard
+        dashboard = WebDashboard([reactor], port=args.http)
+        dashboard.start()
+        print(f"Dashboard on http://{dashboard.host}:{dashboard.port}/")
+    daemon.run()
+    if dashboard is not None:
+        dashboard.stop()
+    reactor.disconnect()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# reactor/follower.py
+
+import io
+import os
+import logging
+
+from .log_loader import parse_csv, schema_from_header
+
+
+class LogFollower:
+    """
+    Incremental reader of a growing DataLogger CSV (like `tail -f`).
+
+    Remembers the byte offset and an incomplete last line, so every `read()`
+    only parses the rows appended since the previous call and returns them
+    as a chunk in the normalised frame of `log_loader.load()`:
+
+        follower = LogFollower("data/main_experiment.csv")
+        df = follower.read()             # everything so far
+        ...
+        new = follower.read()            # only the new rows (maybe empty)
+
+    If the file is replaced (rotation, a fresh copy over scp) or truncated,
+    the follower starts over from the beginning of the new file; `reset`
+    is True after such a `read()`.
+    """
+
+    FINGERPRINT = 256       # bytes at the start of the file that identify it
+
+    def __init__(self, path: str, from_start: bool = True):
+        self.path = path
+        self.from_start = from_start
+        self.offset = 0
+        self.rows = 0               # rows returned since the last (re)start
+        self.reset = False          # the last read() started over
+        self._partial = b""
+        self._names = None          # column names from the header line
+        self._schema = None
+        self._identity = None       # (device, inode) of the followed file
+        self._fingerprint = b""
+
+    def read(self):
+        """Rows appended since the last call (an empty frame if none)."""
+        self.reset = False
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return self._empty()
+
+        with open(self.path, "rb") as f:
+            if self._identity is not None and self._replaced(stat, f):
+                logging.info(f"{self.path} was replaced or truncated, following it from the start")
+                self._restart()
+                self.reset = True
+            if self._identity is None:
+                self._start(stat, f)
+            elif len(self._fingerprint) < self.FINGERPRINT:
+                self._fingerprint = f.read(self.FINGERPRINT)    # the file was shorter at the start
+            f.seek(self.offset)
+            data = f.read()
+        self.offset += len(data)
+
+        data = self._partial + data
+        end = data.rfind(b"\n") + 1     # only complete lines, keep the rest for next time
+        self._partial = data[end:]
+        lines = data[:end]
+        if self._names is None:
+            header_end = lines.find(b"\n") + 1
+            if header_end == 0:
+                return self._empty()
+            self._names = [c.strip() for c in lines[:header_end].decode().strip().split(",")]
+            self._schema = schema_from_header(self._names, self.path)
+            lines = lines[header_end:]
+        if not lines.strip():
+            return self._empty()
+
+        chunk = parse_csv(io.BytesIO(lines), self._schema, names=self._names, name=self.path)
+        self.rows += len(chunk)
+        return chunk
+
+    def _start(self, stat, f):
+        self._identity = (stat.st_dev, stat.st_ino)
+        self._fingerprint = f.read(self.FINGERPRINT)
+        if not self.from_start:
+            # Skip the existing rows, but still read the header
+            self._names = [c.strip() for c in self._fingerprint.split(b"\n", 1)[0].decode().strip().split(",")]
+            self._schema = schema_from_header(self._names, self.path)
+            self.offset = stat.st_size
+        f.seek(0)
+
+    def _replaced(self, stat, f) -> bool:
+        if (stat.st_dev, stat.st_ino) != self._identity or stat.st_size < self.offset:
+            return True
+        # Same inode and not shorter, but rewritten in place with different content?
+        head = f.read(len(self._fingerprint))
+        f.seek(0)
+        return head != self._fingerprint
+
+    def _restart(self):
+        self.offset, self.rows, self._partial = 0, 0, b""
+        self._names = self._schema = self._identity = None
+        self._fingerprint = b""
+        self.from_start = True      # a new file is read completely
+
+    def _empty(self):
+        schema = self._schema or schema_from_header(["timestamp"])
+        return parse_csv(io.BytesIO(b""), schema, names=self._names or ["timestamp"], name=self.path)
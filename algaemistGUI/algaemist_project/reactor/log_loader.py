@@ -0,0 +1,180 @@
+# reactor/log_loader.py
+
+import argparse
+import os
+import logging
+
+import numpy as np
+
+from .column_store import CHANNELS
+
+
+CACHE_DIR = ".cache"        # sidecar directory next to the logs
+CACHE_VERSION = 1           # bump when the normalised frame changes
+
+
+def detect_schema(path: str) -> dict:
+    """
+    Which of the DataLogger columns a CSV log has, from its header:
+    {"channels": [...], "missing": [...], "extra": [...], "comments": bool}
+    (weekend_longrun_1.csv has no pumps and no comments, turb_test.csv no comments).
+    """
+    with open(path, newline="") as f:
+        header = f.readline()
+    return schema_from_header(header, path)
+
+
+def schema_from_header(header: str | list, path: str = "log") -> dict:
+    """`detect_schema()` of a header line (or list of column names)."""
+    if isinstance(header, str):
+        header = header.strip().split(",")
+    header = [c.strip() for c in header]
+    if "timestamp" not in header:
+        raise ValueError(f"{path} has no timestamp column")
+    return {
+        "channels": [c for c in CHANNELS if c in header],
+        "missing": [c for c in CHANNELS if c not in header],
+        "extra": [c for c in header if c not in CHANNELS and c not in ("timestamp", "comments")],
+        "comments": "comments" in header,
+    }
+
+
+def load(path: str, cache: bool = True):
+    """
+    Any DataLogger CSV variant as one normalised DataFrame: datetime64 index
+    "timestamp", all channels as float32 (NaN where the log has none), extra
+    numeric columns as float32 and "comments" as categorical.
+
+    The parsed frame is cached in `.cache/<name>.npz` next to the log, keyed
+    by path, size and modification time, so the next load of an unchanged
+    log skips parsing.
+    """
+    key = _cache_key(path)
+    cache_path = _cache_path(path)
+    if cache:
+        df = _read_cache(cache_path, key)
+        if df is not None:
+            return df
+    df = parse_csv(path, detect_schema(path))
+    if cache:
+        _write_cache(cache_path, key, df)
+    return df
+
+
+def parse_csv(source, schema: dict, names: list[str] | None = None, name: str | None = None):
+    """
+    Parse CSV rows into the normalised frame of `load()` (without caching).
+    `source` is a path or a binary file object; pass the column `names` if
+    it has no header line (e.g. a chunk of a followed log).
+    """
+    import pandas as pd
+
+    name = name or (source if isinstance(source, str) else "log")
+    numeric = [*schema["channels"], *schema["extra"]]
+    header = {"names": names, "header": None} if names else {}
+    try:
+        raw = pd.read_csv(source, dtype={**{c: np.float32 for c in numeric}, "timestamp": str, "comments": object},
+                          **header)
+    except ValueError:
+        # Non-numeric junk in a channel: parse as text and drop what is not a number
+        if hasattr(source, "seek"):
+            source.seek(0)
+        raw = pd.read_csv(source, dtype=str, **header)
+        for c in numeric:
+            raw[c] = pd.to_numeric(raw[c], errors="coerce").astype(np.float32)
+
+    timestamps = pd.to_datetime(raw["timestamp"], format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    if timestamps.isna().all() and len(raw):
+        timestamps = pd.to_datetime(raw["timestamp"], format="ISO8601", errors="coerce")
+    valid = timestamps.notna().to_numpy()
+    if not valid.all():
+        logging.warning(f"Skipping {int((~valid).sum())} rows without a valid timestamp in {name}")
+
+    rows = int(valid.sum())
+    columns = {}
+    for c in [*CHANNELS, *schema["extra"]]:
+        columns[c] = raw[c].to_numpy(np.float32)[valid] if c in raw else np.full(rows, np.nan, dtype=np.float32)
+    comments = raw["comments"].to_numpy(object)[valid] if schema["comments"] else np.full(rows, None, dtype=object)
+    columns["comments"] = _categorical(comments, pd)
+    index = pd.DatetimeIndex(timestamps[valid], name="timestamp").astype("datetime64[ns]")
+    return pd.DataFrame(columns, index=index)
+
+
+def _categorical(values, pd):
+    """Comments as categorical with str categories, "" -> missing (identical for parsed and cached frames)."""
+    values = np.array([v if isinstance(v, str) and v else None for v in values], dtype=object)
+    categories = sorted({v for v in values if v is not None})
+    return pd.Categorical(values, categories=pd.Index(categories, dtype=object))
+
+
+# --- Sidecar cache ---
+
+def _cache_path(path: str) -> str:
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, CACHE_DIR, name + ".npz")
+
+
+def _cache_key(path: str) -> str:
+    stat = os.stat(path)
+    return f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}|{CACHE_VERSION}"
+
+
+def _read_cache(cache_path: str, key: str):
+    import pandas as pd
+
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with np.load(cache_path, allow_pickle=False) as data:
+            if str(data["key"]) != key:
+                return None
+            columns = {name: data[f"column_{i}"] for i, name in enumerate(data["columns"])}
+            categories = pd.Index(data["comment_categories"].tolist(), dtype=object)
+            columns["comments"] = pd.Categorical.from_codes(data["comment_codes"], categories=categories)
+            index = pd.DatetimeIndex(data["timestamp"].view("datetime64[ns]"), name="timestamp")
+        return pd.DataFrame(columns, index=index)
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable cache {cache_path}: {e}")
+        return None
+
+
+def _write_cache(cache_path: str, key: str, df):
+    names = [c for c in df.columns if c != "comments"]
+    comments = df["comments"].cat
+    categories = np.asarray(comments.categories, dtype=str) if len(comments.categories) else np.empty(0, dtype="<U1")
+    arrays = {
+        "key": np.array(key),
+        "timestamp": df.index.to_numpy("datetime64[ns]").view(np.int64),
+        "columns": np.array(names, dtype=str),
+        "comment_codes": comments.codes.to_numpy(np.int32),
+        "comment_categories": categories,
+    }
+    arrays.update({f"column_{i}": df[name].to_numpy(np.float32) for i, name in enumerate(names)})
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp = cache_path + ".tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp, cache_path)   # readers never see a half written cache
+    except OSError as e:
+        logging.warning(f"Could not write cache {cache_path}: {e}")
+
+
+def clear_cache(path: str):
+    """Remove the cached frame of a log."""
+    try:
+        os.remove(_cache_path(path))
+    except FileNotFoundError:
+        pass
+
+
+if __name__ == "__main__":
+    # python -m reactor.log_loader data/*.csv    -> schema and size of each log, fills the caches
+    parser = argparse.ArgumentParser(description="Show the schema of DataLogger CSV logs and cache them")
+    parser.add_argument("logs", nargs="+")
+    args = parser.parse_args()
+    for log in args.logs:
+        schema = detect_schema(log)
+        df = load(log)
+        print(f"{log}: {len(df)} rows, missing {schema['missing'] or '-'}, "
+              f"comments {'yes' if schema['comments'] else 'no'}")
@@ -0,0 +1,204 @@
+# reactor/offset_index.py
+
+import io
+import os
+import threading
+import logging
+from datetime import datetime
+
+import numpy as np
+
+from .column_store import TIME_FORMAT, to_epoch_ms
+from .log_loader import CACHE_DIR, parse_csv, schema_from_header
+
+
+MAGIC = b"ALGIDX01"
+
+
+class OffsetIndex:
+    """
+    Sparse time index of a DataLogger CSV: the timestamp and byte offset of
+    every `every`-th row, kept in `.cache/<name>.idx` next to the log.
+
+    `range(t0, t1)` binary-searches the index and parses only the byte
+    range that can hold rows between t0 and t1, instead of the whole file.
+    `update()` indexes the rows appended since the last call, which
+    `DataLogger` does as it logs (and `range()` before every query).
+    Assumes the rows are in time order, as the DataLogger writes them.
+
+        index = OffsetIndex("data/exp_data.csv")
+        df = index.range(datetime(2025, 11, 13), datetime(2025, 11, 14), columns=["temp"])
+    """
+
+    def __init__(self, path: str, every: int = 1000):
+        self.path = path
+        self.every = every
+        directory, name = os.path.split(os.path.abspath(path))
+        self.index_path = os.path.join(directory, CACHE_DIR, name + ".idx")
+        self._lock = threading.Lock()
+        self._pending = 0           # rows logged since the last update()
+        self._reset()
+        self._load()
+
+    def _reset(self):
+        self._times = []            # epoch ms of the indexed rows
+        self._offsets = []          # byte offset of the indexed rows
+        self._names = None          # column names from the header line
+        self._data_start = 0        # byte offset of the first row
+        self._scanned = 0           # bytes up to the end of the last complete line seen
+        self._since = 0             # rows scanned since the last indexed row
+
+    # --- DataLogger store interface ---
+
+    def append(self, timestamp: datetime, sensors: dict, pumps: dict, comment: str | None = None):
+        self._pending += 1
+        if self._pending >= self.every:
+            self.update()
+
+    def flush(self):
+        self.update()
+
+    def close(self):
+        self.update()
+
+    # --- Index ---
+
+    def _load(self):
+        """Read a saved index, dropped if the log no longer matches it."""
+        if not os.path.exists(self.index_path):
+            return
+        try:
+            with open(self.index_path, "rb") as f:
+                magic, every = f.read(8), int(np.frombuffer(f.read(8), dtype="<i8")[0])
+                entries = np.frombuffer(f.read(), dtype="<i8").reshape(-1, 2)
+            if magic != MAGIC or every != self.every or len(entries) == 0:
+                raise ValueError("different format")
+            if self._time_at(int(entries[-1, 1])) != int(entries[-1, 0]):
+                raise ValueError("log changed")
+        except (OSError, ValueError, IndexError) as e:
+            logging.info(f"Rebuilding offset index of {self.path}: {e}")
+            os.remove(self.index_path)
+            return
+        self._read_header()
+        # Continue scanning at the last indexed row, which is indexed (and saved) again
+        self._times = entries[:-1, 0].tolist()
+        self._offsets = entries[:-1, 1].tolist()
+        self._scanned = int(entries[-1, 1])
+        os.truncate(self.index_path, 16 * len(entries))     # 16 byte header + all but the last entry
+
+    def _time_at(self, offset: int) -> int | None:
+        """Epoch ms of the row starting at `offset`, None if there is none."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(offset)
+                return to_epoch_ms(datetime.strptime(f.read(19).decode(), TIME_FORMAT))
+        except (OSError, ValueError, UnicodeDecodeError):
+            return None
+
+    def _read_header(self):
+        with open(self.path, "rb") as f:
+            header = f.readline()
+        if header.endswith(b"\n"):
+            self._names = [c.strip() for c in header.decode().strip().split(",")]
+            self._data_start = len(header)
+
+    def update(self):
+        """Index the complete rows appended since the last update."""
+        with self._lock:
+            self._pending = 0
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                return
+            if size < self._scanned or (self._offsets and self._time_at(self._offsets[-1]) != self._times[-1]):
+                logging.info(f"{self.path} was truncated or replaced, rebuilding its offset index")
+                self._reset()
+                if os.path.exists(self.index_path):
+                    os.remove(self.index_path)
+            if self._names is None:
+                self._read_header()
+                if self._names is None:
+                    return
+                self._scanned = max(self._scanned, self._data_start)
+            if size == self._scanned:
+                return
+
+            with open(self.path, "rb") as f:
+                f.seek(self._scanned)
+                data = f.read(size - self._scanned)
+            # Start offsets of the complete lines, without a Python loop over the rows
+            newlines = np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 10)
+            if len(newlines) == 0:
+                return
+            starts = np.concatenate(([0], newlines[:-1] + 1))
+            picked = np.arange((-self._since) % self.every, len(starts), self.every)
+
+            new = []
+            for i in picked:
+                line = data[starts[i]:starts[i] + 19]
+                try:
+                    new.append((to_epoch_ms(datetime.strptime(line.decode(), TIME_FORMAT)),
+                                self._scanned + int(starts[i])))
+                except (ValueError, UnicodeDecodeError):
+                    continue  # not a valid row, the previous index entry covers it
+            self._since = (self._since + len(starts)) % self.every
+            self._scanned += int(newlines[-1]) + 1
+            if new:
+                self._times += [t for t, _ in new]
+                self._offsets += [o for _, o in new]
+                self._save(new)
+
+    def _save(self, new: list):
+        try:
+            os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+            fresh = not os.path.exists(self.index_path)
+            with open(self.index_path, "ab") as f:
+                if fresh:
+                    f.write(MAGIC + np.array([self.every], dtype="<i8").tobytes())
+                    new = list(zip(self._times, self._offsets))    # whole index
+                f.write(np.array(new, dtype="<i8").tobytes())
+        except OSError as e:
+            logging.warning(f"Could not save offset index {self.index_path}: {e}")
+
+    # --- Queries ---
+
+    def byte_range(self, t0: datetime | None, t1: datetime | None) -> tuple[int, int]:
+        """Bytes of the log that hold every row with t0 <= timestamp < t1."""
+        times = np.asarray(self._times, dtype=np.int64)
+        start, end = self._data_start, self._scanned
+        if t0 is not None and len(times):
+            # The block before the first indexed row >= t0 may still hold rows at t0
+            i = int(np.searchsorted(times, to_epoch_ms(t0), side="left")) - 1
+            if i >= 0:
+                start = self._offsets[i]
+        if t1 is not None and len(times):
+            j = int(np.searchsorted(times, to_epoch_ms(t1), side="left"))
+            if j < len(times):
+                end = self._offsets[j]
+        return start, max(start, end)
+
+    def range(self, t0: datetime | None = None, t1: datetime | None = None, columns=None):
+        """Rows with t0 <= timestamp < t1 (open ends if None) in the frame of `log_loader.load()`."""
+        self.update()
+        with self._lock:
+            if self._names is None:
+                raise ValueError(f"{self.path} has no header")
+            start, end = self.byte_range(t0, t1)
+            names = self._names
+        with open(self.path, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+        df = parse_csv(io.BytesIO(data), schema_from_header(names, self.path), names=names, name=self.path)
+        if t0 is not None:
+            df = df[df.index >= t0]
+        if t1 is not None:
+            df = df[df.index < t1]
+        return df[list(columns)] if columns else df
+
+    def stats(self) -> dict:
+        return {"entries": len(self._times), "every": self.every, "indexed_bytes": self._scanned}
+
+
+def read_range(path: str, t0: datetime | None = None, t1: datetime | None = None, columns=None, every: int = 1000):
+    """Rows of a CSV log between t0 and t1 via its offset index (built or extended as needed)."""
+    return OffsetIndex(path, every=every).range(t0, t1, columns)
@@ -0,0 +1,242 @@
+# reactor/protocol.py
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+# Field order of the aggregated x0000 / q0000 answers
+SENSOR_FIELDS = ("temp", "pH", "light_prim", "light_sec", "air", "co2")
+PUMP_FIELDS = ("co2_pump", "heater_pump", "cooler_pump", "turb_pump")
+
+
+def parse_sensors(payload: str) -> dict:
+    """Parse the payload of an x0000 answer into a sensor dict."""
+    parts = payload.split(";")
+    return {name: float(parts[i]) for i, name in enumerate(SENSOR_FIELDS)}
+
+
+def parse_pumps(payload: str) -> dict:
+    """Parse the payload of a q0000 answer into a pump dict."""
+    parts = payload.split(";")
+    return {name: float(parts[i]) for i, name in enumerate(PUMP_FIELDS)}
+
+
+def parse_flag(payload: str) -> bool:
+    return bool(int(payload))
+
+
+def parse_hhmm(payload: str) -> str:
+    return str(payload.zfill(4))
+
+
+@dataclass(frozen=True)
+class Query:
+    """
+    A read command of the reactor.
+
+    code:  command code sent after the address, e.g. "x0000"
+    sep:   character the value follows in the answer, e.g. "x"
+    parse: converts the text after `sep` into a Python value
+    label: human readable name used in log messages
+    """
+    code: str
+    sep: str
+    parse: Callable[[str], Any]
+    label: str
+
+    def command(self, addr: int) -> str:
+        return f"/{addr:02d}{self.code}"
+
+    def matches(self, addr: int, resp: str) -> bool:
+        """Return True if `resp` looks like the answer to this query."""
+        if not resp or self.sep not in resp:
+            return False
+        # Answers echo the address, a stale line from another device does not match
+        if resp.startswith("/") and not resp.startswith(f"/{addr:02d}"):
+            return False
+        return True
+
+    def parse_response(self, resp: str):
+        return self.parse(resp.split(self.sep)[-1])
+
+
+# All read commands, keyed by the name used in snapshots and batched queries
+QUERIES = {
+    # --- pH ---
+    "ph_setpoint": Query("p0000", "p", float, "pH setpoint"),
+    "ph_value": Query("p0001", "p", float, "pH value"),
+    "ph_co2_power": Query("p0002", "p", float, "pH CO2 power"),
+    "ph_control_on": Query("p0003", "p", parse_flag, "pH control state"),
+    "ph_base_power": Query("p0004", "p", float, "pH base power"),
+    "ph_correction": Query("p0005", "p", float, "pH correction"),
+    # --- Temperature ---
+    "temp_setpoint": Query("r0000", "r", float, "temperature setpoint"),
+    "temp_value": Query("r0001", "r", float, "temperature value"),
+    "heater_power": Query("r0002", "r", float, "heater power"),
+    "temp_control_on": Query("r0003", "r", parse_flag, "temperature control state"),
+    "cooler_power": Query("r0004", "r", float, "cooler power"),
+    # --- Turbidity / Light sensors ---
+    "sec_light_sensitivity": Query("s0000", "s", int, "secondary light sensitivity"),
+    "turb_setpoint": Query("u0000", "u", float, "turbidity setpoint"),
+    "sec_light_value": Query("u0001", "u", float, "secondary light value"),
+    "turb_pump_power": Query("u0002", "u", float, "turbidity pump power"),
+    "turb_control_on": Query("u0003", "u", parse_flag, "turbidity control state"),
+    "error": Query("e0000", "e", int, "error code"),
+    "system_info": Query("i0000", "i", str, "system info"),
+    "board_version": Query("i0001", "i", str, "board version"),
+    "airflow": Query("f0001", "f", float, "airflow"),
+    "co2_flow": Query("f0002", "f", float, "CO2 flow"),
+    # --- Light control ---
+    "brightness": Query("b0000", "b", float, "brightness"),
+    "primary_light": Query("l0000", "l", float, "primary light"),
+    "light_mode": Query("o0000", "o", int, "light mode"),
+    "light_on_time": Query("n0000", "n", parse_hhmm, "light on time"),
+    "light_off_time": Query("k0000", "k", parse_hhmm, "light off time"),
+    # --- Misc ---
+    "comm_version": Query("v0000", "v", str, "communication version"),
+    "reactor_mode": Query("m0000", "^", int, "reactor mode"),  # the reactor answers with a "^" as seperator for the value
+    # --- Aggregated sensor / pump readings ---
+    "sensors": Query("x0000", "x", parse_sensors, "aggregated sensor data"),
+    "pumps": Query("q0000", "q", parse_pumps, "aggregated pump data"),
+}
+
+
+# Settings that only change through a setter (or on the device panel).
+# Reactor serves them from its settings cache instead of re-reading them every poll.
+# The brightness is not cached, it follows the light curve in sinus mode. Neither are
+# the control states and the pH correction: no setter reports them, and mode switches
+# (e.g. switch_off_master_modes) change them on the device.
+CACHED_QUERIES = frozenset({
+    "temp_setpoint",
+    "ph_setpoint",
+    "light_mode", "light_on_time", "light_off_time",
+    "sec_light_sensitivity", "turb_setpoint", "reactor_mode",
+})
+
+
+def is_write(cmd: str) -> bool:
+    """Read commands use lower case codes (/21x0000), writes upper case or symbols (/21B0050, /00^0000)."""
+    return len(cmd) > 3 and not cmd[3].islower()
+
+
+# Reactor getter methods and the query they send
+GETTERS = {
+    "get_ph_setpoint": "ph_setpoint",
+    "get_ph_value": "ph_value",
+    "get_ph_co2_power": "ph_co2_power",
+    "get_ph_control_on": "ph_control_on",
+    "get_ph_base_power": "ph_base_power",
+    "get_ph_correction": "ph_correction",
+    "get_temp_setpoint": "temp_setpoint",
+    "get_temp_value": "temp_value",
+    "get_heater_power": "heater_power",
+    "is_temp_control_on": "temp_control_on",
+    "get_cooler_power": "cooler_power",
+    "get_sec_light_sensitivity": "sec_light_sensitivity",
+    "get_turb_setpoint": "turb_setpoint",
+    "get_sec_light_value": "sec_light_value",
+    "get_turb_pump_power": "turb_pump_power",
+    "is_turb_control_on": "turb_control_on",
+    "get_error": "error",
+    "get_system_info": "system_info",
+    "get_board_version": "board_version",
+    "get_airflow": "airflow",
+    "get_co2_flow": "co2_flow",
+    "get_brightness": "brightness",
+    "get_primary_light": "primary_light",
+    "get_light_mode": "light_mode",
+    "get_light_on_time": "light_on_time",
+    "get_light_off_time": "light_off_time",
+    "get_comm_version": "comm_version",
+    "get_reactor_mode": "reactor_mode",
+    "read_all_sensors": "sensors",
+    "read_all_pumps": "pumps",
+}
+
+
+def clamp(value, low, high):
+    return max(low, min(high, value))
+
+
+def ph_code(value: float) -> str:
+    """E.g. pH 7.5 -> P0075 (pHSP = value * 10, clamped to 2.0 - 12.0)."""
+    pH_val = round(clamp(value, 2.0, 12.0), 1)
+    return f"P{int(pH_val * 10):04d}"
+
+
+def temp_day_code(value: float) -> str:
+    """E.g. 10.5°C -> R0105 (SP1 = value * 10, clamped to 0.0 - 45.0)."""
+    temp_val = round(clamp(value, 0.0, 45.0), 1)
+    return f"R{int(temp_val * 10):04d}"
+
+
+def temp_night_code(value: float) -> str:
+    """E.g. 10.5°C -> R1105 (R1 is for night temp)."""
+    temp_val = round(clamp(value, 0.0, 45.0), 1)
+    return f"R1{int(temp_val * 10):03d}"
+
+
+@dataclass(frozen=True)
+class Setter:
+    """
+    A write command of the reactor.
+
+    build:  turns the setter arguments into the command code, e.g. 50 -> "B0050"
+    action: description used in log messages ("Failed to <action>")
+    ack:    ending of the answer that confirms the command
+    addr:   fixed address (broadcast commands), None to use the reactor address
+    cache:  cached queries the command changes ("*" = all of them)
+    value:  turns the setter arguments into the value the reactor will report
+            for `cache` afterwards. None drops the cache entries instead.
+    """
+    build: Callable[..., str]
+    action: str
+    ack: str = "OK"
+    addr: int | None = None
+    cache: tuple[str, ...] = ()
+    value: Callable[..., Any] | None = None
+
+    def command(self, addr: int, *args) -> str:
+        addr = addr if self.addr is None else self.addr
+        return f"/{addr:02d}{self.build(*args)}"
+
+    def accepted(self, resp: str | None) -> bool:
+        return bool(resp) and resp[-len(self.ack):] == self.ack
+
+
+# All write commands, keyed by the Reactor method name
+SETTERS = {
+    # --- Device / Time ---
+    "change_address": Setter(lambda new_addr: f"A{new_addr:04d}", "change address", cache=("*",)),
+    "set_time": Setter(lambda hh, mm: f"T{hh:02d}{mm:02d}", "set time"),
+    # --- Light ---
+    "set_brightness": Setter(lambda value: f"B{clamp(value, 0, 100):04d}", "set brightness"),
+    "set_light_on_time": Setter(lambda hh, mm: f"N{hh:02d}{mm:02d}", "set light ON time",
+                                cache=("light_on_time",), value=lambda hh, mm: f"{hh:02d}{mm:02d}"),
+    "set_light_off_time": Setter(lambda hh, mm: f"K{hh:02d}{mm:02d}", "set light OFF time",
+                                 cache=("light_off_time",), value=lambda hh, mm: f"{hh:02d}{mm:02d}"),
+    "set_light_mode": Setter(lambda mode: f"O{mode:04d}", "set light mode",
+                             cache=("light_mode",), value=int),
+    "set_light_range": Setter(lambda mode: f"L{mode:04d}", "set light range"),
+    "set_secondary_light_sensitivity": Setter(lambda mode: f"S{mode:04d}", "set secondary light sensitivity",
+                                              cache=("sec_light_sensitivity",), value=int),
+    # --- Temperature / pH ---
+    "set_ph": Setter(ph_code, "set pH",
+                     cache=("ph_setpoint",), value=lambda value: round(clamp(value, 2.0, 12.0), 1)),
+    "set_temp_day": Setter(temp_day_code, "set day temperature", ack="??",  # Reactor answers with ?? here, idk why...
+                           cache=("temp_setpoint",), value=lambda value: round(clamp(value, 0.0, 45.0), 1)),
+    "set_temp_night": Setter(temp_night_code, "set night temperature"),
+    # --- Turbidity / Chemostat ---
+    "set_turbidity": Setter(lambda value: f"U{clamp(value, 0, 850):04d}", "set turbidity",
+                            cache=("turb_setpoint",), value=lambda value: float(clamp(value, 0, 850))),
+    "set_chemostat": Setter(lambda value: f"C{clamp(value, 0, 100):04d}", "set chemostat"),
+    # --- External / Misc ---
+    "set_external_ph_pump": Setter(lambda value: f"E{value:04d}", "set external pH pump"),
+    "set_anti_foam_timer": Setter(lambda interval, runtime: f"F{interval:02d}{runtime:02d}", "set anti-foam timer"),
+    "switch_off_master_modes": Setter(lambda: "^0000", "switch off master modes", addr=0, cache=("reactor_mode",)),
+    "set_filter_cycles": Setter(lambda value: f"Q{value:04d}", "set filter cycles"),
+    "reset_communication": Setter(lambda: "!0000", "reset communication", cache=("*",)),
+    "set_audible_alarm": Setter(lambda value: f"@{value:04d}", "set audible alarm"),
+    "set_reactor_mode": Setter(lambda mode: f"M{mode:04d}", "set reactor mode",
+                               cache=("reactor_mode",), value=int),
+}
@@ -1,21 +1,39 @@
 # reactor/reactor.py
 
-import threading
 import time
 import logging
+from concurrent.futures import Future
+from dataclasses import replace
 from datetime import datetime
 from .connection import list_ports, open_connection
 from .utils import DataLogger
+from .protocol import QUERIES, SETTERS, CACHED_QUERIES, is_write
+from .cache import SettingsCache
+from .command_queue import CommandQueue, READ, WRITE
+from .sample_bus import SampleBus
+from .snapshot import ReactorSnapshot
 
 
+_MISS = object()  # settings cache miss marker (cached values may be False or 0)
+
 
 class Reactor:
-    def __init__(self, addr=1):
+    def __init__(self, addr=1, bus=None, cache_ttl=60):
+        """
+        addr:      device address of the reactor
+        bus:       optional `ReactorBus` sharing one serial port between several
+                   reactors. Use `bus.reactor(addr)` instead of passing it here.
+        cache_ttl: seconds a setting (setpoints, modes, ...) is served from the
+                   settings cache before it is read again, 0 disables the cache
+        """
         self.addr = addr
         self.ser = None
         self._connected = False
+        self._bus = bus
+        self.settings_cache = SettingsCache(ttl=cache_ttl)
+        self.samples = SampleBus()  # latest sample, shared by GUI, loggers and scripts
         self.data_logger = DataLogger()
-        self._serial_lock = threading.Lock()
+        self._commands = CommandQueue(name=f"Reactor{addr}")  # owns the port, writes before reads
         self.time = datetime.now()
 
 
@@ -23,10 +41,24 @@ class Reactor:
     def connected(self):
         """Return True if serial is connected."""
         return self._connected
+
+    @property
+    def port(self) -> str | None:
+        """Name of the serial port, None if not connected."""
+        return getattr(self.ser, "port", None)
         
         
     def connect(self, port=None):
-        """Auto-detect FTDI port if not specified."""
+        """Auto-detect FTDI port if not specified, then set the reactor's clock to now."""
+        self.time = datetime.now()  # connect may run long after __init__ (e.g. retried in the background)
+        if self._bus is not None:
+            # The bus owns the port, open it if no other reactor did yet
+            if not self._bus.connected:
+                self._bus.open(port)
+            self._connected = self._bus.connected  # again after disconnect(), the bus stayed open
+            self.set_time(self.time.hour, self.time.minute)
+            return
+
         if port is None:
             port = list_ports(manufacturer="FTDI")
             if not port:
@@ -40,56 +72,270 @@ class Reactor:
         logging.info(f"Set reactor time to {self.time}")
         
     def disconnect(self):
+        if self._bus is not None:
+            # Leave the shared port open for the other reactors on the bus
+            self._connected = False
+            logging.info(f"Reactor {self.addr} detached from bus")
+            return
+        self._connected = False
+        self._commands.close("Reactor disconnected")
+        self.data_logger.flush()
         if self.ser and self.ser.is_open:
             self.ser.close()
-        self._connected = False
         logging.info("Disconnected")
         
     def wait(self, interval: float):
         time.sleep(interval)
     
-    def send(self, cmd: str, read_response=True, timeout=1) -> str | None:
+    def send(self, cmd: str, read_response=True, timeout=1, priority=None) -> str | None:
         """
-        Thread-safe serial send. Locks serial access so only one thread
-        communicates with the reactor at a time.
+        Thread-safe serial send. The command is queued on the reactor's command
+        queue, which talks to the port from one thread. Writes (upper case
+        commands) go ahead of queued reads unless `priority` says otherwise.
         """
         if not self._connected or not self.ser:
             logging.error("Send called while reactor not connected")
             return None
 
-        with self._serial_lock:  # Only one thread can send info a time
-            try:
-                self.ser.write(cmd.encode())
-
-                if read_response:
-                    old_timeout = self.ser.timeout
-                    self.ser.timeout = timeout
-                    resp = self.ser.readline().decode(errors="ignore").strip()
-                    self.ser.timeout = old_timeout
-                    time.sleep(0.1)
-                    return resp
-                else:
-                    time.sleep(0.1)
-                    return None
+        if priority is None:
+            priority = WRITE if is_write(cmd) else READ
+        try:
+            return self._schedule(lambda ser: self._transfer(ser, cmd, read_response, timeout), priority).result()
+        except ConnectionError as e:
+            logging.error(f"Command '{cmd}' not sent: {e}")
+            return None
 
-            except Exception as e:
-                logging.error(f"Serial error sending command '{cmd}': {e}")
+    def _schedule(self, job, priority, key=None) -> Future:
+        """
+        Queue `job(ser)` on the command queue. On a `ReactorBus` the queue's worker
+        hands it on to the bus thread, so writes still go ahead of this reactor's
+        reads and coalesce; the bus only decides between the reactors.
+        """
+        if self._bus is None:
+            return self._commands.submit(lambda: job(self.ser), priority, key=key)
+        return self._commands.submit(lambda: self._bus.submit(self.addr, job).result(), priority, key=key)
+
+    def _transfer(self, ser, cmd, read_response, timeout):
+        """Write one command to `ser` and read the answer. Caller holds the port."""
+        try:
+            ser.write(cmd.encode())
+
+            if read_response:
+                old_timeout = ser.timeout
+                ser.timeout = timeout
+                resp = ser.readline().decode(errors="ignore").strip()
+                ser.timeout = old_timeout
+                time.sleep(0.1)
+                return resp
+            else:
                 time.sleep(0.1)
                 return None
 
+        except Exception as e:
+            logging.error(f"Serial error sending command '{cmd}': {e}")
+            time.sleep(0.1)
+            return None
+
+    def query(self, name: str, timeout=1, use_cache=True):
+        """
+        Send the read command `name` from `protocol.QUERIES` and return the parsed value.
+        Settings (`protocol.CACHED_QUERIES`) are answered from the settings cache if fresh.
+        """
+        if use_cache and name in CACHED_QUERIES:
+            cached = self.settings_cache.get(name, _MISS)
+            if cached is not _MISS:
+                return cached
+
+        query = QUERIES[name]
+        resp = self.send(query.command(self.addr), timeout=timeout)
+        if resp:
+            try:
+                value = query.parse_response(resp)
+                if name in CACHED_QUERIES:
+                    self.settings_cache.put(name, value)
+                return value
+            except Exception as e:
+                logging.error(f"Failed to parse {query.label}: {resp} -> {e}")
+        return None
+
+    def apply(self, name: str, *args) -> bool:
+        """
+        Send the write command `name` from `protocol.SETTERS`.
+        Returns True if the reactor confirmed the command.
+        """
+        try:
+            return self.submit(name, *args).result()
+        except ConnectionError as e:
+            logging.error(f"Failed to {SETTERS[name].action}: {e}")
+            return False
+
+    def submit(self, name: str, *args) -> Future:
+        """
+        Queue the write command `name` from `protocol.SETTERS` ahead of all
+        queued reads and return a future resolved with True / False (confirmed).
+
+        If the same setter is still queued, its value is replaced instead of
+        queueing a second command: only the last value is sent and every caller
+        gets its result.
+        """
+        if not self._connected or not self.ser:
+            logging.error("Send called while reactor not connected")
+            future = Future()
+            future.set_result(False)
+            return future
+
+        setter = SETTERS[name]
+        return self._schedule(lambda ser: self._write(ser, setter, args), WRITE, key=name)
+
+    def _write(self, ser, setter, args) -> bool:
+        """Body of `apply`. Caller holds the port."""
+        resp = self._transfer(ser, setter.command(self.addr, *args), True, 1)
+        accepted = setter.accepted(resp)
+        self._update_cache(setter, args, accepted)
+        if accepted:
+            return True
+        logging.warning(f"Failed to {setter.action}: {resp}")
+        return False
+
+    def _update_cache(self, setter, args, accepted):
+        """Write-through: store (and publish) what the reactor will report, drop what is unknown."""
+        confirmed = {}
+        for name in setter.cache:
+            if name == "*":
+                self.settings_cache.invalidate()
+            elif accepted and setter.value is not None:
+                confirmed[name] = setter.value(*args)
+                self.settings_cache.put(name, confirmed[name])
+            else:
+                # Unconfirmed (e.g. timed out) commands may still have been applied
+                self.settings_cache.invalidate(name)
+        if confirmed and self.samples.latest() is not None:
+            self.samples.update(confirmed)  # the GUI shows the new setpoint before the next settings poll
+
+    def cache_stats(self) -> dict:
+        """Hit / miss counters of the settings cache."""
+        return self.settings_cache.stats()
+
+    def command_stats(self) -> dict:
+        """Write / read latency (submit -> answer), coalesced writes and queue depth of the command queue."""
+        return self._commands.stats()
+
+    def query_many(self, queries: list[str], timeout=1, delay=0.0, use_cache=True) -> dict:
+        """
+        Send several read commands in one locked serial transaction.
+
+        `queries` are names from `protocol.QUERIES` (e.g. "sensors", "temp_setpoint")
+        or raw commands (e.g. "/21x0000"). Every answer is checked against the
+        command it belongs to, a stale line left over from an earlier timeout is
+        skipped instead of being attributed to the wrong value.
+
+        Returns a dict mapping every query to its parsed value (raw commands map
+        to the raw answer), or None if there was no valid answer.
+        Fresh settings are taken from the settings cache and not sent at all.
+        """
+        if not self._connected or not self.ser:
+            logging.error("Query called while reactor not connected")
+            return {q: None for q in queries}
+
+        results = {}
+        if use_cache:
+            for q in queries:
+                if q in CACHED_QUERIES:
+                    cached = self.settings_cache.get(q, _MISS)
+                    if cached is not _MISS:
+                        results[q] = cached
+        pending = [q for q in queries if q not in results]
+
+        if pending:
+            job = lambda ser: self._transfer_many(ser, pending, timeout, delay)
+            try:
+                fetched = self._schedule(job, READ).result()
+            except ConnectionError as e:
+                logging.error(f"Query not sent: {e}")
+                fetched = {q: None for q in pending}
+            for q, value in fetched.items():
+                if q in CACHED_QUERIES:
+                    self.settings_cache.put(q, value)
+            results.update(fetched)
+        return {q: results[q] for q in queries}
+
+    def _transfer_many(self, ser, queries, timeout, delay):
+        """Body of `query_many`. Caller holds the port."""
+        results = {q: None for q in queries}
+        old_timeout = ser.timeout
+        try:
+            ser.timeout = timeout
+            ser.reset_input_buffer()
+            for q in queries:
+                query = QUERIES.get(q)
+                cmd = q if query is None else query.command(self.addr)
+                try:
+                    ser.write(cmd.encode())
+                    resp = ser.readline().decode(errors="ignore").strip()
+                    if query is None:
+                        results[q] = resp or None
+                        continue
+                    if resp and not query.matches(self.addr, resp):
+                        # Out of step with the device, give it one more line
+                        logging.warning(f"Unexpected answer to '{cmd}': {resp}")
+                        resp = ser.readline().decode(errors="ignore").strip()
+                    if not query.matches(self.addr, resp):
+                        logging.error(f"No valid response from reactor for {query.label}: {resp}")
+                        continue
+                    results[q] = query.parse_response(resp)
+                except Exception as e:
+                    logging.error(f"Failed to query {q} ('{cmd}'): {e}")
+                if delay:
+                    time.sleep(delay)
+                # Let queued writes through between the commands of a long poll
+                # (no-op on a bus, where this runs on the bus thread: they follow the poll)
+                self._commands.run_urgent(READ)
+        finally:
+            ser.timeout = old_timeout
+        return results
+
+    def read_snapshot(self, timeout=1) -> ReactorSnapshot:
+        """
+        Read all values shown in the GUI (sensors, pumps and settings)
+        in one batched transaction and return them as a snapshot.
+        """
+        values = self.query_many(ReactorSnapshot.query_names(), timeout=timeout)
+        snapshot = ReactorSnapshot(timestamp=datetime.now(), **values)
+        self.samples.update({k: v for k, v in values.items() if v is not None}, snapshot.timestamp)
+        return snapshot
+
+    def sample(self, max_age: float = 5.0) -> ReactorSnapshot:
+        """
+        Latest sensor & pump sample from `self.samples`. The reactor is only read
+        (and the result published to all subscribers) if there is no sample
+        younger than `max_age` seconds, e.g. when no acquisition service runs.
+        Sensors / pumps are None if they could not be read.
+        """
+        latest = self.samples.latest()
+        if latest is not None and latest.fresh(("sensors", "pumps"), max_age):
+            return latest
+
+        values = self.query_many(["sensors", "pumps"])
+        values = {k: v for k, v in values.items() if v is not None}
+        if not values:
+            return ReactorSnapshot(timestamp=datetime.now())
+        snapshot = self.samples.update(values)
+        # The bus keeps the last good value of what did not answer, do not pass it on as current
+        return replace(snapshot, **{name: None for name in ("sensors", "pumps") if name not in values})
+
     # -- Data Logging ---
         
     def log_current_values(self, comment: str | None = None):
-        """Read current sensor & pump values and log them manually."""
+        """Log the current sensor & pump sample manually."""
         if self._connected:
-            sensors = self.read_all_sensors() or {}
-            pumps = self.read_all_pumps() or {}
-            self.data_logger.log_values(sensors, pumps, comment)
+            snapshot = self.sample()
+            self.data_logger.log_values(snapshot.sensors or {}, snapshot.pumps or {}, comment,
+                                        timestamp=snapshot.read_time("sensors"))
 
-    def emergency_log(self, sensors, pumps, path):
-        """Read current sensor & pump values and log them in the emergency log."""
+    def emergency_log(self, sensors, pumps, path, timestamp: datetime | None = None):
+        """Log sensor & pump values in the emergency log."""
         if self._connected:
-            self.data_logger.max_log_values(sensors, pumps, path=path)
+            self.data_logger.max_log_values(sensors, pumps, path=path, timestamp=timestamp)
 
     def start_auto_logging(self, interval=1800):
         """Start automatic logging in a background thread."""
@@ -101,316 +347,114 @@ class Reactor:
     
     # --- pH Methods ---
     def get_ph_setpoint(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}p0000")
-        if resp:
-            try:
-                return float(resp.split("p")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse pH setpoint: {resp} -> {e}")
-        return None
+        return self.query("ph_setpoint")
 
     def get_ph_value(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}p0001")
-        if resp:
-            try:
-                return float(resp.split("p")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse pH value: {resp} -> {e}")
-        return None
+        return self.query("ph_value")
 
     def get_ph_co2_power(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}p0002")
-        if resp:
-            try:
-                return float(resp.split("p")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse pH CO2 power: {resp} -> {e}")
-        return None
+        return self.query("ph_co2_power")
 
     def get_ph_control_on(self) -> bool | None:
-        resp = self.send(f"/{self.addr:02d}p0003")
-        if resp:
-            try:
-                return bool(int(resp.split("p")[-1]))
-            except Exception as e:
-                logging.error(f"Failed to parse pH control state: {resp} -> {e}")
-        return None
+        return self.query("ph_control_on")
 
     def get_ph_base_power(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}p0004")
-        if resp:
-            try:
-                return float(resp.split("p")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse pH base power: {resp} -> {e}")
-        return None
+        return self.query("ph_base_power")
 
     def get_ph_correction(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}p0005")
-        if resp:
-            try:
-                return float(resp.split("p")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse pH correction: {resp} -> {e}")
-        return None
+        return self.query("ph_correction")
     
     
     # --- Temperature ---
     def get_temp_setpoint(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}r0000")
-        if resp is None:
-            logging.error("No response from reactor for temperature setpoint")
-        try:
-            return float(resp.split("r")[-1])
-        except Exception as e:
-            logging.error(f"Failed to parse temperature setpoint: {resp} -> {e}")
-            return None
+        return self.query("temp_setpoint")
 
     def get_temp_value(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}r0001")
-        if resp:
-            try:
-                return float(resp.split("r")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse temperature value: {resp} -> {e}")
-        return None
+        return self.query("temp_value")
 
     def get_heater_power(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}r0002")
-        if resp:
-            try:
-                return float(resp.split("r")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse heater power: {resp} -> {e}")
-        return None
+        return self.query("heater_power")
 
     def is_temp_control_on(self) -> bool | None:
-        resp = self.send(f"/{self.addr:02d}r0003")
-        if resp:
-            try:
-                return bool(int(resp.split("r")[-1]))
-            except Exception as e:
-                logging.error(f"Failed to parse temperature control state: {resp} -> {e}")
-        return None
+        return self.query("temp_control_on")
 
     def get_cooler_power(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}r0004")
-        if resp:
-            try:
-                return float(resp.split("r")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse cooler power: {resp} -> {e}")
-        return None
+        return self.query("cooler_power")
     
 # --- Turbidity / Light sensors --- 
     def get_sec_light_sensitivity(self) -> int | None:
-        resp = self.send(f"/{self.addr:02d}s0000")
-        if resp:
-            try:
-                return int(resp.split("s")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse secondary light sensitivity: {resp} -> {e}")
-        return None
+        return self.query("sec_light_sensitivity")
 
     def get_turb_setpoint(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}u0000")
-        if resp:
-            try:
-                return float(resp.split("u")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse turbidity setpoint: {resp} -> {e}")
-        return None
+        return self.query("turb_setpoint")
 
     def get_sec_light_value(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}u0001")
-        if resp:
-            try:
-                return float(resp.split("u")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse secondary light value: {resp} -> {e}")
-        return None
+        return self.query("sec_light_value")
 
     def get_turb_pump_power(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}u0002")
-        if resp:
-            try:
-                return float(resp.split("u")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse turbidity pump power: {resp} -> {e}")
-        return None
+        return self.query("turb_pump_power")
 
     def is_turb_control_on(self) -> bool | None:
-        resp = self.send(f"/{self.addr:02d}u0003")
-        if resp:
-            try:
-                return bool(int(resp.split("u")[-1]))
-            except Exception as e:
-                logging.error(f"Failed to parse turbidity control state: {resp} -> {e}")
-        return None
+        return self.query("turb_control_on")
     
     def get_error(self) -> int | None:
-        resp = self.send(f"/{self.addr:02d}e0000")
-        if resp:
-            try:
-                return int(resp.split("e")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse error code: {resp} -> {e}")
-        return None
+        return self.query("error")
 
     def get_system_info(self) -> str | None:
-        resp = self.send(f"/{self.addr:02d}i0000")
-        if resp:
-            try:
-                # Combine all semicolon-separated values
-                return ";".join(resp.split("i")[-1].split(";"))
-            except Exception as e:
-                logging.error(f"Failed to parse system info: {resp} -> {e}")
-        return None
+        return self.query("system_info")
 
     def get_board_version(self) -> str | None:
-        resp = self.send(f"/{self.addr:02d}i0001")
-        if resp:
-            try:
-                return resp.split("i")[-1]
-            except Exception as e:
-                logging.error(f"Failed to parse board version: {resp} -> {e}")
-        return None
+        return self.query("board_version")
 
     def get_airflow(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}f0001")
-        if resp:
-            try:
-                return float(resp.split("f")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse airflow: {resp} -> {e}")
-        return None
+        return self.query("airflow")
 
     def get_co2_flow(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}f0002")
-        if resp:
-            try:
-                return float(resp.split("f")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse CO2 flow: {resp} -> {e}")
-        return None
+        return self.query("co2_flow")
 
         # --- Light control ---
     def get_brightness(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}b0000")
-        if resp:
-            try:
-                return float(resp.split("b")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse brightness: {resp} -> {e}")
-        return None
+        return self.query("brightness")
 
     def get_primary_light(self) -> float | None:
-        resp = self.send(f"/{self.addr:02d}l0000")
-        if resp:
-            try:
-                return float(resp.split("l")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse primary light: {resp} -> {e}")
-        return None
+        return self.query("primary_light")
 
     def get_light_mode(self) -> int | None:
-        resp = self.send(f"/{self.addr:02d}o0000")
-        if resp:
-            try:
-                return int(resp.split("o")[-1])
-            except Exception as e:
-                logging.error(f"Failed to parse light mode: {resp} -> {e}")
-        return None
+        return self.query("light_mode")
 
     def get_light_on_time(self) -> str | None:
-        resp = self.send(f"/{self.addr:02d}n0000")
-        if resp:
-            try:
-                return str(resp.split("n")[-1].zfill(4))
-            except Exception as e:
-                logging.error(f"Failed to parse light on time: {resp} -> {e}")
-        return None
+        return self.query("light_on_time")
 
     def get_light_off_time(self) -> str | None:
-        resp = self.send(f"/{self.addr:02d}k0000")
-        if resp:
-            try:
-                return str(resp.split("k")[-1].zfill(4))
-            except Exception as e:
-                logging.error(f"Failed to parse light off time: {resp} -> {e}")
-        return None
+        return self.query("light_off_time")
 
     # --- Misc ---
     def get_comm_version(self) -> str | None:
-        resp = self.send(f"/{self.addr:02d}v0000")
-        if resp:
-            try:
-                return resp.split("v")[-1]
-            except Exception as e:
-                logging.error(f"Failed to parse communication version: {resp} -> {e}")
-        return None
+        return self.query("comm_version")
 
     def get_reactor_mode(self) -> int | None:
-        resp = self.send(f"/{self.addr:02d}m0000")
-        if resp:
-            try:
-                return int(resp.split("^")[-1]) #the reactor answers with a "^" as seperator for the value
-            except Exception as e:
-                logging.error(f"Failed to parse reactor mode: {resp} -> {e}")
-        return None
+        return self.query("reactor_mode")
 
     # --- Aggregated sensor / pump readings ---
     def read_all_sensors(self) -> dict | None:
-        resp = self.send(f"/{self.addr:02d}x0000")
-        if resp:
-            try:
-                parts = resp.split("x")[-1].split(";")
-                return {
-                    "temp": float(parts[0]),
-                    "pH": float(parts[1]),
-                    "light_prim": float(parts[2]),
-                    "light_sec": float(parts[3]),
-                    "air": float(parts[4]),
-                    "co2": float(parts[5]),
-                }
-            except Exception as e:
-                logging.error(f"Failed to parse aggregated sensor data: {resp} -> {e}")
-        return None
+        return self.query("sensors")
 
     def read_all_pumps(self) -> dict | None:
-        resp = self.send(f"/{self.addr:02d}q0000")
-        if resp:
-            try:
-                parts = resp.split("q")[-1].split(";")
-                return {
-                    "co2_pump": float(parts[0]),
-                    "heater_pump": float(parts[1]),
-                    "cooler_pump": float(parts[2]),
-                    "turb_pump": float(parts[3]),
-                }
-            except Exception as e:
-                logging.error(f"Failed to parse aggregated pump data: {resp} -> {e}")
-        return None
+        return self.query("pumps")
     
     # --- Device / Time ---
     def change_address(self, new_addr: int) -> bool:
         """Change the reactor device address."""
-        cmd = f"/{self.addr:02d}A{new_addr:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            self.addr = new_addr  # update internal address if successful
+        if self.apply("change_address", new_addr):
+            old_addr, self.addr = self.addr, new_addr  # update internal address if successful
+            if self._bus is not None:
+                self._bus.readdress(old_addr, new_addr)
             return True
-        logging.warning(f"Failed to change address: {resp}")
         return False
 
     def set_time(self, hh: int, mm: int) -> bool:
         """Set reactor device time (hours and minutes)."""
-        cmd = f"/{self.addr:02d}T{hh:02d}{mm:02d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set time: {resp}")
-        return False
+        return self.apply("set_time", hh, mm)
     
     
     # --- Light ---
@@ -421,58 +465,27 @@ class Reactor:
         command for reactor.
         E.g. 50 -> B0050 for 50% brightness
         """
-        cmd_value = max(0, min(100, value))
-        cmd = f"/{self.addr:02d}B{cmd_value:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set brightness: {resp}")
-        return False
+        return self.apply("set_brightness", value)
 
     def set_light_on_time(self, hh: int, mm: int) -> bool:
         """Set light ON time (HHMM)."""
-        cmd = f"/{self.addr:02d}N{hh:02d}{mm:02d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set light ON time: {resp}")
-        return False
+        return self.apply("set_light_on_time", hh, mm)
 
     def set_light_off_time(self, hh: int, mm: int) -> bool:
         """Set light OFF time (HHMM)."""
-        cmd = f"/{self.addr:02d}K{hh:02d}{mm:02d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set light OFF time: {resp}")
-        return False
+        return self.apply("set_light_off_time", hh, mm)
 
     def set_light_mode(self, mode: int) -> bool:
         """Set light control mode: 1=Continuous, 2=Timed, 3=Sinus."""
-        cmd = f"/{self.addr:02d}O{mode:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set light mode: {resp}")
-        return False
+        return self.apply("set_light_mode", mode)
 
     def set_light_range(self, mode: int) -> bool:
         """Set light range mode: 0=High, 1=Low."""
-        cmd = f"/{self.addr:02d}L{mode:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set light range: {resp}")
-        return False
+        return self.apply("set_light_range", mode)
 
     def set_secondary_light_sensitivity(self, mode: int) -> bool:
         """Set secondary light sensor sensitivity: 0=Low, 1=High."""
-        cmd = f"/{self.addr:02d}S{mode:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set secondary light sensitivity: {resp}")
-        return False
+        return self.apply("set_secondary_light_sensitivity", mode)
 
     # --- Temperature / pH ---
     def set_ph(self, value: int) -> bool:
@@ -482,15 +495,7 @@ class Reactor:
         the command format for the reactor. 
         E.g. pH 7.5 -> P0075
         """
-        pH_val = max(2.0, min(12.0, value))         # Clamp the value to 2.0 - 12.0
-        pH_val = round(pH_val, 1)                   # Round to 1 decimal place
-        cmd_value = int(pH_val * 10)                # Convert to command format (pHSP = value * 10)
-        cmd = f"/{self.addr:02d}P{cmd_value:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set pH: {resp}")
-        return False
+        return self.apply("set_ph", value)
 
     def set_temp_day(self, value: float) -> bool:
         """
@@ -499,15 +504,7 @@ class Reactor:
         the command format for the reactor. 
         E.g. 10.5°C -> R0105
         """
-        temp_val = max(0.0, min(45.0, value))       # Clamp the value to 0.0 - 45.0
-        temp_val = round(temp_val, 1)               # Round to 1 decimal place
-        cmd_val = int(temp_val * 10)                # Convert to command format (SP1 = value * 10)
-        cmd = f"/{self.addr:02d}R{cmd_val:04d}"     # Create the command
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "??":              # Reactor answers with ?? here, idk why...
-            return True
-        logging.warning(f"Failed to set day temperature: {resp}")
-        return False
+        return self.apply("set_temp_day", value)
 
     def set_temp_night(self, value: int) -> bool:
         """
@@ -516,15 +513,7 @@ class Reactor:
         the command format for the reactor. 
         E.g. 10.5°C -> R1105 (R1 is for night temp)
         """
-        temp_val = max(0.0, min(45.0, value))       # Clamp the value to 0.0 - 45.0
-        temp_val = round(temp_val, 1)               # Round to 1 decimal place
-        cmd_val = int(temp_val * 10)                # Convert to command format (SP2 = value * 10)
-        cmd = f"/{self.addr:02d}R1{cmd_val:03d}"    # Create the command
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set night temperature: {resp}")
-        return False
+        return self.apply("set_temp_night", value)
 
     # --- Turbidity / Chemostat ---
     def set_turbidity(self, value: int) -> bool:
@@ -534,86 +523,37 @@ class Reactor:
         converts them to a reactor command.
         E.g. 150 -> U0150 to set 150 as turbidity setpoint
         """
-        cmd_value = max(0, min(850, value)) # Clamp the value to 0 - 850
-        cmd = f"/{self.addr:02d}U{cmd_value:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set turbidity: {resp}")
-        return False
+        return self.apply("set_turbidity", value)
 
     def set_chemostat(self, value: int) -> bool:
         """Set chemostat setpoint (0-100%)."""
-        # Clamp the value to 0 - 100%
-        cmd_value = max(0, min(100, value))
-        cmd = f"/{self.addr:02d}C{cmd_value:04d}"
-        resp = self.send(cmd)
-        print(resp) #for debugging)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set chemostat: {resp}")
-        return False
+        return self.apply("set_chemostat", value)
 
     # --- External / Misc ---
     def set_external_ph_pump(self, value: int) -> bool:
         """Set external pH pump control: 0=Base,1=Acid."""
-        cmd = f"/{self.addr:02d}E{value:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set external pH pump: {resp}")
-        return False
+        return self.apply("set_external_ph_pump", value)
 
     def set_anti_foam_timer(self, interval: int, runtime: int) -> bool:
         """Set anti-foam timer: interval & runtime."""
-        cmd = f"/{self.addr:02d}F{interval:02d}{runtime:02d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set anti-foam timer: {resp}")
-        return False
+        return self.apply("set_anti_foam_timer", interval, runtime)
 
     def switch_off_master_modes(self) -> bool:
         """Switch off all master modes."""
-        cmd = "/00^0000"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to switch off master modes: {resp}")
-        return False
+        return self.apply("switch_off_master_modes")
 
     def set_filter_cycles(self, value: int) -> bool:
         """Set measuring filter cycles (1-16)."""
-        cmd = f"/{self.addr:02d}Q{value:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set filter cycles: {resp}")
-        return False
+        return self.apply("set_filter_cycles", value)
 
     def reset_communication(self) -> bool:
         """Reset communication controller."""
-        cmd = f"/{self.addr:02d}!0000"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to reset communication: {resp}")
-        return False
+        return self.apply("reset_communication")
 
     def set_audible_alarm(self, value: int) -> bool:
         """Set audible alarm: 0=Off,1=On."""
-        cmd = f"/{self.addr:02d}@{value:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set audible alarm: {resp}")
-        return False
+        return self.apply("set_audible_alarm", value)
 
     def set_reactor_mode(self, mode: int) -> bool:
         """Set reactor mode: 0=Turbidostat, 2=Timed Turbidostat, 2=Chemostat, 3=Timed Chemostat."""
-        cmd = f"/{self.addr:02d}M{mode:04d}"
-        resp = self.send(cmd)
-        if resp and resp[-2:] == "OK":
-            return True
-        logging.warning(f"Failed to set reactor mode: {resp}")
-        return False
+        return self.apply("set_reactor_mode", mode)
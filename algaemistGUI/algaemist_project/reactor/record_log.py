@@ -0,0 +1,137 @@
+# reactor/record_log.py
+
+import json
+import os
+import struct
+import threading
+import logging
+from datetime import datetime
+
+import numpy as np
+
+from .column_store import CHANNELS, to_epoch_ms
+
+
+MAGIC = b"ALGREC01"
+HEADER = struct.Struct("<8sHH52x")                  # magic, record size, channel count -> 64 bytes
+RECORD = struct.Struct("<q" + "f" * len(CHANNELS))  # epoch ms, 10 x float32 -> 48 bytes
+RECORD_DTYPE = np.dtype([("timestamp", "<i8")] + [(c, "<f4") for c in CHANNELS])
+
+
+class RecordLog:
+    """
+    Append-only log of fixed-width binary records.
+
+    The file starts with a 64 byte header, followed by one 48 byte record
+    per sample: int64 epoch milliseconds of the local wall-clock time and
+    the 10 channels as float32 (NaN = missing). Because every record has
+    the same size, `load_records()` maps the file as a NumPy structured
+    array without parsing anything. Comments go to the side file
+    `<path>.comments` (JSON lines, keyed by record index).
+
+        log = RecordLog("data/experiment.rec")
+        log.append(datetime.now(), sensors, pumps, comment="Temp set to 20")
+        records, comments = load_records("data/experiment.rec")
+        records["temp"].mean()
+    """
+
+    def __init__(self, path: str, flush_rows: int = 50):
+        self.path = path
+        self.flush_rows = flush_rows
+        self._lock = threading.Lock()
+        self._pending = []
+        self._comments = []
+
+        if os.path.exists(path) and os.path.getsize(path) >= HEADER.size:
+            _check_header(path)
+            # Drop a torn last record (crash mid-write) so appends stay aligned
+            size = os.path.getsize(path)
+            whole = HEADER.size + (size - HEADER.size) // RECORD.size * RECORD.size
+            if whole != size:
+                logging.warning(f"Truncating incomplete record at the end of {path}")
+                os.truncate(path, whole)
+        else:
+            dir_path = os.path.dirname(path)
+            if dir_path:
+                os.makedirs(dir_path, exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, RECORD.size, len(CHANNELS)))
+        self.records = (os.path.getsize(path) - HEADER.size) // RECORD.size
+        self._file = open(path, "ab")
+
+    def append(self, timestamp: datetime, sensors: dict, pumps: dict, comment: str | None = None):
+        """Pack one record, written once `flush_rows` records are pending."""
+        values = {**(sensors or {}), **(pumps or {})}
+        record = RECORD.pack(to_epoch_ms(timestamp),
+                             *(np.nan if values.get(c) is None else values[c] for c in CHANNELS))
+        with self._lock:
+            if comment:
+                self._comments.append({"record": self.records + len(self._pending), "text": comment})
+            self._pending.append(record)
+            if len(self._pending) >= self.flush_rows:
+                self._write()
+
+    def flush(self):
+        with self._lock:
+            self._write()
+
+    def close(self):
+        with self._lock:
+            self._write()
+            self._file.close()
+
+    def _write(self):
+        """Write the pending records and comments. Caller holds the lock."""
+        if not self._pending or self._file.closed:
+            return
+        try:
+            self._file.write(b"".join(self._pending))
+            self._file.flush()
+            if self._comments:
+                with open(self.path + ".comments", "a") as f:
+                    for comment in self._comments:
+                        f.write(json.dumps(comment) + "\n")
+            self.records += len(self._pending)
+        except Exception as e:
+            logging.error(f"Failed to write records to {self.path}: {e}")
+        self._pending, self._comments = [], []
+
+
+def _check_header(path):
+    with open(path, "rb") as f:
+        magic, record_size, channels = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC or record_size != RECORD.size or channels != len(CHANNELS):
+        raise ValueError(f"{path} is not a record log of this version")
+
+
+def load_records(path: str) -> tuple[np.ndarray, dict]:
+    """
+    Map a `RecordLog` read-only as a structured array ("timestamp" int64 epoch ms,
+    one float32 field per channel) and read its comments (record index -> text).
+    """
+    _check_header(path)
+    count = (os.path.getsize(path) - HEADER.size) // RECORD.size
+    if count == 0:
+        records = np.empty(0, dtype=RECORD_DTYPE)
+    else:
+        records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+
+    comments = {}
+    if os.path.exists(path + ".comments"):
+        with open(path + ".comments") as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry["record"] < count:
+                    comments[entry["record"]] = entry["text"]
+    return records, comments
+
+
+def load_dataframe(path: str):
+    """Load a `RecordLog` as a pandas DataFrame with the columns of the DataLogger CSV."""
+    import pandas as pd
+
+    records, comments = load_records(path)
+    df = pd.DataFrame({name: np.asarray(records[name]) for name in RECORD_DTYPE.names})
+    df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
+    df["comments"] = pd.Series(comments, index=list(comments), dtype=object).reindex(df.index)
+    return df
@@ -0,0 +1,117 @@
+# reactor/rolling_log.py
+
+import csv
+import glob
+import os
+import logging
+from datetime import datetime, timedelta
+
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+SEGMENT_FORMAT = "%Y%m%d_%H"        # one segment file per hour, sorts chronologically
+
+
+class RollingLog:
+    """
+    CSV log limited to the last `hours`, stored as one segment file per hour:
+
+        .data/emergency_log/20251017_13.csv
+        .data/emergency_log/20251017_14.csv
+        ...
+
+    An append only touches the segment of its hour, retention deletes whole
+    segments once they are older than the window. `rows()` reads the
+    segments in order as one continuous table.
+    """
+
+    def __init__(self, directory: str, header: list[str], hours: float = 72):
+        self.directory = directory
+        self.header = list(header)
+        self.hours = hours
+        self._current = None        # segment name the last row went to
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _segment_path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.csv")
+
+    def segments(self) -> list[str]:
+        """Paths of all segment files, oldest first."""
+        return sorted(glob.glob(os.path.join(self.directory, "*.csv")))
+
+    def append(self, row: list, timestamp: datetime | None = None):
+        """Append `row` (without timestamp) to the segment of `timestamp` (default: now)."""
+        timestamp = timestamp or datetime.now()
+        name = timestamp.strftime(SEGMENT_FORMAT)
+        path = self._segment_path(name)
+        new_segment = not os.path.exists(path)
+        with open(path, "a", newline="") as f:
+            writer = csv.writer(f)
+            if new_segment:
+                writer.writerow(self.header)
+            writer.writerow([timestamp.strftime(TIME_FORMAT)] + list(row))
+
+        if name != self._current:
+            # Only a new hour can push a segment out of the window
+            self._current = name
+            self.expire(timestamp)
+
+    def expire(self, now: datetime | None = None):
+        """Delete the segments that ended before the retention window."""
+        cutoff = (now or datetime.now()) - timedelta(hours=self.hours)
+        for path in self.segments():
+            name = os.path.splitext(os.path.basename(path))[0]
+            try:
+                end = datetime.strptime(name, SEGMENT_FORMAT) + timedelta(hours=1)
+            except ValueError:
+                continue  # not a segment
+            if end > cutoff:
+                break
+            try:
+                os.remove(path)
+            except OSError as e:
+                logging.error(f"Failed to remove expired log segment {path}: {e}")
+
+    def rows(self, since: datetime | None = None):
+        """
+        Yield the rows of the retention window (or since `since`) as one table,
+        the header first. Only the oldest segments need their timestamps parsed.
+        """
+        cutoff = datetime.now() - timedelta(hours=self.hours)
+        if since is not None:
+            cutoff = max(cutoff, since)
+        cutoff_name = cutoff.strftime(SEGMENT_FORMAT)
+
+        yield self.header
+        for path in self.segments():
+            name = os.path.splitext(os.path.basename(path))[0]
+            if name < cutoff_name:
+                continue
+            with open(path, "r", newline="") as f:
+                reader = csv.reader(f)
+                next(reader, None)      # segment header
+                if name > cutoff_name:
+                    yield from reader
+                    continue
+                for r in reader:        # the segment the window starts in
+                    try:
+                        if datetime.strptime(r[0], TIME_FORMAT) >= cutoff:
+                            yield r
+                    except (ValueError, IndexError) as e:
+                        logging.warning(f"Skipping invalid row in {path}: {r} -> {e}")
+
+    def export_csv(self, path: str, since: datetime | None = None):
+        """Write the window as one CSV file (the format of the old single-file log)."""
+        with open(path, "w", newline="") as f:
+            csv.writer(f).writerows(self.rows(since))
+
+    def import_csv(self, path: str):
+        """Move the rows of a single-file log (header + rows) into segments."""
+        with open(path, "r", newline="") as f:
+            reader = csv.reader(f)
+            next(reader, None)
+            for r in reader:
+                try:
+                    timestamp = datetime.strptime(r[0], TIME_FORMAT)
+                except (ValueError, IndexError):
+                    continue
+                self.append(r[1:], timestamp)
@@ -0,0 +1,222 @@
+# reactor/rollup.py
+
+import argparse
+import csv
+import math
+import os
+import threading
+import logging
+from datetime import datetime
+
+from .column_store import CHANNELS, TIME_FORMAT, to_epoch_ms, from_epoch_ms
+
+
+TIERS = {"1min": 60, "10min": 600, "1h": 3600}   # name -> bucket width in seconds
+STATS = ("mean", "min", "max", "count")
+
+
+class _Bucket:
+    """Running min / max / sum / count per channel of one time bucket."""
+
+    def __init__(self, start_ms: int, channels: int):
+        self.start_ms = start_ms
+        self.min = [math.inf] * channels
+        self.max = [-math.inf] * channels
+        self.sum = [0.0] * channels
+        self.count = [0] * channels
+
+    def add(self, values: list):
+        for i, v in enumerate(values):
+            if v is None or v != v:     # missing or NaN
+                continue
+            if v < self.min[i]:
+                self.min[i] = v
+            if v > self.max[i]:
+                self.max[i] = v
+            self.sum[i] += v
+            self.count[i] += 1
+
+    def row(self) -> list:
+        row = [from_epoch_ms(self.start_ms).strftime(TIME_FORMAT)]
+        for i, n in enumerate(self.count):
+            if n:
+                row += [round(self.sum[i] / n, 4), self.min[i], self.max[i], n]
+            else:
+                row += ["", "", "", 0]
+        return row
+
+
+class Rollups:
+    """
+    1 min / 10 min / 1 h rollups (mean, min, max, count per channel) kept
+    up to date as samples arrive.
+
+    Every tier is a small CSV file in a directory next to the log
+    (data_log.csv -> data_log.rollups/1min.csv, 10min.csv, 1h.csv) with one
+    row per bucket, written once the bucket is complete. Buckets start at
+    whole minutes / hours of the local time. `close()` also writes the open
+    buckets; a bucket continued after a restart is merged on loading.
+    """
+
+    all_samples = True      # aggregates every sample, also those a DataLogger compression drops
+
+    def __init__(self, path: str, tiers: dict = TIERS, channels=CHANNELS):
+        self.path = path
+        self.tiers = dict(tiers)
+        self.channels = tuple(channels)
+        self._buckets = {}          # tier name -> open _Bucket
+        self._lock = threading.Lock()
+        os.makedirs(self.path, exist_ok=True)
+
+    def tier_path(self, tier: str) -> str:
+        return os.path.join(self.path, f"{tier}.csv")
+
+    def append(self, timestamp: datetime, sensors: dict, pumps: dict, comment: str | None = None):
+        values = {**(sensors or {}), **(pumps or {})}
+        row = [values.get(c) for c in self.channels]
+        ms = to_epoch_ms(timestamp)
+        with self._lock:
+            for tier, seconds in self.tiers.items():
+                start = ms - ms % (seconds * 1000)
+                bucket = self._buckets.get(tier)
+                if bucket is None or bucket.start_ms != start:
+                    if bucket is not None:
+                        self._write(tier, bucket)
+                    bucket = self._buckets[tier] = _Bucket(start, len(self.channels))
+                bucket.add(row)
+
+    def flush(self):
+        pass    # complete buckets are written right away, the open ones by close()
+
+    def close(self):
+        with self._lock:
+            for tier, bucket in self._buckets.items():
+                self._write(tier, bucket)
+            self._buckets = {}
+
+    def _write(self, tier: str, bucket: _Bucket):
+        if not any(bucket.count):
+            return  # only rows without values (e.g. comments)
+        path = self.tier_path(tier)
+        try:
+            new_file = not os.path.exists(path)
+            with open(path, "a", newline="") as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(header(self.channels))
+                writer.writerow(bucket.row())
+        except Exception as e:
+            logging.error(f"Failed to write {tier} rollup to {path}: {e}")
+
+
+def header(channels=CHANNELS) -> list[str]:
+    return ["timestamp"] + [f"{c}_{s}" for c in channels for s in STATS]
+
+
+def rollup_path(log_path: str) -> str:
+    """Rollup directory of a log (CSV file, .cols store or .rec file)."""
+    return os.path.splitext(log_path.rstrip("/\\"))[0] + ".rollups"
+
+
+def select_tier(resolution: float, tiers: dict = TIERS) -> str | None:
+    """Coarsest tier whose buckets are not wider than `resolution` seconds, None = raw samples."""
+    usable = [(seconds, tier) for tier, seconds in tiers.items() if seconds <= resolution]
+    return max(usable)[1] if usable else None
+
+
+def load_tier(log_path: str, tier: str):
+    """One tier of a log's rollups as a DataFrame (timestamp, <channel>_mean / _min / _max / _count)."""
+    import pandas as pd
+
+    df = pd.read_csv(os.path.join(rollup_path(log_path), f"{tier}.csv"))
+    df["timestamp"] = pd.to_datetime(df["timestamp"])
+    if df["timestamp"].duplicated().any():
+        df = _merge_buckets(df)
+    return df
+
+
+def _merge_buckets(df):
+    """Combine rows of the same bucket (written before and after a restart)."""
+    channels = [c[:-len("_mean")] for c in df.columns if c.endswith("_mean")]
+    for c in channels:
+        df[f"{c}_sum"] = df[f"{c}_mean"].fillna(0) * df[f"{c}_count"]
+    aggregations = {}
+    for c in channels:
+        aggregations.update({f"{c}_sum": "sum", f"{c}_min": "min", f"{c}_max": "max", f"{c}_count": "sum"})
+    merged = df.groupby("timestamp", as_index=False).agg(aggregations)
+    for c in channels:
+        merged[f"{c}_mean"] = (merged[f"{c}_sum"] / merged[f"{c}_count"]).where(merged[f"{c}_count"] > 0)
+    return merged[["timestamp"] + [f"{c}_{s}" for c in channels for s in STATS]]
+
+
+def load_for_plot(log_path: str, points: int = 2000, t0: datetime | None = None, t1: datetime | None = None):
+    """
+    The data of a log for plotting about `points` points between t0 and t1:
+    the coarsest rollup tier that still resolves that many points (channel
+    columns are the bucket means, plus <channel>_min / _max), or the raw
+    samples if no tier is fine enough or the log has no rollups.
+    The chosen tier is in `df.attrs["tier"]` (None for raw samples).
+    """
+    import pandas as pd
+
+    directory = rollup_path(log_path)
+    df = None
+    if os.path.isdir(directory):
+        if t0 is None or t1 is None:
+            # The span from the coarsest available tier, only a few rows per day
+            available = [t for t in sorted(TIERS, key=TIERS.get, reverse=True)
+                         if os.path.exists(os.path.join(directory, f"{t}.csv"))]
+            if available:
+                coarse = load_tier(log_path, available[0])
+                t0 = t0 or coarse["timestamp"].min().to_pydatetime()
+                t1 = t1 or (coarse["timestamp"].max() + pd.Timedelta(seconds=TIERS[available[0]])).to_pydatetime()
+        tier = select_tier((t1 - t0).total_seconds() / points) if t0 and t1 else None
+        if tier is not None and os.path.exists(os.path.join(directory, f"{tier}.csv")):
+            df = load_tier(log_path, tier)
+            df = df.rename(columns={c: c[:-len("_mean")] for c in df.columns if c.endswith("_mean")})
+            df.attrs["tier"] = tier
+
+    if df is None:
+        df = load_log(log_path)
+        df.attrs["tier"] = None
+    if t0 is not None:
+        df = df[df["timestamp"] >= t0]
+    if t1 is not None:
+        df = df[df["timestamp"] < t1]
+    return df.reset_index(drop=True)
+
+
+def load_log(log_path: str):
+    """All samples of a log (DataLogger CSV, column store or record log) as a DataFrame."""
+    if os.path.isdir(log_path):
+        from .column_store import load_dataframe
+        return load_dataframe(log_path)
+    if log_path.endswith(".rec"):
+        from .record_log import load_dataframe
+        return load_dataframe(log_path)
+    from .log_loader import load
+    return load(log_path).reset_index()     # any CSV variant, cached after the first parse
+
+
+def build(log_path: str, tiers: dict = TIERS) -> str:
+    """(Re)build the rollups of an existing log in one pass, returns the rollup directory."""
+    df = load_log(log_path).set_index("timestamp").sort_index()
+    channels = [c for c in CHANNELS if c in df.columns]
+    directory = rollup_path(log_path)
+    os.makedirs(directory, exist_ok=True)
+    for tier, seconds in tiers.items():
+        stats = df[channels].astype(float).resample(f"{seconds}s").agg(["mean", "min", "max", "count"])
+        stats.columns = [f"{c}_{s}" for c, s in stats.columns]
+        stats = stats[stats[[f"{c}_count" for c in channels]].sum(axis=1) > 0].round(4)
+        stats.index = stats.index.strftime(TIME_FORMAT)
+        stats.to_csv(os.path.join(directory, f"{tier}.csv"), index_label="timestamp")
+    return directory
+
+
+if __name__ == "__main__":
+    # python -m reactor.rollup data/growth_data1.csv   -> data/growth_data1.rollups/
+    parser = argparse.ArgumentParser(description="Build the 1 min / 10 min / 1 h rollups of an existing log")
+    parser.add_argument("log", nargs="+")
+    args = parser.parse_args()
+    for log in args.log:
+        print(f"{log} -> {build(log)}")
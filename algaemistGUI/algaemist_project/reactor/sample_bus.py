@@ -0,0 +1,146 @@
+# reactor/sample_bus.py
+
+import threading
+import logging
+from collections import deque
+from dataclasses import replace
+from datetime import datetime
+from .snapshot import ReactorSnapshot
+
+
+class Subscription:
+    """
+    One consumer of a `SampleBus`.
+
+    With a `callback`, every delivered sample is passed to it on the
+    publishing thread (keep it short). Without one, samples are kept in a
+    bounded queue until the consumer calls `drain()`; if it falls behind,
+    the oldest samples are dropped and counted.
+    """
+
+    def __init__(self, bus, name, callback=None, every=0.0, fields=(), max_age=None, maxsize=32):
+        self.bus = bus
+        self.name = name
+        self.callback = callback
+        self.every = every          # min. seconds between two delivered samples
+        self.fields = fields        # only deliver samples where these are not None
+        self.max_age = max_age      # ... and were read at most max_age seconds before the sample
+        self._queue = deque(maxlen=maxsize)
+        self._last = None           # timestamp of the last delivered sample
+        self.delivered = 0
+        self.dropped = 0
+
+    def _wants(self, snapshot: ReactorSnapshot) -> bool:
+        if self.max_age is not None:
+            if not snapshot.fresh(self.fields, self.max_age, now=snapshot.timestamp):
+                return False
+        elif any(getattr(snapshot, f) is None for f in self.fields):
+            return False
+        return self._last is None or (snapshot.timestamp - self._last).total_seconds() >= self.every
+
+    def _deliver(self, snapshot: ReactorSnapshot):
+        """Caller holds the bus lock. Returns the callback to run after releasing it."""
+        self._last = snapshot.timestamp
+        self.delivered += 1
+        if self.callback is not None:
+            return self.callback
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
+        self._queue.append(snapshot)
+        return None
+
+    def drain(self) -> list[ReactorSnapshot]:
+        """All queued samples, oldest first."""
+        with self.bus._lock:
+            samples = list(self._queue)
+            self._queue.clear()
+            return samples
+
+    def close(self):
+        self.bus.unsubscribe(self)
+
+    def stats(self) -> dict:
+        return {"delivered": self.delivered, "dropped": self.dropped, "queued": len(self._queue)}
+
+
+class SampleBus:
+    """
+    Publish / subscribe for reactor samples.
+
+    Every read of the reactor is merged into one immutable `ReactorSnapshot`
+    and handed to all subscribers (GUI, CSV logger, emergency log, experiment
+    scripts), so they see identical, identically timestamped values and the
+    reactor is read once for all of them. A value that could not be read
+    again keeps its old read time (`snapshot.read_at`), so consumers can
+    tell it from a current one:
+
+        reactor.samples.subscribe("emergency_log", callback=write_log,
+                                  every=600, fields=("sensors", "pumps"), max_age=10)
+        gui = reactor.samples.subscribe("gui")
+        ...
+        for snapshot in gui.drain():
+            ...
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._latest: ReactorSnapshot | None = None
+        self._subscriptions = []
+        self.published = 0
+
+    def subscribe(self, name: str, callback=None, every: float = 0.0, fields=(), max_age: float | None = None,
+                  maxsize=32) -> Subscription:
+        """
+        name:     used in `stats()`
+        callback: called with each delivered sample, None to queue them for `drain()`
+        every:    deliver at most one sample per `every` seconds
+        fields:   only deliver samples where these snapshot fields are set
+        max_age:  ... and were read at most `max_age` seconds before the sample
+        """
+        subscription = Subscription(self, name, callback, every, tuple(fields), max_age, maxsize)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+
+    def update(self, values: dict, timestamp: datetime | None = None, read_at: dict | None = None) -> ReactorSnapshot:
+        """
+        Merge freshly read `values` (snapshot field -> value) into the latest sample and publish it.
+        The values were read at `timestamp` (default: now) unless `read_at` gives their read times.
+        """
+        timestamp = timestamp or datetime.now()
+        with self._lock:
+            base = self._latest or ReactorSnapshot(timestamp=timestamp)
+            times = {name: base.read_time(name) for name in ReactorSnapshot.query_names()
+                     if getattr(base, name) is not None}
+            times.update({name: timestamp for name in values})
+            times.update(read_at or {})
+            snapshot = replace(base, timestamp=timestamp, read_at=times, **values)
+            self._latest = snapshot
+            self.published += 1
+            callbacks = [(s, s._deliver(snapshot)) for s in self._subscriptions if s._wants(snapshot)]
+
+        for subscription, callback in callbacks:
+            if callback is None:
+                continue
+            try:
+                callback(snapshot)
+            except Exception as e:
+                logging.error(f"Sample subscriber '{subscription.name}' failed: {e}")
+        return snapshot
+
+    def latest(self) -> ReactorSnapshot | None:
+        """The newest sample, None before the first one."""
+        with self._lock:
+            return self._latest
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "published": self.published,
+                "subscribers": {s.name: s.stats() for s in self._subscriptions},
+            }
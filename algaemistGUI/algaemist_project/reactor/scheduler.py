@@ -0,0 +1,164 @@
+# reactor/scheduler.py
+
+import threading
+import time
+import logging
+
+
+class PollChannel:
+    """One periodic task of the `PollScheduler` with its own rate and statistics."""
+
+    def __init__(self, name: str, interval: float, callback, next_due: float):
+        self.name = name
+        self.interval = interval
+        self.callback = callback
+        self.next_due = next_due
+        # --- Statistics ---
+        self.runs = 0
+        self.late = 0           # ticks started later than the late tolerance
+        self.missed = 0         # ticks skipped because an earlier run overran
+        self.errors = 0
+        self.max_lateness = 0.0
+        self.last_duration = 0.0
+
+
+class PollScheduler:
+    """
+    Runs polling tasks at individual rates in one background thread.
+
+    Every channel has a deadline on the monotonic clock which advances by
+    exactly one interval per tick, so the rate does not drift with the
+    duration of the poll. If a poll overruns and deadlines pass, the channel
+    runs once as soon as possible (catch up) and the skipped ticks are counted
+    as missed instead of being executed back to back:
+
+        scheduler = PollScheduler()
+        scheduler.add_channel("sensors", 2, lambda: reactor.query_many(["sensors"]))
+        scheduler.add_channel("settings", 60, refresh_settings)
+        scheduler.start()
+        ...
+        print(scheduler.stats())
+
+    late_tolerance: share of the interval a tick may start late before it counts as late
+    """
+
+    def __init__(self, late_tolerance=0.1, clock=time.monotonic):
+        self.late_tolerance = late_tolerance
+        self._clock = clock
+        self._channels = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # --- Channels ---
+
+    def add_channel(self, name: str, interval: float, callback, offset: float = 0.0):
+        """Poll `callback()` every `interval` seconds, the first time after `offset` seconds."""
+        with self._lock:
+            self._channels[name] = PollChannel(name, interval, callback, self._clock() + offset)
+        self._wakeup.set()
+
+    def remove_channel(self, name: str):
+        with self._lock:
+            self._channels.pop(name, None)
+
+    def set_interval(self, name: str, interval: float):
+        """Change the rate of a channel, the next tick is one new interval after the last one."""
+        with self._lock:
+            channel = self._channels[name]
+            channel.next_due += interval - channel.interval
+            channel.interval = interval
+        self._wakeup.set()
+
+    def trigger(self, name: str):
+        """Poll a channel as soon as possible (e.g. after a setpoint changed)."""
+        with self._lock:
+            channel = self._channels[name]
+            channel.next_due = min(channel.next_due, self._clock())
+        self._wakeup.set()
+
+    # --- Running ---
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return  # Already running
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="PollScheduler", daemon=True)
+        self._thread.start()
+        logging.info("Poll scheduler started.")
+
+    def stop(self):
+        self._stop_event.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join()
+        logging.info("Poll scheduler stopped.")
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            delay = self.run_pending()
+            self._wakeup.wait(timeout=delay)
+            self._wakeup.clear()
+
+    def run_pending(self) -> float:
+        """
+        Run every channel whose deadline has passed, earliest deadline first.
+        Returns the seconds until the next deadline.
+        """
+        while not self._stop_event.is_set():
+            with self._lock:
+                due = [c for c in self._channels.values() if c.next_due <= self._clock()]
+                if not due:
+                    break
+                channel = min(due, key=lambda c: c.next_due)
+            self._tick(channel)
+
+        with self._lock:
+            if not self._channels:
+                return 1.0
+            return max(0.0, min(c.next_due for c in self._channels.values()) - self._clock())
+
+    def _tick(self, channel: PollChannel):
+        started = self._clock()
+        with self._lock:
+            # Deadlines passed while this or another channel was polling: run the
+            # latest passed one right away (catch up), the ones before it are missed
+            behind = int((started - channel.next_due) // channel.interval)
+            if behind > 0:
+                channel.missed += behind
+                channel.next_due += behind * channel.interval
+                logging.warning(f"Poll channel '{channel.name}' fell behind, {behind} tick(s) missed "
+                                f"(interval {channel.interval} s)")
+            lateness = started - channel.next_due
+
+        try:
+            channel.callback()
+        except Exception as e:
+            channel.errors += 1
+            logging.error(f"Poll channel '{channel.name}' failed: {e}")
+        finished = self._clock()
+
+        with self._lock:
+            channel.runs += 1
+            channel.last_duration = finished - started
+            channel.max_lateness = max(channel.max_lateness, lateness)
+            if behind > 0 or lateness > channel.interval * self.late_tolerance:
+                channel.late += 1
+            channel.next_due += channel.interval  # fixed grid, does not drift with the poll duration
+
+    def stats(self) -> dict:
+        """Per channel: interval, runs, late and missed ticks, max lateness and last poll duration."""
+        with self._lock:
+            return {
+                c.name: {
+                    "interval_s": c.interval,
+                    "runs": c.runs,
+                    "late": c.late,
+                    "missed": c.missed,
+                    "errors": c.errors,
+                    "max_lateness_s": round(c.max_lateness, 3),
+                    "last_duration_s": round(c.last_duration, 3),
+                }
+                for c in self._channels.values()
+            }
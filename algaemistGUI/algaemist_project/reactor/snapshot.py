@@ -0,0 +1,68 @@
+# reactor/snapshot.py
+
+from dataclasses import asdict, dataclass, field, fields
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ReactorSnapshot:
+    """
+    Immutable set of values read from the reactor in one batched transaction.
+
+    Every field except `timestamp` is None if the reactor did not answer
+    (or answered with something that could not be parsed).
+
+    A `SampleBus` merges values read at different times into one snapshot:
+    `read_at` holds when each of them was read, values missing there were
+    read at `timestamp`. Check `fresh()` before treating a value as current.
+    """
+    timestamp: datetime
+    sensors: dict | None = None
+    pumps: dict | None = None
+    temp_setpoint: float | None = None
+    temp_control_on: bool | None = None
+    ph_setpoint: float | None = None
+    ph_control_on: bool | None = None
+    ph_correction: float | None = None
+    brightness: float | None = None
+    light_mode: int | None = None
+    light_on_time: str | None = None
+    light_off_time: str | None = None
+    sec_light_sensitivity: int | None = None
+    turb_setpoint: float | None = None
+    reactor_mode: int | None = None
+    read_at: dict = field(default_factory=dict)    # query name -> datetime of the read
+
+    @classmethod
+    def query_names(cls) -> list[str]:
+        """Names of the protocol queries needed to fill a snapshot."""
+        return [f.name for f in fields(cls) if f.name not in ("timestamp", "read_at")]
+
+    def read_time(self, name: str) -> datetime:
+        """When the value of `name` was read from the reactor."""
+        return self.read_at.get(name, self.timestamp)
+
+    def fresh(self, names, max_age: float, now: datetime | None = None) -> bool:
+        """True if all `names` are set and were read at most `max_age` seconds before `now` (default: now)."""
+        now = now or datetime.now()
+        return all(getattr(self, name) is not None and (now - self.read_time(name)).total_seconds() <= max_age
+                   for name in names)
+
+    @property
+    def complete(self) -> bool:
+        """True if every value was read successfully."""
+        return all(getattr(self, name) is not None for name in self.query_names())
+
+    def to_dict(self) -> dict:
+        """JSON compatible dict (ISO timestamp), see `from_dict`."""
+        values = asdict(self)
+        values["timestamp"] = self.timestamp.isoformat()
+        values["read_at"] = {name: t.isoformat() for name, t in self.read_at.items()}
+        return values
+
+    @classmethod
+    def from_dict(cls, values: dict) -> "ReactorSnapshot":
+        values = dict(values)
+        values["timestamp"] = datetime.fromisoformat(values["timestamp"])
+        values["read_at"] = {name: datetime.fromisoformat(t) for name, t in (values.get("read_at") or {}).items()}
+        return cls(**{f.name: values.get(f.name) for f in fields(cls)})
@@ -0,0 +1,166 @@
+# reactor/sqlite_store.py
+
+import csv
+import os
+import sqlite3
+import threading
+import time
+import logging
+from datetime import datetime, timedelta
+
+from .column_store import CHANNELS, TIME_FORMAT, to_epoch_ms, from_epoch_ms
+
+
+class SQLiteStore:
+    """
+    Time-indexed SQLite database for logged reactor data (a local file, no server).
+
+    Rows go to the `samples` table (`ts` = epoch milliseconds of the local
+    wall-clock time, indexed, one REAL column per channel), comments to the
+    separate `events` table. Appends are buffered and inserted in one
+    transaction every `batch_rows` rows or `flush_interval` seconds; the
+    database runs in WAL mode so readers don't block the logger:
+
+        store = SQLiteStore("data/experiment.sqlite", retention_hours=72)
+        store.append(datetime.now(), sensors, pumps, comment="Temp set to 20")
+        rows = store.range(t0, t1, channels=["temp", "pH"])
+    """
+
+    def __init__(self, path: str, channels=CHANNELS, batch_rows: int = 50, flush_interval: float = 5.0,
+                 retention_hours: float | None = None):
+        self.path = path
+        self.batch_rows = batch_rows
+        self.flush_interval = flush_interval
+        self.retention_hours = retention_hours
+        self._lock = threading.Lock()
+        self._samples = []
+        self._events = []
+        self._oldest = None         # monotonic time of the oldest buffered row
+        self._hour = None           # hour of the last retention check
+
+        dir_path = os.path.dirname(path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)   # access is serialized by _lock
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        columns = ", ".join(f'"{c}" REAL' for c in channels)
+        with self._db:
+            self._db.execute(f"CREATE TABLE IF NOT EXISTS samples (ts INTEGER NOT NULL, {columns})")
+            self._db.execute("CREATE INDEX IF NOT EXISTS samples_ts ON samples (ts)")
+            self._db.execute("CREATE TABLE IF NOT EXISTS events (ts INTEGER NOT NULL, text TEXT NOT NULL)")
+            self._db.execute("CREATE INDEX IF NOT EXISTS events_ts ON events (ts)")
+        # An existing database keeps its own channels
+        self.channels = tuple(r[1] for r in self._db.execute("PRAGMA table_info(samples)") if r[1] != "ts")
+        placeholders = ", ".join("?" * (len(self.channels) + 1))
+        self._insert = f"INSERT INTO samples VALUES ({placeholders})"
+
+    def append(self, timestamp: datetime, sensors: dict, pumps: dict, comment: str | None = None):
+        """Buffer one row, inserted with the next batch."""
+        values = {**(sensors or {}), **(pumps or {})}
+        ts = to_epoch_ms(timestamp)
+        with self._lock:
+            self._samples.append((ts, *(values.get(c) for c in self.channels)))
+            if comment:
+                self._events.append((ts, comment))
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            if len(self._samples) >= self.batch_rows or time.monotonic() - self._oldest >= self.flush_interval:
+                self._write_batch()
+            if self.retention_hours is not None and timestamp.hour != self._hour:
+                # Only a new hour can push whole hours of rows out of the window
+                self._hour = timestamp.hour
+                self._write_batch()
+                self._prune(timestamp - timedelta(hours=self.retention_hours))
+
+    def log_event(self, text: str, timestamp: datetime | None = None):
+        """Record an event (comment) without a sample."""
+        with self._lock:
+            self._events.append((to_epoch_ms(timestamp or datetime.now()), text))
+            self._write_batch()
+
+    def flush(self):
+        with self._lock:
+            self._write_batch()
+
+    def close(self):
+        with self._lock:
+            self._write_batch()
+            self._db.close()
+
+    def _write_batch(self):
+        """Insert the buffered rows in one transaction. Caller holds the lock."""
+        if not self._samples and not self._events:
+            return
+        try:
+            with self._db:
+                self._db.executemany(self._insert, self._samples)
+                self._db.executemany("INSERT INTO events VALUES (?, ?)", self._events)
+        except sqlite3.Error as e:
+            logging.error(f"Failed to write {len(self._samples)} rows to {self.path}: {e}")
+        self._samples, self._events, self._oldest = [], [], None
+
+    def _prune(self, cutoff: datetime):
+        try:
+            with self._db:
+                self._db.execute("DELETE FROM samples WHERE ts < ?", (to_epoch_ms(cutoff),))
+                self._db.execute("DELETE FROM events WHERE ts < ?", (to_epoch_ms(cutoff),))
+        except sqlite3.Error as e:
+            logging.error(f"Failed to prune {self.path}: {e}")
+
+    def prune(self, hours: float | None = None, now: datetime | None = None):
+        """Delete the rows and events older than `hours` (default: `retention_hours`)."""
+        hours = self.retention_hours if hours is None else hours
+        with self._lock:
+            self._write_batch()
+            self._prune((now or datetime.now()) - timedelta(hours=hours))
+
+    # --- Queries ---
+
+    def range(self, t0: datetime | None = None, t1: datetime | None = None, channels=None) -> list[dict]:
+        """
+        Rows with t0 <= timestamp < t1 (open ends if None), oldest first, as dicts
+        with "timestamp" and the requested `channels` (default: all).
+        """
+        channels = list(channels or self.channels)
+        unknown = set(channels) - set(self.channels)
+        if unknown:
+            raise ValueError(f"Unknown channels: {sorted(unknown)}")
+        columns = ", ".join(f'"{c}"' for c in channels)
+        where, params = self._window(t0, t1)
+        with self._lock:
+            self._write_batch()
+            cursor = self._db.execute(f"SELECT ts, {columns} FROM samples{where} ORDER BY ts", params)
+            rows = cursor.fetchall()
+        return [{"timestamp": from_epoch_ms(r[0]), **dict(zip(channels, r[1:]))} for r in rows]
+
+    def events(self, t0: datetime | None = None, t1: datetime | None = None) -> list[tuple[datetime, str]]:
+        """(timestamp, text) of the events with t0 <= timestamp < t1, oldest first."""
+        where, params = self._window(t0, t1)
+        with self._lock:
+            self._write_batch()
+            rows = self._db.execute(f"SELECT ts, text FROM events{where} ORDER BY ts", params).fetchall()
+        return [(from_epoch_ms(ts), text) for ts, text in rows]
+
+    @staticmethod
+    def _window(t0, t1):
+        conditions, params = [], []
+        if t0 is not None:
+            conditions.append("ts >= ?")
+            params.append(to_epoch_ms(t0))
+        if t1 is not None:
+            conditions.append("ts < ?")
+            params.append(to_epoch_ms(t1))
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), params
+
+    def import_csv(self, csv_path: str):
+        """Insert the rows of a DataLogger CSV (any subset of the channels)."""
+        with open(csv_path, newline="") as f:
+            for r in csv.DictReader(f):
+                try:
+                    timestamp = datetime.strptime(r["timestamp"], TIME_FORMAT)
+                except (ValueError, KeyError, TypeError):
+                    continue
+                values = {c: float(r[c]) for c in self.channels if r.get(c) not in (None, "")}
+                self.append(timestamp, values, {}, comment=r.get("comments") or None)
+        self.flush()
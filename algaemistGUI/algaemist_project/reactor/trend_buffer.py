@@ -0,0 +1,97 @@
+# reactor/trend_buffer.py
+
+from datetime import datetime
+
+import numpy as np
+
+from .column_store import CHANNELS
+
+
+class TrendBuffer:
+    """
+    Fixed-size ring buffer of the latest samples, for the GUI trend charts.
+
+    Timestamps (epoch s) and the values of every channel live in
+    preallocated NumPy arrays, so memory stays the same however long the
+    GUI runs; once full, every sample overwrites the oldest one. The default
+    capacity holds 72 h of samples 2 s apart (about 5 MB for all channels).
+
+        buffer = TrendBuffer()
+        buffer.append(snapshot.timestamp, {**snapshot.sensors, **snapshot.pumps})
+        times, temps = buffer.window("temp", t0=time.time() - 3600)
+
+    Not thread safe, feed and read it from the same (main) thread.
+    """
+
+    def __init__(self, channels=CHANNELS, capacity: int = 131072):
+        self.channels = list(channels)
+        self.capacity = capacity
+        self._column = {c: i for i, c in enumerate(self.channels)}
+        self._times = np.full(capacity, np.nan)
+        self._values = np.full((len(self.channels), capacity), np.nan, dtype=np.float32)
+        self._next = 0              # slot of the next sample
+        self.size = 0
+        self.version = 0            # changes with every append, charts skip redraws without new samples
+
+    def append(self, timestamp: datetime, values: dict):
+        """Add one sample; missing or None channels are stored as NaN (a gap in the chart)."""
+        i = self._next
+        self._times[i] = timestamp.timestamp()
+        for channel, j in self._column.items():
+            value = values.get(channel)
+            self._values[j, i] = np.nan if value is None else value
+        self._next = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+        self.version += 1
+
+    def _ordered(self, array):
+        """`array` (times or one channel) oldest first."""
+        if self.size < self.capacity:
+            return array[:self.size]
+        return np.concatenate((array[self._next:], array[:self._next]))
+
+    def window(self, channel: str, t0: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+        """Times (epoch s) and values of `channel` since `t0` (all if None), oldest first."""
+        times = self._ordered(self._times)
+        values = self._ordered(self._values[self._column[channel]])
+        if t0 is not None:
+            start = int(np.searchsorted(times, t0, side="left"))
+            times, values = times[start:], values[start:]
+        return times, values
+
+    def clear(self):
+        self._times[:] = np.nan
+        self._values[:] = np.nan
+        self._next = self.size = 0
+        self.version += 1
+
+
+def minmax_decimate(times: np.ndarray, values: np.ndarray, bins: int,
+                    t0: float | None = None, t1: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series to at most two points per time bin (e.g. one bin per pixel
+    column between t0 and t1): the minimum and maximum of the bin, in the
+    order the series passes them. The drawn line looks the same as the full
+    series at that width, spikes included, and has at most 2 * bins points.
+    Bins without a valid value stay NaN, so gaps remain gaps.
+    """
+    n = len(times)
+    if n <= 2 * bins:
+        return times, values
+    t0 = times[0] if t0 is None else t0
+    t1 = times[-1] if t1 is None else t1
+    scale = bins / ((t1 - t0) or 1.0)
+    b = np.clip(((times - t0) * scale).astype(np.int64), 0, bins - 1)
+    starts = np.flatnonzero(np.concatenate(([True], b[1:] != b[:-1])))
+    ends = np.concatenate((starts[1:], [n])) - 1
+
+    # fmin / fmax skip NaN unless a whole bin is NaN
+    low = np.fmin.reduceat(values, starts)
+    high = np.fmax.reduceat(values, starts)
+    rising = ~(values[starts] > values[ends])
+    out_times = np.empty(2 * len(starts))
+    out_values = np.empty(2 * len(starts), dtype=values.dtype)
+    out_times[0::2], out_times[1::2] = times[starts], times[ends]
+    out_values[0::2] = np.where(rising, low, high)
+    out_values[1::2] = np.where(rising, high, low)
+    return out_times, out_values
@@ -3,13 +3,20 @@
 import csv
 import os
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 import threading
-import time
+from .rolling_log import RollingLog, TIME_FORMAT
+from .csv_writer import BufferedCSVWriter
+from .compression import CompressionFilter
+# The optional stores (numpy, sqlite3) are imported when a DataLogger asks for them
 
 
 class DataLogger:
-    def __init__(self, path: str | None = None, auto: bool = False, interval: float = 1800):
+    def __init__(self, path: str | None = None, auto: bool = False, interval: float = 1800,
+                 buffered: bool = True, flush_rows: int = 50, flush_interval: float = 5.0, fsync: bool = True,
+                 columnar: bool = False, sqlite: bool = False, records: bool = False, rollups: bool = False,
+                 compression: str | None = None, deadbands: dict | None = None, heartbeat: float = 600,
+                 index: bool = False):
         """
         CSV data logger.
 
@@ -17,8 +24,38 @@ class DataLogger:
             path: Path to CSV file. Defaults to ./data/data_log_<timestamp>.csv
             auto: If True, will start auto logging (requires reactor to call `log_manual` or `log_from_reactor` in _auto_loop).
             interval: Seconds between auto logging iterations.
+            buffered: If True, `log_values` only queues the row and a background writer
+                      appends it (see `BufferedCSVWriter`), else every row is written directly.
+            flush_rows / flush_interval: Flush once this many rows are pending or the oldest is this old (s).
+            fsync: Also fsync on every flush, so flushed rows survive a power loss.
+            columnar: Also log into a `ColumnStore` next to the CSV (data_log.csv -> data_log.cols/),
+                      which loads much faster for analysis (`load_dataframe`). The CSV stays the primary log.
+            sqlite: Also log into a `SQLiteStore` next to the CSV (data_log.csv -> data_log.sqlite) for
+                    time range queries (`database.range(t0, t1, channels)`), and keep the
+                    `max_log_values` logs in SQLite databases with retention pruning instead of CSV segments.
+            records: Also log into a fixed-width binary `RecordLog` next to the CSV (data_log.csv -> data_log.rec),
+                     which `load_records` maps as a NumPy structured array.
+            rollups: Keep 1 min / 10 min / 1 h rollups (mean, min, max, count) of the logged samples
+                     next to the CSV (data_log.csv -> data_log.rollups/), see `rollup.load_for_plot`.
+            compression: "deadband" or "swinging_door" to only write the samples of `self.path` that
+                         leave the per-channel `deadbands`, plus one row at least every `heartbeat`
+                         seconds (see `CompressionFilter`). Allows a short `interval` at few rows.
+            index: Keep a sparse time -> byte offset index of the CSV up to date (`OffsetIndex`),
+                   so `self.offset_index.range(t0, t1)` parses only the rows of that window.
         """
         self.interval = interval
+        self.writer = BufferedCSVWriter(flush_rows, flush_interval, fsync) if buffered else None
+        self.columnar = columnar
+        self.sqlite = sqlite
+        self.records = records
+        self.rollups = rollups
+        self.index = index
+        self.offset_index: "OffsetIndex | None" = None
+        self.compressor = CompressionFilter(compression, deadbands, heartbeat) if compression else None
+        self._compress_lock = threading.Lock()
+        self.stores = []  # additional backends of self.path, each with append(timestamp, sensors, pumps, comment)
+        self.database: "SQLiteStore | None" = None
+        self._own_stores = []  # the stores opened for columnar / sqlite / records / rollups / index, they follow set_path
 
         if path is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -39,18 +76,49 @@ class DataLogger:
         self._stop_event = threading.Event()
         self._thread: threading.Thread | None = None
         self._reactor_getter: callable | None = None  # Function returning (sensors, pumps)
+        self._rolling_logs = {}  # path -> RollingLog of max_log_values
+        self._retention_databases = {}  # path -> SQLiteStore of max_log_values (sqlite=True)
+        self._open_stores()
 
         if auto:
             self.start_auto()
 
-    def log_values(self, sensors: dict, pumps: dict, comment: str | None = None, path: str | None = None):
-        """Log sensor and pump values to CSV. Can override the path for this log."""
+    def log_values(self, sensors: dict, pumps: dict, comment: str | None = None, path: str | None = None,
+                   timestamp: datetime | None = None):
+        """
+        Log sensor and pump values to CSV. Can override the path and the timestamp (default: now) for this log.
+        With `compression`, rows of `self.path` are only written if the `CompressionFilter` keeps them.
+        """
         file_path = path or self.path
+        timestamp = timestamp or datetime.now()
+        if file_path != self.path:
+            self._log_row(sensors, pumps, comment, file_path, timestamp, stores=[])
+            return
+        if self.compressor is None:
+            self._log_row(sensors, pumps, comment, file_path, timestamp, stores=self.stores)
+            return
+
+        # Compressed: only the rows the filter keeps, but aggregates (rollups) see every sample
+        all_samples = [s for s in self.stores if getattr(s, "all_samples", False)]
+        self._append_to_stores(all_samples, timestamp, sensors, pumps, comment)
+        with self._compress_lock:
+            for row_time, values, row_comment in self.compressor.add(timestamp, {**sensors, **pumps}, comment):
+                self._log_row(values, values, row_comment, file_path, row_time,
+                              stores=[s for s in self.stores if s not in all_samples])
+
+    def _append_to_stores(self, stores, timestamp, sensors, pumps, comment):
+        for store in stores:
+            try:
+                store.append(timestamp, sensors, pumps, comment)
+            except Exception as e:
+                logging.error(f"Failed to log data to {type(store).__name__}: {e}")
+
+    def _log_row(self, sensors: dict, pumps: dict, comment, file_path: str, timestamp: datetime, stores):
+        """Write one row to the CSV `file_path` and `stores`."""
+        self._append_to_stores(stores, timestamp, sensors, pumps, comment)
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             row = [
-                timestamp,
+                timestamp.strftime("%Y-%m-%d %H:%M:%S"),
                 sensors.get("temp"),
                 sensors.get("pH"),
                 sensors.get("light_prim"),
@@ -63,22 +131,108 @@ class DataLogger:
                 pumps.get("turb_pump"),
                 comment
             ]
+            if self.writer is not None:
+                self.writer.write(file_path, row)
+                return
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
             with open(file_path, "a", newline="") as f:
                 writer = csv.writer(f)
                 writer.writerow(row)
         except Exception as e:
             logging.error(f"Failed to log data: {e}")
+
+    def add_store(self, store):
+        """Also log the rows of `self.path` into `store` (see `ColumnStore`, `SQLiteStore`, `RecordLog`)."""
+        self.stores.append(store)
+
+    def _open_stores(self):
+        """(Re)open the column store / database / record log / rollups / offset index of `self.path`."""
+        for store in self._own_stores:
+            store.close()
+            self.stores.remove(store)
+        self._own_stores = []
+        self.database = None
+        self.offset_index = None
+        base = os.path.splitext(self.path)[0]
+        if self.columnar:
+            from .column_store import ColumnStore
+            self._own_stores.append(ColumnStore(base + ".cols"))
+        if self.sqlite:
+            from .sqlite_store import SQLiteStore
+            self.database = SQLiteStore(base + ".sqlite")
+            self._own_stores.append(self.database)
+        if self.records:
+            from .record_log import RecordLog
+            self._own_stores.append(RecordLog(base + ".rec"))
+        if self.rollups:
+            from .rollup import Rollups, rollup_path
+            self._own_stores.append(Rollups(rollup_path(self.path)))
+        if self.index:
+            from .offset_index import OffsetIndex
+            self.offset_index = OffsetIndex(self.path)
+            self._own_stores.append(self.offset_index)
+        for store in self._own_stores:
+            self.add_store(store)
+
+    def _flush_compressor(self):
+        """Write the sample held back by the swinging door, so the file reaches up to the last sample."""
+        if self.compressor is None:
+            return
+        with self._compress_lock:
+            for row_time, values, comment in self.compressor.flush():
+                self._log_row(values, values, comment, self.path, row_time,
+                              stores=[s for s in self.stores if not getattr(s, "all_samples", False)])
+
+    def flush(self):
+        """Make sure every row logged so far is in the file."""
+        self._flush_compressor()
+        if self.writer is not None:
+            self.writer.flush()
+        for store in [*self.stores, *self._retention_databases.values()]:
+            store.flush()
+
+    def close(self):
+        """Stop auto logging and write all queued rows (also done at interpreter exit)."""
+        if self._thread and self._thread.is_alive():
+            self.stop_auto()
+        self._flush_compressor()
+        if self.writer is not None:
+            self.writer.close()
+        for store in self.stores:
+            store.close()
+        for database in self._retention_databases.values():
+            database.close()
+        self._retention_databases = {}
+
+    def follow(self, from_start: bool = True) -> "LogFollower":
+        """A `LogFollower` of the CSV: each `read()` returns the rows written (flushed) since the last one."""
+        from .follower import LogFollower
+        return LogFollower(self.path, from_start=from_start)
+
+    def writer_stats(self) -> dict:
+        """Queue depth, rows written / dropped and write latency of the background writer."""
+        return self.writer.stats() if self.writer is not None else {}
             
             
             
-    def max_log_values(self, sensors: dict, pumps: dict, path: str | None = None, delta=72):
-        """Log sensor & pump data, keep only last 72 hours."""
-        file_path = path
-        print('max_log called')
+    def max_log_values(self, sensors: dict, pumps: dict, path: str | None = None, delta=72,
+                       timestamp: datetime | None = None):
+        """
+        Log sensor & pump data, keep only last 72 hours.
+
+        The log is a `RollingLog` of hourly segments in a directory named after
+        `path` (.data/emergency_log.csv -> .data/emergency_log/), so an append
+        only touches the current hour. Use `rolling_log(path).export_csv(path)`
+        to get the window as one CSV file.
+
+        With `DataLogger(sqlite=True)` the log is a `SQLiteStore` instead
+        (.data/emergency_log.sqlite) that prunes rows older than `delta` hours.
+        """
         try:
-            timestamp = datetime.now()
+            if self.sqlite:
+                self.retention_database(path, delta).append(timestamp or datetime.now(), sensors, pumps)
+                return
             row = [
-                timestamp.strftime("%Y-%m-%d %H:%M:%S"),
                 sensors.get("temp"),
                 sensors.get("pH"),
                 sensors.get("light_prim"),
@@ -90,48 +244,64 @@ class DataLogger:
                 pumps.get("co2_pump"),
                 pumps.get("turb_pump")
             ]
+            self.rolling_log(path, delta).append(row, timestamp or datetime.now())
 
-            # Read existing rows
-            existing_rows = []
-            if os.path.exists(file_path):
-                with open(file_path, "r", newline="") as f:
-                    reader = csv.reader(f)
-                    # headers = next(reader)
-                    for r in reader:
-                        try:
-                            ts = datetime.strptime(r[0], "%Y-%m-%d %H:%M:%S")
-                            existing_rows.append((ts, r))
-                        except Exception as e:
-                            logging.warning(f"Skipping invalid row in CSV: {r} -> {e}")
-            
-            # Append new row
-            existing_rows.append((timestamp, row))
+        except Exception as e:
+            logging.error(f"Failed to log sensor data: {e}")
 
-            # Keep only rows from last x hours
-            cutoff = timestamp - timedelta(hours=delta)
-            filtered_rows = [r for ts, r in existing_rows if ts >= cutoff]
+    def rolling_log(self, path: str, delta=72) -> RollingLog:
+        """The `RollingLog` behind `max_log_values(path=path)`."""
+        log = self._rolling_logs.get(path)
+        if log is None:
+            log = RollingLog(os.path.splitext(path)[0], header=[
+                "timestamp", "temp", "pH", "light_prim", "light_sec",
+                "air", "co2", "heater_pump", "cooler_pump",
+                "co2_pump", "turb_pump"
+            ], hours=delta)
+            if os.path.isfile(path):
+                # Single-file log of older versions: move its rows into segments once
+                log.import_csv(path)
+                os.replace(path, path + ".bak")
+                logging.info(f"Moved {path} into hourly segments in {log.directory}")
+            self._rolling_logs[path] = log
+        log.hours = delta
+        return log
 
-            # Write back
-            with open(file_path, "w", newline="") as f:
-                print('file opend and writing..',file_path)
-                writer = csv.writer(f)
-                writer.writerow([
-                    "timestamp", "temp", "pH", "light_prim", "light_sec",
-                    "air", "co2", "heater_pump", "cooler_pump",
-                    "co2_pump", "turb_pump"
-                ])
-                writer.writerows(filtered_rows)
+    def retention_database(self, path: str, delta=72) -> "SQLiteStore":
+        """The `SQLiteStore` behind `max_log_values(path=path)` with `DataLogger(sqlite=True)`."""
+        database = self._retention_databases.get(path)
+        if database is None:
+            from .sqlite_store import SQLiteStore
+            database = SQLiteStore(os.path.splitext(path)[0] + ".sqlite", retention_hours=delta)
+            self._retention_databases[path] = database
+        database.retention_hours = delta
+        return database
 
+    def retention_rows(self, path: str, since: datetime | None = None) -> list[tuple[datetime, dict]]:
+        """(timestamp, values) of the `max_log_values(path=path)` log since `since`, oldest first."""
+        try:
+            if self.sqlite:
+                return [(r.pop("timestamp"), r) for r in self.retention_database(path).range(since)]
+            rows = self.rolling_log(path).rows(since)
+            channels = next(rows)[1:]
+            result = []
+            for r in rows:
+                try:
+                    timestamp = datetime.strptime(r[0], TIME_FORMAT)
+                    result.append((timestamp, {c: float(v) if v else None for c, v in zip(channels, r[1:])}))
+                except (ValueError, IndexError) as e:
+                    logging.warning(f"Skipping invalid row in the log of {path}: {r} -> {e}")
+            return result
         except Exception as e:
-            logging.error(f"Failed to log sensor data: {e}")
-            
+            logging.error(f"Failed to read the log of {path}: {e}")
+            return []
 
     def log_from_reactor(self, reactor, comment: str | None = None, path: str | None = None):
-        """Read values from reactor and log them, optional path override."""
+        """Log the reactor's current sample (shared with the other consumers), optional path override."""
         if reactor._connected:
-            sensors = reactor.read_all_sensors() or {}
-            pumps = reactor.read_all_pumps() or {}
-            self.log_values(sensors, pumps, comment=comment, path=path)
+            snapshot = reactor.sample()
+            self.log_values(snapshot.sensors or {}, snapshot.pumps or {}, comment=comment, path=path,
+                            timestamp=snapshot.read_time("sensors"))
 
     def _auto_loop(self):
         """Background thread loop for auto logging."""
@@ -140,7 +310,7 @@ class DataLogger:
                 reactor = self._reactor_getter()
                 if reactor:
                     self.log_from_reactor(reactor)
-            time.sleep(self.interval)
+            self._stop_event.wait(self.interval)  # returns early on stop_auto()
 
     def start_auto(self, reactor_getter: callable):
         """
@@ -162,11 +332,18 @@ class DataLogger:
         self._stop_event.set()
         if self._thread:
             self._thread.join()
+        self.flush()
         logging.info("Auto data logging stopped.")
         
     def set_path(self, path: str):
         """Set the CSV path for the DataLogger and create file if missing."""
+        self._flush_compressor()   # the held sample belongs to the old file
+        if self.compressor is not None:
+            self.compressor.reset()
+        if self.writer is not None:
+            self.writer.close_path(self.path)   # nothing more goes to the old file, do not keep it open
         self.path = path
+        self._open_stores()   # the column store / database / record log / rollups / index follow the CSV
 
         # Ensure directory exists if specified
         dir_path = os.path.dirname(self.path)
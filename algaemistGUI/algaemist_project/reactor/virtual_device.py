@@ -0,0 +1,465 @@
+# reactor/virtual_device.py
+#
+# Hardware-free Algaemist reactor for development, load tests and benchmarks.
+#
+# Serve a virtual reactor on a Linux pseudo-terminal and connect to it like
+# to the real FTDI device:
+#
+#     python -m reactor.virtual_device --addr 21 --latency 0.05
+#     >>> Virtual reactor 21 listening on /dev/pts/5
+#
+#     r = Reactor(addr=21); r.connect("/dev/pts/5")
+#
+# or use it in-process without a pty:
+#
+#     r.ser = VirtualSerial(VirtualReactor(21)); r._connected = True
+
+import argparse
+import math
+import os
+import random
+import select
+import threading
+import time
+import logging
+
+COMMAND_LENGTH = 8  # "/" + 2 digit address + 5 character code, e.g. "/21x0000"
+
+
+def _clamp(value, low, high):
+    return max(low, min(high, value))
+
+
+class VirtualReactor:
+    """
+    Model of one reactor answering the command set used by `reactor.py`.
+
+    A simple culture / thermal model runs in (optionally accelerated)
+    simulated time:
+      - temperature is driven towards the setpoint by heater and cooler
+        power and loses heat to the ambient
+      - biomass grows logistically with a temperature dependent rate and is
+        diluted by the turbidostat / chemostat pump; the secondary light
+        sensor reads the culture density
+      - photosynthesis raises the pH, the CO2 pump brings it back down
+
+    time_scale: simulated seconds per real second (e.g. 60 = one minute per second)
+    noise:      standard deviation factor of the sensor noise (0 = exact values)
+    """
+
+    AMBIENT_TEMP = 21.0
+
+    def __init__(self, addr=21, time_scale=1.0, noise=1.0, seed=None):
+        self.addr = addr
+        self.time_scale = time_scale
+        self.noise = noise
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._last_step = time.monotonic()
+
+        # --- State ---
+        self.temp = 20.5
+        self.pH = 7.3
+        self.biomass = 10.0
+        self.air = 150.0
+        self.clock_minutes = 12 * 60        # device clock, set with T
+        # --- Settings ---
+        self.temp_setpoint = 20.0
+        self.temp_night_setpoint = 15.0
+        self.temp_control_on = True
+        self.ph_setpoint = 7.5
+        self.ph_control_on = True
+        self.ph_correction = 1.0
+        self.brightness = 25
+        self.light_mode = 1
+        self.light_range = 0
+        self.light_on_time = "0800"
+        self.light_off_time = "2000"
+        self.sec_light_sensitivity = 0
+        self.turb_setpoint = 350
+        self.reactor_mode = 0
+        self.chemostat = 0
+        self.external_ph_pump = 0
+        self.filter_cycles = 4
+        self.audible_alarm = 0
+        self.error = 0
+        # --- Actuators ---
+        self.heater_pump = 0.0
+        self.cooler_pump = 0.0
+        self.co2_pump = 0.0
+        self.turb_pump = 0.0
+
+    # --- Model ---
+
+    @property
+    def light_on(self) -> bool:
+        if self.light_mode != 2:  # only the timed mode switches the light off
+            return True
+        on = int(self.light_on_time[:2]) * 60 + int(self.light_on_time[2:])
+        off = int(self.light_off_time[:2]) * 60 + int(self.light_off_time[2:])
+        now = self.clock_minutes % (24 * 60)
+        return on <= now < off if on <= off else not (off <= now < on)
+
+    @property
+    def light_prim(self) -> float:
+        return 64.0 + (6.76 * self.brightness if self.light_on else 0.0)
+
+    @property
+    def light_sec(self) -> float:
+        return _clamp(85.0 + self.biomass, 0.0, 850.0)
+
+    @property
+    def co2_flow(self) -> float:
+        return 2.0 + 0.1 * self.co2_pump
+
+    def growth_rate(self) -> float:
+        """Specific growth rate per hour, optimum at 30 °C."""
+        light = 1.0 if self.light_on and self.brightness > 0 else 0.0
+        return 0.15 * light * math.exp(-((self.temp - 30.0) / 8.0) ** 2)
+
+    def step(self, dt_h: float):
+        """Advance the model by `dt_h` simulated hours."""
+        # Controllers
+        if self.temp_control_on:
+            error = self.temp_setpoint - self.temp
+            self.heater_pump = float(round(_clamp(error * 40.0, 0, 100), -1))
+            self.cooler_pump = float(round(_clamp(-error * 40.0, 0, 100), -1))
+        else:
+            self.heater_pump = self.cooler_pump = 0.0
+        if self.ph_control_on:
+            self.co2_pump = float(round(_clamp((self.pH - self.ph_setpoint) * 200.0, 0, 100), -1))
+        else:
+            self.co2_pump = 0.0
+        if self.reactor_mode in (0, 1):
+            self.turb_pump = 100.0 if self.light_sec > self.turb_setpoint else 0.0
+            dilution = 2.0 * self.turb_pump / 100.0
+        else:
+            self.turb_pump = float(self.chemostat)
+            dilution = 0.5 * self.chemostat / 100.0
+
+        # Plant
+        mu = self.growth_rate()
+        self.biomass += (mu * self.biomass * (1 - self.biomass / 900.0) - dilution * self.biomass) * dt_h
+        self.biomass = max(self.biomass, 0.1)
+        self.temp += (0.06 * self.heater_pump - 0.06 * self.cooler_pump
+                      + 0.5 * (self.AMBIENT_TEMP - self.temp)) * dt_h
+        self.pH += (2.0 * mu * self.biomass / 500.0 - 0.02 * self.co2_pump * self.ph_correction) * dt_h
+        self.pH = _clamp(self.pH, 2.0, 12.0)
+        self.clock_minutes += dt_h * 60.0
+
+    def advance(self):
+        """Advance the model to the current (scaled) time."""
+        now = time.monotonic()
+        dt_h = (now - self._last_step) * self.time_scale / 3600.0
+        self._last_step = now
+        # Integrate in steps of at most one simulated minute
+        steps = max(1, math.ceil(dt_h * 60))
+        for _ in range(steps):
+            self.step(dt_h / steps)
+
+    def _noisy(self, value, sd):
+        return value + self._rng.gauss(0.0, sd * self.noise) if self.noise else value
+
+    # --- Protocol ---
+
+    def handle(self, cmd: str) -> str | None:
+        """Answer one command like the real reactor. None if the command is unknown."""
+        with self._lock:
+            self.advance()
+            code = cmd[3:]
+            letter, arg = code[:1], code[1:]
+            if letter.islower():
+                payload = self._read(letter, arg)
+                return None if payload is None else f"{cmd[:3]}{letter}{payload}"
+            if self._write(letter, arg):
+                # The day setpoint is acknowledged with ?? by the real device
+                return f"{cmd}??" if code[:2] == "R0" else f"{cmd}OK"
+            return None
+
+    def _read(self, letter, arg):
+        if letter == "x":
+            return (f"{self._noisy(self.temp, 0.05):.2f};{self._noisy(self.pH, 0.02):.2f};"
+                    f"{round(self._noisy(self.light_prim, 0.5)):.1f};{round(self._noisy(self.light_sec, 1.0)):.1f};"
+                    f"{self._noisy(self.air, 0.6):.2f};{self._noisy(self.co2_flow, 0.3):.2f}")
+        if letter == "q":
+            return f"{self.co2_pump};{self.heater_pump};{self.cooler_pump};{self.turb_pump}"
+        answers = {
+            ("p", "0000"): self.ph_setpoint,
+            ("p", "0001"): round(self.pH, 2),
+            ("p", "0002"): self.co2_pump,
+            ("p", "0003"): int(self.ph_control_on),
+            ("p", "0004"): 0.0,
+            ("p", "0005"): self.ph_correction,
+            ("r", "0000"): self.temp_setpoint,
+            ("r", "0001"): round(self.temp, 2),
+            ("r", "0002"): self.heater_pump,
+            ("r", "0003"): int(self.temp_control_on),
+            ("r", "0004"): self.cooler_pump,
+            ("s", "0000"): self.sec_light_sensitivity,
+            ("u", "0000"): self.turb_setpoint,
+            ("u", "0001"): round(self.light_sec, 1),
+            ("u", "0002"): self.turb_pump,
+            ("u", "0003"): int(self.reactor_mode in (0, 1)),
+            ("e", "0000"): self.error,
+            ("i", "0000"): "AS-100;VR;1.0",
+            ("i", "0001"): "1.0",
+            ("f", "0001"): round(self.air, 2),
+            ("f", "0002"): round(self.co2_flow, 2),
+            ("b", "0000"): self.brightness,
+            ("l", "0000"): round(self.light_prim, 1),
+            ("o", "0000"): self.light_mode,
+            ("n", "0000"): int(self.light_on_time),   # the device drops leading zeros
+            ("k", "0000"): int(self.light_off_time),
+            ("v", "0000"): "2.0",
+            ("m", "0000"): f"^{self.reactor_mode}",
+        }
+        return answers.get((letter, arg))
+
+    def _write(self, letter, arg) -> bool:
+        try:
+            value = int(arg)
+        except ValueError:
+            return False
+        if letter == "A":
+            self.addr = value
+        elif letter == "T":
+            self.clock_minutes = int(arg[:2]) * 60 + int(arg[2:])
+        elif letter == "B":
+            self.brightness = _clamp(value, 0, 100)
+        elif letter == "N":
+            self.light_on_time = arg
+        elif letter == "K":
+            self.light_off_time = arg
+        elif letter == "O":
+            self.light_mode = value
+        elif letter == "L":
+            self.light_range = value
+        elif letter == "S":
+            self.sec_light_sensitivity = value
+        elif letter == "P":
+            self.ph_setpoint = value / 10
+        elif letter == "R" and arg[0] == "1":
+            self.temp_night_setpoint = int(arg[1:]) / 10
+        elif letter == "R":
+            self.temp_setpoint = value / 10
+        elif letter == "U":
+            self.turb_setpoint = _clamp(value, 0, 850)
+        elif letter == "C":
+            self.chemostat = _clamp(value, 0, 100)
+        elif letter == "E":
+            self.external_ph_pump = value
+        elif letter == "F":
+            pass  # anti-foam timer has no effect on the model
+        elif letter == "^":
+            self.reactor_mode = 0
+        elif letter == "Q":
+            self.filter_cycles = value
+        elif letter == "!":
+            pass
+        elif letter == "@":
+            self.audible_alarm = value
+        elif letter == "M":
+            self.reactor_mode = value
+        else:
+            return False
+        return True
+
+
+class _VirtualLine:
+    """
+    One serial line with one or more virtual reactors on it.
+
+    latency:   seconds between command and answer
+    jitter:    random extra delay, uniform in [0, jitter] seconds
+    drop_rate: probability (0-1) that an answer is never sent
+    """
+
+    def __init__(self, *reactors, latency=0.02, jitter=0.0, drop_rate=0.0, seed=None):
+        self.reactors = list(reactors) or [VirtualReactor()]
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self._rng = random.Random(seed)
+        self._inbox = bytearray()
+        self.stats = {"commands": 0, "answered": 0, "dropped": 0, "unknown": 0}
+
+    def _frames(self, data: bytes):
+        """Split incoming bytes into complete commands."""
+        self._inbox.extend(data)
+        while True:
+            start = self._inbox.find(b"/")
+            if start < 0:
+                self._inbox.clear()
+                return
+            del self._inbox[:start]
+            if len(self._inbox) < COMMAND_LENGTH:
+                return
+            frame = bytes(self._inbox[:COMMAND_LENGTH])
+            del self._inbox[:COMMAND_LENGTH]
+            yield frame.decode(errors="ignore")
+
+    def respond(self, cmd: str):
+        """Return (delay, answer bytes) for `cmd`, or None if nothing is sent back."""
+        self.stats["commands"] += 1
+        addr = int(cmd[1:3]) if cmd[1:3].isdigit() else -1
+        targets = self.reactors if addr == 0 else [r for r in self.reactors if r.addr == addr]
+        answers = [r.handle(cmd) for r in targets]
+        answer = next((a for a in answers if a is not None), None)
+        if answer is None:
+            self.stats["unknown"] += 1
+            return None
+        if self.drop_rate and self._rng.random() < self.drop_rate:
+            self.stats["dropped"] += 1
+            return None
+        self.stats["answered"] += 1
+        delay = self.latency + (self._rng.uniform(0.0, self.jitter) if self.jitter else 0.0)
+        return delay, (answer + "\r\n").encode()
+
+
+class VirtualSerial(_VirtualLine):
+    """
+    In-process stand-in for `serial.Serial` connected to virtual reactors.
+
+    Supports blocking `readline()` (Reactor) as well as non-blocking
+    `in_waiting` / `read()` (connection.AsyncSerial).
+    """
+
+    def __init__(self, *reactors, port="VIRTUAL", **kwargs):
+        super().__init__(*reactors, **kwargs)
+        self.port = port
+        self.timeout = 1
+        self.is_open = True
+        self._pending = []              # (ready_at, answer bytes), ordered
+        self._received = bytearray()
+
+    def write(self, data: bytes):
+        for cmd in self._frames(data):
+            reply = self.respond(cmd)
+            if reply is not None:
+                delay, answer = reply
+                ready_at = max(time.monotonic() + delay, self._pending[-1][0] if self._pending else 0.0)
+                self._pending.append((ready_at, answer))
+        return len(data)
+
+    def _arrive(self):
+        now = time.monotonic()
+        while self._pending and self._pending[0][0] <= now:
+            self._received.extend(self._pending.pop(0)[1])
+
+    @property
+    def in_waiting(self):
+        self._arrive()
+        return len(self._received)
+
+    def read(self, size=1) -> bytes:
+        self._arrive()
+        data = bytes(self._received[:size])
+        del self._received[:size]
+        return data
+
+    def readline(self) -> bytes:
+        deadline = time.monotonic() + (self.timeout or 0)
+        self._arrive()
+        while b"\n" not in self._received:
+            if not self._pending or self._pending[0][0] > deadline:
+                time.sleep(max(0.0, deadline - time.monotonic()))
+                self._arrive()
+                return self.read(len(self._received))
+            time.sleep(max(0.0, self._pending[0][0] - time.monotonic()))
+            self._arrive()
+        return self.read(self._received.index(b"\n") + 1)
+
+    def reset_input_buffer(self):
+        self._received.clear()
+
+    def close(self):
+        self.is_open = False
+
+
+class VirtualDevice(_VirtualLine):
+    """
+    Virtual reactors served on a Linux pseudo-terminal.
+
+    `port` is the path of the pty (e.g. /dev/pts/5) that `Reactor.connect(port)`,
+    `ReactorBus.open(port)` or any serial tool can open.
+    """
+
+    def __init__(self, *reactors, **kwargs):
+        super().__init__(*reactors, **kwargs)
+        self._master = None
+        self._slave = None
+        self.port = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._outbox = []               # (send_at, answer bytes), ordered
+
+    def start(self):
+        import tty  # POSIX only
+
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="VirtualDevice", daemon=True)
+        self._thread.start()
+        logging.info(f"Virtual reactor(s) {[r.addr for r in self.reactors]} listening on {self.port}")
+        return self
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join()
+        for fd in (self._master, self._slave):
+            if fd is not None:
+                os.close(fd)
+        self._master = self._slave = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            now = time.monotonic()
+            while self._outbox and self._outbox[0][0] <= now:
+                os.write(self._master, self._outbox.pop(0)[1])
+            wait = 0.05 if not self._outbox else max(0.0, min(0.05, self._outbox[0][0] - now))
+            readable, _, _ = select.select([self._master], [], [], wait)
+            if not readable:
+                continue
+            try:
+                data = os.read(self._master, 1024)
+            except OSError:
+                continue
+            for cmd in self._frames(data):
+                reply = self.respond(cmd)
+                if reply is not None:
+                    delay, answer = reply
+                    send_at = max(time.monotonic() + delay, self._outbox[-1][0] if self._outbox else 0.0)
+                    self._outbox.append((send_at, answer))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve virtual Algaemist reactors on a pseudo-terminal.")
+    parser.add_argument("--addr", type=int, nargs="+", default=[21], help="device address(es) on the line")
+    parser.add_argument("--latency", type=float, default=0.02, help="answer delay in s")
+    parser.add_argument("--jitter", type=float, default=0.0, help="random extra delay in s")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="share of answers that are dropped")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="simulated seconds per real second")
+    args = parser.parse_args()
+
+    reactors = [VirtualReactor(addr=a, time_scale=args.time_scale) for a in args.addr]
+    device = VirtualDevice(*reactors, latency=args.latency, jitter=args.jitter, drop_rate=args.drop_rate)
+    with device:
+        print(f"Virtual reactor(s) {args.addr} listening on {device.port} (Ctrl-C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(device.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,310 @@
+# reactor/web.py
+#
+# Optional browser dashboard: a small HTTP server (standard library only) that
+# serves reactor/static/dashboard.html and pushes the samples of one or more
+# reactors to every open page over a WebSocket. Only the values that changed
+# since the previous sample are sent.
+#
+#     python -m reactor.daemon --addr 21 --http 8080           # from the daemon's poll
+#     python -m reactor.web --daemon /tmp/algaemist.sock       # as a client of a running daemon
+#     >>> Dashboard on http://0.0.0.0:8080/
+#
+# Messages (JSON text frames), per reactor address:
+#     {"addr": 21, "t": "2025-11-13T10:00:02", "full": {"sensors.temp": 20.5, ...}}   first message
+#     {"addr": 21, "t": "2025-11-13T10:00:04", "changes": {"sensors.temp": 20.6}}     afterwards
+#
+# The dashboard is read only; commands go through the GUI or a ReactorClient.
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import queue
+import select
+import socket
+import struct
+import threading
+import time
+import logging
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .snapshot import ReactorSnapshot
+
+
+STATIC_DIR = os.path.join(os.path.dirname(__file__), "static")
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def flatten(snapshot: ReactorSnapshot) -> dict:
+    """Snapshot values as one flat dict: {"sensors.temp": ..., "pumps.co2_pump": ..., "ph_setpoint": ...}."""
+    values = {}
+    for name in ReactorSnapshot.query_names():
+        value = getattr(snapshot, name)
+        if isinstance(value, dict):
+            values.update({f"{name}.{key}": v for key, v in value.items()})
+        else:
+            values[name] = value
+    return values
+
+
+def websocket_frame(payload: bytes, opcode: int = 0x1) -> bytes:
+    """One unmasked, unfragmented frame (server to browser)."""
+    length = len(payload)
+    if length < 126:
+        header = struct.pack(">BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack(">BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack(">BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+class _Feed:
+    """Samples of one reactor as deltas, each encoded once for all viewers."""
+
+    def __init__(self, reactor):
+        self.reactor = reactor
+        self.addr = reactor.addr
+        self.values = {}            # flattened values of the last sample
+        self.timestamp = None
+        self.messages = 0
+        self.subscription = None
+
+    def delta(self, snapshot: ReactorSnapshot) -> bytes | None:
+        """Frame with the values that changed, None if nothing did."""
+        values = flatten(snapshot)
+        changes = {k: v for k, v in values.items() if k not in self.values or self.values[k] != v}
+        self.values, self.timestamp = values, snapshot.timestamp
+        if not changes:
+            return None
+        self.messages += 1
+        return self._frame("changes", changes)
+
+    def full(self) -> bytes:
+        return self._frame("full", self.values)
+
+    def _frame(self, kind: str, values: dict) -> bytes:
+        timestamp = self.timestamp.isoformat() if self.timestamp else None
+        return websocket_frame(json.dumps({"addr": self.addr, "t": timestamp, kind: values}).encode())
+
+
+class _Viewer:
+    """One open dashboard: a bounded queue of frames, resent in full if it fell behind."""
+
+    def __init__(self, maxsize: int):
+        self.frames = queue.Queue(maxsize=maxsize)
+        self.resync = False
+        self.dropped = 0
+
+    def push(self, frame: bytes):
+        try:
+            self.frames.put_nowait(frame)
+        except queue.Full:
+            # Deltas are useless with a gap: drop the backlog, the viewer gets full states next
+            self.dropped += self.frames.qsize() + 1
+            self.clear()
+            self.resync = True
+
+    def clear(self):
+        while True:
+            try:
+                self.frames.get_nowait()
+            except queue.Empty:
+                return
+
+
+class WebDashboard:
+    """
+    Serves the dashboard of `reactors` (Reactor or ReactorClient objects) on
+    http://host:port/ and pushes their samples to the open pages.
+
+    Every sample published on a reactor's sample bus is turned into one delta
+    message, encoded once and queued for each viewer, so viewers cost no
+    serial reads and about no work in the acquisition loop. A viewer that
+    falls `queue_size` messages behind gets the full state again instead.
+    """
+
+    def __init__(self, reactors, host: str = "0.0.0.0", port: int = 8080, queue_size: int = 64):
+        self.host = host
+        self.port = port
+        self.queue_size = queue_size
+        self._feeds = [_Feed(reactor) for reactor in reactors]
+        self._viewers = set()
+        self._lock = threading.Lock()
+        self._server = None
+        self._stop_event = threading.Event()
+
+    def start(self):
+        for feed in self._feeds:
+            feed.subscription = feed.reactor.samples.subscribe(
+                f"web_{feed.addr}", callback=lambda snapshot, feed=feed: self._publish(feed, snapshot))
+            latest = feed.reactor.samples.latest()
+            if latest is not None:
+                feed.delta(latest)
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.dashboard = self
+        self.port = self._server.server_address[1]      # if started on port 0
+        threading.Thread(target=self._server.serve_forever, name="WebDashboard", daemon=True).start()
+        logging.info(f"Dashboard on http://{self.host}:{self.port}/")
+
+    def stop(self):
+        self._stop_event.set()
+        for feed in self._feeds:
+            if feed.subscription is not None:
+                feed.subscription.close()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def _publish(self, feed: _Feed, snapshot: ReactorSnapshot):
+        """Sample bus callback (acquisition thread): queue the delta for every viewer."""
+        with self._lock:
+            frame = feed.delta(snapshot)
+            if frame is None:
+                return
+            for viewer in self._viewers:
+                viewer.push(frame)
+
+    def _full_frames(self) -> list[bytes]:
+        return [feed.full() for feed in self._feeds if feed.timestamp is not None]
+
+    def serve_viewer(self, connection: socket.socket):
+        """Push frames to one WebSocket until it closes (runs on the connection's thread)."""
+        viewer = _Viewer(self.queue_size)
+        with self._lock:
+            frames = self._full_frames()
+            self._viewers.add(viewer)
+        try:
+            connection.sendall(b"".join(frames))
+            while not self._stop_event.is_set():
+                if not self._read_control(connection):
+                    break
+                try:
+                    frame = viewer.frames.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+                if viewer.resync:
+                    with self._lock:
+                        # Queued deltas are older than the full states, applying them after would go back
+                        viewer.resync = False
+                        viewer.clear()
+                        frame = b"".join(self._full_frames())
+                connection.sendall(frame)
+        except OSError:
+            pass        # viewer went away
+        finally:
+            with self._lock:
+                self._viewers.discard(viewer)
+
+    def _read_control(self, connection: socket.socket) -> bool:
+        """Answer what the browser sent (ping, close). False once the connection is closed."""
+        while select.select([connection], [], [], 0)[0]:
+            header = _recv_exactly(connection, 2)
+            if header is None:
+                return False
+            opcode, length = header[0] & 0x0F, header[1] & 0x7F
+            if length == 126:
+                length = struct.unpack(">H", _recv_exactly(connection, 2) or b"\0\0")[0]
+            elif length == 127:
+                length = struct.unpack(">Q", _recv_exactly(connection, 8) or bytes(8))[0]
+            mask = _recv_exactly(connection, 4) if header[1] & 0x80 else bytes(4)
+            payload = _recv_exactly(connection, length) if length else b""
+            if mask is None or payload is None:
+                return False
+            payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+            if opcode == 0x8:
+                connection.sendall(websocket_frame(payload[:2], 0x8))
+                return False
+            if opcode == 0x9:
+                connection.sendall(websocket_frame(payload, 0xA))
+        return True
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "viewers": len(self._viewers),
+                "messages": {feed.addr: feed.messages for feed in self._feeds},
+                "dropped": sum(viewer.dropped for viewer in self._viewers),
+            }
+
+
+def _recv_exactly(connection: socket.socket, size: int) -> bytes | None:
+    data = b""
+    while len(data) < size:
+        chunk = connection.recv(size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        dashboard = self.server.dashboard
+        if self.path in ("/", "/index.html"):
+            with open(os.path.join(STATIC_DIR, "dashboard.html"), "rb") as f:
+                self._reply(200, "text/html; charset=utf-8", f.read())
+        elif self.path == "/api/state":
+            with dashboard._lock:
+                state = {feed.addr: {"t": feed.timestamp.isoformat() if feed.timestamp else None, "values": feed.values}
+                         for feed in dashboard._feeds}
+            self._reply(200, "application/json", json.dumps(state).encode())
+        elif self.path == "/ws" and self.headers.get("Upgrade", "").lower() == "websocket":
+            key = self.headers.get("Sec-WebSocket-Key", "")
+            accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+            self.send_response(101)
+            self.send_header("Upgrade", "websocket")
+            self.send_header("Connection", "Upgrade")
+            self.send_header("Sec-WebSocket-Accept", accept)
+            self.end_headers()
+            self.wfile.flush()
+            dashboard.serve_viewer(self.connection)
+            self.close_connection = True
+        else:
+            self._reply(404, "text/plain", b"Not found")
+
+    def _reply(self, status: int, content_type: str, body: bytes):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug(f"Dashboard {self.address_string()}: {format % args}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the reactor dashboard for running reactor daemons")
+    parser.add_argument("--daemon", action="append", default=None,
+                        help="socket of a reactor daemon, repeat for several reactors (default: the default socket)")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args()
+
+    from .client import ReactorClient
+    from .daemon import DEFAULT_SOCKET
+    from .logger import setup_logger
+    setup_logger()
+    clients = [ReactorClient(path) for path in args.daemon or [DEFAULT_SOCKET]]
+    for client in clients:
+        client.connect()
+    dashboard = WebDashboard(clients, args.host, args.port)
+    dashboard.start()
+    print(f"Dashboard on http://{args.host}:{dashboard.port}/ (Ctrl-C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    dashboard.stop()
+    for client in clients:
+        client.disconnect()
+
+
+if __name__ == "__main__":
+    main()
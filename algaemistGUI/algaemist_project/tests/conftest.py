@@ -0,0 +1,55 @@
+# tests/conftest.py
+#
+# Run from algaemist_project/:
+#     python -m pytest -q
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reactor.reactor import Reactor
+from reactor.virtual_device import VirtualReactor, VirtualSerial
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    """Reactor() and the DataLogger create data/ in the working directory."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def device():
+    """A virtual reactor without sensor noise."""
+    return VirtualReactor(addr=21, noise=0, seed=1)
+
+
+@pytest.fixture
+def reactor(device):
+    """A `Reactor` connected to `device` over an in-process serial line."""
+    reactor = Reactor(addr=21)
+    reactor.ser = VirtualSerial(device, latency=0.0)
+    reactor._connected = True
+    yield reactor
+    reactor.disconnect()
+    reactor.data_logger.close()
+
+
+@pytest.fixture
+def t0():
+    """Start of the logged test data."""
+    return datetime(2025, 11, 13, 12, 0, 0)
+
+
+@pytest.fixture
+def samples(t0):
+    """
+    Ten samples one second apart as the DataLogger hands them to its stores:
+    (timestamp, sensors, pumps, comment), only the first one has a comment.
+    """
+    return [(t0 + timedelta(seconds=i), {"temp": 20.0 + i, "pH": 7.25}, {"heater_pump": float(i)},
+             "start" if i == 0 else None) for i in range(10)]
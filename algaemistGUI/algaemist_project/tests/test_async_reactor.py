@@ -0,0 +1,65 @@
+# tests/test_async_reactor.py
+
+import asyncio
+import time
+
+from reactor.async_reactor import AsyncReactor
+from reactor.connection import AsyncSerial
+from reactor.protocol import QUERIES
+from reactor.virtual_device import VirtualReactor, VirtualSerial
+
+
+def attached(device, latency=0.0):
+    """An `AsyncReactor` talking to `device` through the non-blocking transport."""
+    reactor = AsyncReactor(addr=device.addr)
+    reactor.attach(AsyncSerial(VirtualSerial(device, latency=latency)))
+    return reactor
+
+
+def test_getters_and_setters(device):
+    async def main():
+        reactor = attached(device)
+        assert await reactor.get_ph_setpoint() == 7.5
+        assert await reactor.set_brightness(40)
+        assert await reactor.get_brightness() == 40
+        await reactor.disconnect()
+        return reactor
+
+    reactor = asyncio.run(main())
+    assert device.brightness == 40
+    assert not reactor.connected
+
+
+def test_snapshot_with_an_unanswered_query(device):
+    handle, silent = device.handle, QUERIES["turb_setpoint"].command(21)
+    device.handle = lambda cmd: None if cmd == silent else handle(cmd)
+    snapshot = asyncio.run(attached(device).read_snapshot(timeout=0.2))
+    assert snapshot.turb_setpoint is None and not snapshot.complete
+    assert snapshot.ph_setpoint == 7.5 and snapshot.pumps["heater_pump"] == 0.0
+
+
+def test_reactors_are_read_concurrently():
+    devices = [VirtualReactor(addr=addr, noise=0) for addr in (21, 22, 23)]
+    for i, device in enumerate(devices):
+        device.ph_setpoint = 7.0 + i / 10
+
+    async def main():
+        reactors = [attached(device, latency=0.05) for device in devices]
+        one = reactors[0]
+        # Commands of one reactor wait for each other, their answers do not mix up
+        same = await asyncio.gather(one.get_ph_setpoint(), one.get_temp_setpoint())
+        started = time.monotonic()
+        values = await asyncio.gather(*(r.query_many(["ph_setpoint", "sensors"]) for r in reactors))
+        return same, values, time.monotonic() - started
+
+    same, values, elapsed = asyncio.run(main())
+    assert elapsed < 0.25                   # 6 answers of 50 ms, one after the other would take 0.3 s
+    assert same == [7.0, 20.0]
+    assert [v["ph_setpoint"] for v in values] == [7.0, 7.1, 7.2]
+    assert all(v["sensors"] is not None for v in values)
+
+
+def test_not_connected():
+    reactor = AsyncReactor(addr=21)
+    assert asyncio.run(reactor.query("ph_setpoint")) is None
+    assert asyncio.run(reactor.query_many(["sensors"])) == {"sensors": None}
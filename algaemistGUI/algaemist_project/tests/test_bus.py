@@ -0,0 +1,103 @@
+# tests/test_bus.py
+
+import time
+
+from reactor.bus import ReactorBus
+from reactor.virtual_device import VirtualReactor, VirtualSerial
+
+
+def open_bus(*addrs):
+    devices = [VirtualReactor(addr=addr, noise=0) for addr in addrs]
+    bus = ReactorBus()
+    bus.attach(VirtualSerial(*devices, latency=0.0))
+    return bus, devices
+
+
+def test_each_handle_talks_to_its_address():
+    bus, (d21, d22) = open_bus(21, 22)
+    d22.ph_setpoint = 6.5
+    try:
+        r21, r22 = bus.reactor(21), bus.reactor(22)
+        assert r21.query("ph_setpoint") == 7.5
+        assert r22.query("ph_setpoint") == 6.5
+        assert r21.apply("set_brightness", 40)
+        assert (d21.brightness, d22.brightness) == (40, 25)
+        assert set(bus.stats()["per_address"]) == {21, 22}
+    finally:
+        bus.close()
+
+
+def test_handles_are_shared_per_address():
+    bus, _ = open_bus(21)
+    try:
+        assert bus.reactor(21) is bus.reactor(21)
+        assert bus.reactor(21).connected
+    finally:
+        bus.close()
+
+
+def test_queued_jobs_run_round_robin():
+    bus, _ = open_bus(21, 22)
+    order = []
+    try:
+        # Hold the bus thread until everything is queued
+        gate = bus.submit(21, lambda ser: order.append("gate"))
+        gate.result()
+        with bus._cond:
+            futures = [bus.submit(21, lambda ser, i=i: order.append((21, i))) for i in range(3)]
+            futures.append(bus.submit(22, lambda ser: order.append((22, 0))))
+        for future in futures:
+            future.result(timeout=5)
+        assert order[1:3] == [(21, 0), (22, 0)]
+    finally:
+        bus.close()
+
+
+def test_writes_coalesce_per_handle():
+    bus, (device,) = open_bus(21)
+    try:
+        reactor = bus.reactor(21)
+        # Keep the handle's queue busy, so the three writes wait in it
+        blocker = reactor._commands.submit(lambda: bus.submit(21, lambda ser: time.sleep(0.2)).result())
+        futures = [reactor.submit("set_ph", value) for value in (6.9, 7.0, 7.1)]
+        blocker.result()
+        assert [f.result(timeout=5) for f in futures] == [True, True, True]
+        assert device.ph_setpoint == 7.1
+        assert reactor.command_stats()["coalesced"] == 2
+    finally:
+        bus.close()
+
+
+def test_reconnect_after_disconnect():
+    bus, _ = open_bus(21)
+    try:
+        reactor = bus.reactor(21)
+        reactor.disconnect()
+        assert not reactor.connected
+        assert bus.connected            # the other reactors keep the port
+        reactor.connect()
+        assert reactor.connected
+        assert reactor.query("ph_setpoint") == 7.5
+    finally:
+        bus.close()
+
+
+def test_close_fails_new_commands():
+    bus, _ = open_bus(21)
+    reactor = bus.reactor(21)
+    bus.close()
+    assert not reactor.connected
+    assert reactor.query("ph_setpoint") is None
+
+
+def test_change_address_moves_the_handle():
+    bus, (device,) = open_bus(21)
+    try:
+        reactor = bus.reactor(21)
+        assert reactor.change_address(23)
+        assert device.addr == 23 and reactor.addr == 23
+        assert bus.reactor(23) is reactor
+        assert bus.reactor(21) is not reactor
+        assert reactor.query("ph_setpoint") == 7.5
+    finally:
+        bus.close()
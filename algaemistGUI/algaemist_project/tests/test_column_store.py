@@ -0,0 +1,79 @@
+# tests/test_column_store.py
+
+import math
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from reactor.column_store import ColumnStore, export_csv, import_csv, load_columns, load_dataframe, to_epoch_ms
+from reactor.utils import DataLogger
+
+
+@pytest.fixture
+def path(tmp_path, samples):
+    """A column store holding `samples`, written in chunks of 4 rows."""
+    path = str(tmp_path / "run.cols")
+    store = ColumnStore(path, chunk_rows=4)
+    for sample in samples:
+        store.append(*sample)
+    store.close()
+    return path
+
+
+def test_round_trip_across_chunks(path, samples):
+    columns = load_columns(path)
+    assert columns["timestamp"].tolist() == [to_epoch_ms(timestamp) for timestamp, *_ in samples]
+    assert columns["temp"].tolist() == [sensors["temp"] for _, sensors, _, _ in samples]
+    assert np.isnan(columns["co2"]).all()                  # never logged
+    assert columns["comments"] == {0: "start"}
+
+
+def test_reopened_store_appends(path, t0):
+    store = ColumnStore(path, chunk_rows=4)
+    assert store.rows == 10
+    store.append(t0 + timedelta(seconds=10), {"temp": 30.0}, {})
+    store.close()
+    assert load_columns(path)["temp"].tolist()[-3:] == [28.0, 29.0, 30.0]
+
+
+def test_torn_chunk_is_dropped_on_reopen(path, t0, tmp_path):
+    # A crash while writing the next chunk: the timestamps and one column made it, the rest did not
+    with open(tmp_path / "run.cols" / "timestamp.i8", "ab") as f:
+        np.asarray([to_epoch_ms(t0 + timedelta(seconds=99))] * 2, dtype="<i8").tofile(f)
+    with open(tmp_path / "run.cols" / "temp.f4", "ab") as f:
+        f.write(b"\x00" * 6)
+    with open(tmp_path / "run.cols" / "comments.jsonl", "a") as f:
+        f.write('{"row": 10, "text": "lost"}\n')
+    store = ColumnStore(path, chunk_rows=4)
+    assert store.rows == 10
+    store.append(t0 + timedelta(seconds=10), {"temp": 30.0}, {"heater_pump": 5.0}, comment="after")
+    store.close()
+    columns = load_columns(path)
+    assert columns["timestamp"].tolist()[-2:] == [to_epoch_ms(t0 + timedelta(seconds=i)) for i in (9, 10)]
+    assert columns["temp"].tolist()[-2:] == [29.0, 30.0]
+    assert columns["heater_pump"].tolist()[-2:] == [9.0, 5.0]
+    assert columns["comments"] == {0: "start", 10: "after"}
+
+
+def test_dataframe(path, t0):
+    df = load_dataframe(path)
+    assert df["timestamp"].iloc[0] == t0
+    assert df["comments"].iloc[0] == "start" and df["comments"].isna().sum() == 9
+
+
+def test_csv_export_import_round_trip(path, tmp_path):
+    export_csv(path, str(tmp_path / "run.csv"))
+    import_csv(str(tmp_path / "run.csv"), str(tmp_path / "copy.cols")).close()
+    original, imported = load_columns(path), load_columns(str(tmp_path / "copy.cols"))
+    assert original["comments"] == imported["comments"]
+    for name in ("timestamp", "temp", "pH", "heater_pump", "co2"):
+        np.testing.assert_array_equal(original[name], imported[name])
+
+
+def test_data_logger_writes_the_column_store(tmp_path, t0):
+    logger = DataLogger(str(tmp_path / "data" / "log.csv"), columnar=True)
+    logger.log_values({"temp": 20.5, "pH": 7.1}, {"heater_pump": 0.0}, "note", timestamp=t0)
+    logger.close()
+    columns = load_columns(str(tmp_path / "data" / "log.cols"))
+    assert math.isclose(columns["temp"][0], 20.5) and columns["comments"] == {0: "note"}
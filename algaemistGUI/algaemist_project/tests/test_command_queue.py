@@ -0,0 +1,120 @@
+# tests/test_command_queue.py
+
+import threading
+import time
+
+import pytest
+
+from algaemistGUI.dispatcher import CommandDispatcher
+from reactor.command_queue import READ, WRITE, CommandQueue
+
+
+@pytest.fixture
+def queue():
+    queue = CommandQueue()
+    yield queue
+    queue.close()
+
+
+def hold(queue):
+    """Block the worker with a job until the returned event is set."""
+    release, started = threading.Event(), threading.Event()
+    queue.submit(lambda: (started.set(), release.wait(5)))
+    started.wait(5)
+    return release
+
+
+def test_result_and_exception(queue):
+    assert queue.submit(lambda: 42).result(timeout=5) == 42
+    future = queue.submit(lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        future.result(timeout=5)
+
+
+def test_writes_go_ahead_of_queued_reads(queue):
+    order = []
+    release = hold(queue)
+    futures = [queue.submit(lambda i=i: order.append(("read", i)), READ) for i in range(3)]
+    futures.append(queue.submit(lambda: order.append(("write", 0)), WRITE))
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+    assert order == [("write", 0), ("read", 0), ("read", 1), ("read", 2)]
+
+
+def test_keyed_jobs_coalesce(queue):
+    sent = []
+    release = hold(queue)
+    futures = [queue.submit(lambda v=v: sent.append(v) or v, WRITE, key="set_ph") for v in (6.9, 7.0, 7.1)]
+    release.set()
+    assert [f.result(timeout=5) for f in futures] == [7.1, 7.1, 7.1]
+    assert sent == [7.1]
+    assert queue.stats()["coalesced"] == 2
+
+
+def test_submit_from_a_job_runs_inline(queue):
+    inner = queue.submit(lambda: queue.submit(lambda: "inner").result(timeout=1))
+    assert inner.result(timeout=5) == "inner"
+
+
+def test_run_urgent_lets_writes_through(queue):
+    order = []
+    started, queued = threading.Event(), threading.Event()
+
+    def long_read():
+        started.set()
+        queued.wait(5)
+        order.append("read part 1")
+        queue.run_urgent(READ)
+        order.append("read part 2")
+
+    read = queue.submit(long_read, READ)
+    started.wait(5)
+    write = queue.submit(lambda: order.append("write"), WRITE)
+    queued.set()
+    read.result(timeout=5), write.result(timeout=5)
+    assert order == ["read part 1", "write", "read part 2"]
+    assert queue.stats()["preempted"] == 1
+
+
+def test_close_fails_queued_jobs_and_restarts(queue):
+    release = hold(queue)
+    pending = queue.submit(lambda: "never")
+    threading.Timer(0.05, release.set).start()
+    queue.close("gone")
+    with pytest.raises(ConnectionError):
+        pending.result(timeout=5)
+    assert queue.submit(lambda: "again").result(timeout=5) == "again"
+
+
+def test_stats_count_jobs_per_priority(queue):
+    queue.submit(lambda: None, WRITE).result(timeout=5)
+    queue.submit(lambda: None, READ).result(timeout=5)
+    stats = queue.stats()
+    assert stats["write"]["jobs"] == 1 and stats["read"]["jobs"] == 1
+    assert "mean_ms" in stats["write"]
+
+
+class _Root:
+    """Enough of a Tk root for the dispatcher: callbacks are drained by the test."""
+
+    def after(self, ms, callback):
+        pass
+
+
+def test_gui_writes_coalesce_on_the_reactor(reactor, device):
+    dispatcher = CommandDispatcher(_Root())
+    results = []
+    release = hold(reactor._commands)
+    for value in (6.9, 7.0, 7.1):
+        dispatcher.run(reactor.submit, "set_ph", value, on_done=results.append)
+    time.sleep(0.1)                     # the dispatcher does not wait for the queued writes
+    release.set()
+    deadline = time.monotonic() + 5
+    while len(results) < 3 and time.monotonic() < deadline:
+        dispatcher._drain()
+        time.sleep(0.01)
+    dispatcher.shutdown()
+    assert results == [True, True, True]
+    assert device.ph_setpoint == 7.1
+    assert reactor.command_stats()["coalesced"] == 2
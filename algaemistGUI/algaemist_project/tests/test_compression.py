@@ -0,0 +1,85 @@
+# tests/test_compression.py
+
+import math
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+
+from reactor.compression import CompressionFilter, reconstruct
+from reactor.utils import DataLogger
+
+
+@pytest.fixture
+def feed(t0):
+    """feed(compressor, values): one sample per second from t0, returns the written rows."""
+    def feed(compressor, values):
+        rows = []
+        for i, value in enumerate(values):
+            rows += compressor.add(t0 + timedelta(seconds=i), {"temp": value})
+        return rows + compressor.flush()
+    return feed
+
+
+def test_deadband_writes_only_changes(feed):
+    compressor = CompressionFilter("deadband", {"temp": 0.1})
+    rows = feed(compressor, [20.0, 20.05, 20.08, 20.2, 20.25, 20.0])
+    assert [values["temp"] for _, values, _ in rows] == [20.0, 20.2, 20.0]
+    assert compressor.stats() == {"mode": "deadband", "seen": 6, "written": 3, "ratio": 2.0}
+
+
+def test_comments_new_channels_and_heartbeat_force_a_row(t0):
+    compressor = CompressionFilter("deadband", {"temp": 1.0}, heartbeat=10)
+    assert compressor.add(t0, {"temp": 20.0})
+    assert compressor.add(t0 + timedelta(seconds=1), {"temp": 20.0}, comment="feed") == \
+        [(t0 + timedelta(seconds=1), {"temp": 20.0}, "feed")]
+    assert compressor.add(t0 + timedelta(seconds=2), {"temp": 20.0, "pH": 7.0})
+    assert not compressor.add(t0 + timedelta(seconds=5), {"temp": 20.0, "pH": 7.0})
+    assert compressor.add(t0 + timedelta(seconds=12), {"temp": 20.0, "pH": 7.0})
+
+
+def test_swinging_door_keeps_a_ramp_to_its_ends(feed, t0):
+    compressor = CompressionFilter("swinging_door", {"temp": 0.1})
+    ramp = [20.0 + 0.5 * i for i in range(20)]
+    rows = feed(compressor, ramp)
+    assert [t for t, _, _ in rows] == [t0, t0 + timedelta(seconds=19)]
+
+
+def test_swinging_door_reconstruction_stays_within_the_deadband(feed, t0):
+    deadband = 0.1
+    compressor = CompressionFilter("swinging_door", {"temp": deadband})
+    values = [20.0 + math.sin(i / 10) for i in range(300)]
+    rows = feed(compressor, values)
+    assert len(rows) < len(values) / 5
+    df = pd.DataFrame({"timestamp": [t for t, _, _ in rows], "temp": [v["temp"] for _, v, _ in rows]})
+    timestamps = [t0 + timedelta(seconds=i) for i in range(300)]
+    rebuilt = reconstruct(df, timestamps, method="linear")["temp"]
+    assert max(abs(r - v) for r, v in zip(rebuilt, values)) <= deadband
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        CompressionFilter("zip")
+
+
+def test_data_logger_writes_fewer_rows(tmp_path, t0):
+    path = str(tmp_path / "log.csv")
+    logger = DataLogger(path, buffered=False, compression="deadband", deadbands={"temp": 0.5})
+    for i in range(10):
+        logger.log_values({"temp": 20.0 + 0.1 * i}, {}, timestamp=t0 + timedelta(seconds=i))
+    logger.close()
+    df = pd.read_csv(path)
+    assert df["temp"].tolist() == [20.0, pytest.approx(20.6)]
+
+
+def test_held_sample_stays_in_the_old_file(tmp_path, t0):
+    logger = DataLogger(str(tmp_path / "a.csv"), buffered=False, compression="swinging_door",
+                        deadbands={"temp": 0.5})
+    for i in range(3):
+        logger.log_values({"temp": 20.0 + 0.1 * i}, {}, timestamp=t0 + timedelta(seconds=i))
+    logger.set_path(str(tmp_path / "b.csv"))
+    for i in range(3, 5):
+        logger.log_values({"temp": 20.0 + 0.1 * i}, {}, timestamp=t0 + timedelta(seconds=i))
+    logger.close()
+    assert pd.read_csv(tmp_path / "a.csv")["temp"].tolist() == [20.0, pytest.approx(20.2)]
+    assert pd.read_csv(tmp_path / "b.csv")["temp"].tolist() == [pytest.approx(20.3), pytest.approx(20.4)]
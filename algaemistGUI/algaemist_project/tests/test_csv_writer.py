@@ -0,0 +1,65 @@
+# tests/test_csv_writer.py
+
+import csv
+import threading
+from datetime import timedelta
+
+from reactor.csv_writer import BufferedCSVWriter
+from reactor.utils import DataLogger
+
+
+def read_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+def test_rows_from_several_threads_are_all_written(tmp_path):
+    path = str(tmp_path / "log.csv")
+    writer = BufferedCSVWriter(flush_rows=10, flush_interval=0.05, fsync=False)
+    threads = [threading.Thread(target=lambda t=t: [writer.write(path, [t, i]) for i in range(100)])
+               for t in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert writer.flush()
+    rows = read_rows(path)
+    assert len(rows) == 400
+    for t in range(4):
+        assert [r[1] for r in rows if r[0] == str(t)] == [str(i) for i in range(100)]   # in order per producer
+    writer.close()
+    assert writer.stats()["written"] == 400
+
+
+def test_data_logger_round_trip(tmp_path, t0):
+    path = str(tmp_path / "data" / "log.csv")
+    logger = DataLogger(path)
+    for i in range(3):
+        logger.log_values({"temp": 20.0 + i, "pH": 7.0}, {"heater_pump": 10.0 * i}, "start" if i == 0 else None,
+                          timestamp=t0 + timedelta(seconds=i))
+    logger.close()
+    rows = read_rows(path)
+    assert rows[0][:3] == ["timestamp", "temp", "pH"]
+    assert rows[1] == ["2025-11-13 12:00:00", "20.0", "7.0", "", "", "", "", "0.0", "", "", "", "start"]
+    assert [r[1] for r in rows[1:]] == ["20.0", "21.0", "22.0"]
+
+
+def test_closed_writer_writes_the_queued_rows(tmp_path):
+    path = str(tmp_path / "log.csv")
+    writer = BufferedCSVWriter(flush_rows=1000, flush_interval=60, fsync=False)
+    for i in range(5):
+        writer.write(path, [i])
+    writer.close()
+    assert len(read_rows(path)) == 5
+
+
+def test_set_path_closes_the_old_file(tmp_path, t0):
+    old, new = str(tmp_path / "a.csv"), str(tmp_path / "b.csv")
+    logger = DataLogger(old, flush_rows=1000, flush_interval=60, fsync=False)
+    logger.log_values({"temp": 20.0}, {}, timestamp=t0)
+    logger.set_path(new)
+    assert [r[1] for r in read_rows(old)] == ["temp", "20.0"]      # before close() or the flush interval
+    assert old not in logger.writer._files
+    logger.log_values({"temp": 21.0}, {}, timestamp=t0 + timedelta(seconds=1))
+    logger.close()
+    assert [r[1] for r in read_rows(new)] == ["temp", "21.0"]
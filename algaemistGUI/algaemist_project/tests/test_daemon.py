@@ -0,0 +1,110 @@
+# tests/test_daemon.py
+
+import json
+import socket
+import time
+
+import pytest
+
+from reactor.client import ReactorClient
+from reactor.daemon import ReactorDaemon, encode
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.02)
+    return True
+
+
+@pytest.fixture
+def daemon(reactor, tmp_path):
+    daemon = ReactorDaemon(reactor, str(tmp_path / "daemon.sock"),
+                           intervals={"sensors": 0.2, "pumps": 0.5, "settings": 60},
+                           emergency_log_path=str(tmp_path / ".data" / "emergency_log.csv"))
+    daemon.start()
+    yield daemon
+    daemon.stop()
+
+
+@pytest.fixture
+def sock(daemon):
+    """A socket connected to the daemon, spoken to in the raw protocol."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(10)
+        sock.connect(daemon.socket_path)
+        yield sock
+
+
+@pytest.fixture
+def connection(sock):
+    """send(message) -> reply."""
+    reader = sock.makefile("rb")
+
+    def send(message):
+        sock.sendall(encode(message))
+        return json.loads(reader.readline())
+    return send
+
+
+def test_status_and_calls(connection, device):
+    assert connection({"op": "status"})["result"]["connected"] is True
+    assert connection({"op": "call", "method": "set_ph", "args": [7.1]}) == {"result": True}
+    assert device.ph_setpoint == 7.1
+    assert connection({"op": "call", "method": "get_ph_setpoint"}) == {"result": 7.1}
+
+
+def test_refused_requests(connection):
+    assert "error" in connection({"op": "call", "method": "disconnect"})
+    assert "error" in connection({"op": "call", "target": "data_logger", "method": "close"})
+    assert "error" in connection({"op": "drop_tables"})
+
+
+def test_sample_request(connection):
+    sample = connection({"op": "sample", "max_age": 5})["result"]
+    assert sample["sensors"]["temp"] == pytest.approx(20.5, abs=0.5)
+    assert set(sample["read_at"]) >= {"sensors", "pumps"}
+
+
+def test_stream_carries_snapshots_and_status(sock):
+    sock.sendall(encode({"op": "subscribe"}))
+    messages = [json.loads(line) for line, _ in zip(sock.makefile("rb"), range(4))]
+    assert any("status" in m and m["status"]["connected"] for m in messages)
+    assert any("timestamp" in m for m in messages)
+
+
+def test_client_follows_the_daemon(daemon, reactor, device):
+    client = ReactorClient(daemon.socket_path)
+    client.connect()
+    try:
+        subscription = client.samples.subscribe("test")
+        assert wait_for(lambda: subscription.drain())
+        assert client.set_temp_day(22.5) is True
+        assert device.temp_setpoint == 22.5
+        assert client.sample().sensors is not None
+        assert client.stats()["clients"] >= 1
+    finally:
+        client.disconnect()
+
+
+def test_client_connected_is_streamed(daemon, reactor):
+    client = ReactorClient(daemon.socket_path)
+    client.connect()
+    try:
+        assert wait_for(lambda: client.connected)
+        requests = daemon.requests
+        reactor._connected = False
+        assert wait_for(lambda: not client.connected)
+        reactor._connected = True
+        assert wait_for(lambda: client.connected)
+        assert daemon.requests == requests            # no status requests, only the stream
+    finally:
+        client.disconnect()
+
+
+def test_client_without_daemon(tmp_path):
+    client = ReactorClient(str(tmp_path / "none.sock"), timeout=1)
+    assert not client.connected
+    assert client.get_ph_setpoint() is None
@@ -0,0 +1,93 @@
+# tests/test_follower.py
+
+import os
+from datetime import timedelta
+
+import pytest
+
+from reactor.follower import LogFollower
+
+
+HEADER = "timestamp,temp,pH,comments\n"
+
+
+@pytest.fixture
+def rows(t0):
+    """rows(start, count): CSV lines of one sample per second from t0, temp 20 + second."""
+    def rows(start, count):
+        return "".join(f"{t0 + timedelta(seconds=i):%Y-%m-%d %H:%M:%S},{20 + i},7.0,\n"
+                       for i in range(start, start + count))
+    return rows
+
+
+@pytest.fixture
+def path(tmp_path, rows):
+    """A log with the first three rows."""
+    path = tmp_path / "log.csv"
+    path.write_text(HEADER + rows(0, 3))
+    return path
+
+
+def test_only_new_rows_are_returned(path, rows, t0):
+    follower = LogFollower(str(path))
+    assert follower.read()["temp"].tolist() == [20, 21, 22]
+    assert follower.read().empty
+    with open(path, "a") as f:
+        f.write(rows(3, 2))
+    chunk = follower.read()
+    assert chunk["temp"].tolist() == [23, 24]
+    assert chunk.index[0] == t0 + timedelta(seconds=3)
+    assert follower.rows == 5
+
+
+def test_incomplete_last_line_waits(tmp_path, rows):
+    path = tmp_path / "log.csv"
+    line = rows(0, 1)
+    path.write_text(HEADER + line[:10])
+    follower = LogFollower(str(path))
+    assert follower.read().empty
+    with open(path, "a") as f:
+        f.write(line[10:])
+    assert follower.read()["temp"].tolist() == [20]
+
+
+def test_from_end_skips_existing_rows(path, rows):
+    follower = LogFollower(str(path), from_start=False)
+    assert follower.read().empty
+    with open(path, "a") as f:
+        f.write(rows(3, 1))
+    assert follower.read()["temp"].tolist() == [23]
+
+
+def test_rotated_file_is_followed_from_its_start(path, rows, tmp_path):
+    follower = LogFollower(str(path))
+    follower.read()
+    replacement = tmp_path / "new.csv"
+    replacement.write_text(HEADER + rows(10, 2))
+    os.replace(replacement, path)
+    chunk = follower.read()
+    assert follower.reset
+    assert chunk["temp"].tolist() == [30, 31]
+
+
+def test_truncated_file_is_followed_from_its_start(path, rows):
+    follower = LogFollower(str(path))
+    follower.read()
+    with open(path, "w") as f:          # same inode, shorter
+        f.write(HEADER + rows(5, 1))
+    assert follower.read()["temp"].tolist() == [25]
+    assert follower.reset
+
+
+def test_file_rewritten_in_place_is_followed_from_its_start(path, rows):
+    follower = LogFollower(str(path))
+    follower.read()
+    with open(path, "r+") as f:         # same inode and size, other rows
+        f.write(HEADER + rows(4, 3))
+    assert follower.read()["temp"].tolist() == [24, 25, 26]
+    assert follower.reset
+
+
+def test_missing_file(tmp_path):
+    follower = LogFollower(str(tmp_path / "none.csv"))
+    assert follower.read().empty
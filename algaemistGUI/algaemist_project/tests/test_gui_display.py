@@ -0,0 +1,122 @@
+# tests/test_gui_display.py
+
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+from algaemistGUI import interface_subclasses as guiElements
+from algaemistGUI.gui import AlgaemistGUI
+from reactor.acquisition import AcquisitionService
+from reactor.sample_bus import SampleBus
+from reactor.trend_buffer import TrendBuffer
+
+
+SENSORS = {"temp": 20.5, "pH": 7.3, "light_prim": 120.0, "light_sec": 80.0, "air": 1.2, "co2": 0.05}
+PUMPS = {"heater_pump": 10.0, "cooler_pump": 0.0, "co2_pump": 5.0, "turb_pump": 0.0}
+
+WIDGETS = {
+    guiElements.TemperatureFrame: ("temp_label", "heat_label", "cool_label", "set_pt_label",
+                                   "set_pt_label2", "temp_ctrl_value_label"),
+    guiElements.PHFrame: ("pH_label", "set_pt_label", "ph_base_label", "ph_correction_label", "pH_ctrl_value_label"),
+    guiElements.LightFrame: ("set_pt_label", "lisens1_label", "light_ctrl_menu", "on_set_pt_label",
+                             "off_set_pt_label", "lisens2_label", "sec_sens_menu"),
+    guiElements.GasFrame: ("air_label", "co2_label"),
+    guiElements.ReactorFrame: ("turb_pump_label", "turb_set_pt_label", "chemo_label", "reactor_ctrl_menu"),
+}
+
+
+class _Widget:
+    """A label or option menu that keeps what it was told to show."""
+
+    def __init__(self):
+        self.text = "--"
+        self.value = ""
+
+    def configure(self, text=None, **options):
+        self.text = text
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class _Root:
+    def __init__(self):
+        self.scheduled = []
+
+    def after(self, ms, callback):
+        self.scheduled.append(callback)
+
+    def update(self):
+        pass
+
+    def mainloop(self):
+        pass                # the window is closed right away
+
+
+def frame(cls):
+    """A display frame without Tk: only the widgets its display update touches."""
+    frame = cls.__new__(cls)
+    frame.display = guiElements.DisplayCache()
+    for name in WIDGETS[cls]:
+        setattr(frame, name, _Widget())
+    return frame
+
+
+def gui(bus):
+    """The display loop of the GUI, fed by `bus`, without a window or a reactor."""
+    gui = AlgaemistGUI.__new__(AlgaemistGUI)
+    gui.config_manger = {"chemostat_setpoint": None}
+    gui.root = _Root()
+    gui.gui_samples = bus.subscribe("gui")
+    gui.display_interval = 250
+    gui.trends = TrendBuffer(capacity=16)
+    gui.trend_charts = []
+    gui._trend_read = None
+    gui.coalesced = 0
+    gui.temperature_frame = frame(guiElements.TemperatureFrame)
+    gui.pH_frame = frame(guiElements.PHFrame)
+    gui.light_frame = frame(guiElements.LightFrame)
+    gui.gas_frame = frame(guiElements.GasFrame)
+    gui.reactor_frame = frame(guiElements.ReactorFrame)
+    return gui
+
+
+def test_settings_not_read_yet_are_skipped():
+    bus = SampleBus()
+    display = gui(bus)
+    bus.update({"sensors": SENSORS, "pumps": PUMPS}, datetime(2025, 11, 13, 12, 0, 0))
+    display._show_snapshots()
+    assert display.temperature_frame.temp_label.text == "Current Temp: 20.50 °C"
+    assert display.temperature_frame.set_pt_label.text == "--"
+    assert display.pH_frame.pH_label.text == "Current pH: 7.30"
+    assert display.pH_frame.set_pt_label.text == "--"
+    assert display.light_frame.on_set_pt_label.text == "--"
+    assert display.light_frame.lisens2_label.text == "Sensor 2: 80.0"
+    assert display.gas_frame.co2_label.text == "CO2: 0.05 l/min"
+    assert display.reactor_frame.turb_set_pt_label.text == "--"
+    assert display.root.scheduled == [display._show_snapshots]
+
+
+def test_a_failed_update_keeps_the_display_loop_running():
+    bus = SampleBus()
+    display = gui(bus)
+    display.gas_frame = None
+    bus.update({"sensors": SENSORS, "pumps": PUMPS, "ph_setpoint": 7.5}, datetime(2025, 11, 13, 12, 0, 0))
+    display._show_snapshots()
+    assert display.pH_frame.set_pt_label.text == "Current pH set point: 7.50"
+    assert display.root.scheduled == [display._show_snapshots]
+
+
+def test_closing_the_window_disconnects_the_reactor(reactor):
+    display = gui(reactor.samples)
+    display.reactor = reactor
+    display.acquisition = AcquisitionService(reactor)
+    display.dispatcher = SimpleNamespace(shutdown=lambda: None)
+    display.loop_monitor = SimpleNamespace(stats=dict)
+    display._closing = threading.Event()
+    display.build_trend_charts = lambda: None
+    display.run()
+    assert not reactor.connected and not reactor.ser.is_open
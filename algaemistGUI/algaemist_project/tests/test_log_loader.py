@@ -0,0 +1,60 @@
+# tests/test_log_loader.py
+
+import os
+
+import pandas as pd
+import pytest
+
+from reactor import log_loader
+
+
+HEADER = "timestamp,temp,pH,comments\n"
+
+
+def write_log(path, *rows):
+    with open(path, "w") as f:
+        f.write(HEADER + "".join(rows))
+
+
+def no_parsing(*args, **kwargs):
+    raise AssertionError("parsed again instead of using the cache")
+
+
+def test_unchanged_log_is_read_from_the_cache(tmp_path, monkeypatch):
+    path = str(tmp_path / "run.csv")
+    write_log(path, "2025-11-13 12:00:00,20.5,7.1,start\n", "2025-11-13 12:00:10,20.6,,\n")
+    parsed = log_loader.load(path)
+    assert os.path.exists(tmp_path / ".cache" / "run.csv.npz")
+    monkeypatch.setattr(log_loader, "parse_csv", no_parsing)
+    cached = log_loader.load(path)
+    pd.testing.assert_frame_equal(cached, parsed)
+    assert cached["comments"].iloc[0] == "start" and cached["comments"].isna().iloc[1]
+
+
+def test_grown_log_is_parsed_again(tmp_path):
+    path = str(tmp_path / "run.csv")
+    write_log(path, "2025-11-13 12:00:00,20.5,7.1,\n")
+    assert len(log_loader.load(path)) == 1
+    with open(path, "a") as f:
+        f.write("2025-11-13 12:00:10,20.6,7.2,\n")
+    df = log_loader.load(path)
+    assert df["temp"].tolist() == [20.5, pytest.approx(20.6)]
+
+
+def test_rewritten_log_of_the_same_size_is_parsed_again(tmp_path):
+    path = str(tmp_path / "run.csv")
+    write_log(path, "2025-11-13 12:00:00,20.5,7.1,\n")
+    log_loader.load(path)
+    mtime = os.stat(path).st_mtime_ns
+    write_log(path, "2025-11-13 12:00:00,21.5,7.1,\n")
+    os.utime(path, ns=(mtime + 1_000_000_000, mtime + 1_000_000_000))    # a coarse file system clock
+    assert log_loader.load(path)["temp"].tolist() == [21.5]
+
+
+def test_clear_cache(tmp_path):
+    path = str(tmp_path / "run.csv")
+    write_log(path, "2025-11-13 12:00:00,20.5,7.1,\n")
+    log_loader.load(path)
+    log_loader.clear_cache(path)
+    assert not os.path.exists(tmp_path / ".cache" / "run.csv.npz")
+    log_loader.clear_cache(path)          # no cache is fine too
@@ -0,0 +1,77 @@
+# tests/test_offset_index.py
+
+import os
+from datetime import timedelta
+
+import pytest
+
+from reactor.log_loader import load
+from reactor.offset_index import OffsetIndex, read_range
+from reactor.utils import DataLogger
+
+
+@pytest.fixture
+def write_log(t0):
+    """write_log(path, count, start=0): one row per minute from t0 + start minutes, temp = minute."""
+    def write_log(path, count, start=0):
+        logger = DataLogger(path, buffered=False)
+        for i in range(start, start + count):
+            logger.log_values({"temp": float(i), "pH": 7.0}, {"heater_pump": 0.0},
+                              timestamp=t0 + timedelta(minutes=i))
+        logger.close()
+    return write_log
+
+
+@pytest.mark.parametrize("start, end", [(100, 160), (None, 5), (995, None), (-1440, -60)])
+def test_range_matches_the_full_log(tmp_path, write_log, t0, start, end):
+    path = str(tmp_path / "log.csv")
+    write_log(path, 1000)
+    first = None if start is None else t0 + timedelta(minutes=start)
+    last = None if end is None else t0 + timedelta(minutes=end)
+    expected = load(path, cache=False)
+    if first is not None:
+        expected = expected[expected.index >= first]
+    if last is not None:
+        expected = expected[expected.index < last]
+    result = OffsetIndex(path, every=64).range(first, last, ["temp"])
+    assert result["temp"].tolist() == expected["temp"].tolist()
+
+
+def test_only_the_window_is_read(tmp_path, write_log, t0):
+    path = str(tmp_path / "log.csv")
+    write_log(path, 1000)
+    index = OffsetIndex(path, every=64)
+    index.update()
+    start, end = index.byte_range(t0 + timedelta(minutes=500), t0 + timedelta(minutes=510))
+    assert end - start < os.path.getsize(path) / 5
+    assert index.stats()["entries"] == 16
+
+
+def test_index_is_saved_and_extended(tmp_path, write_log, t0):
+    path = str(tmp_path / "log.csv")
+    write_log(path, 200)
+    OffsetIndex(path, every=64).update()
+    assert os.path.exists(os.path.join(str(tmp_path), ".cache", "log.csv.idx"))
+    write_log(path, 100, start=200)
+    rows = read_range(path, t0 + timedelta(minutes=250), t0 + timedelta(minutes=260), every=64)
+    assert rows["temp"].tolist() == [float(i) for i in range(250, 260)]
+
+
+def test_replaced_log_rebuilds_the_index(tmp_path, write_log, t0):
+    path = str(tmp_path / "log.csv")
+    write_log(path, 300)
+    OffsetIndex(path, every=64).update()
+    os.remove(path)
+    write_log(path, 300, start=1000)
+    rows = read_range(path, t0 + timedelta(minutes=1100), t0 + timedelta(minutes=1102), every=64)
+    assert rows["temp"].tolist() == [1100.0, 1101.0]
+
+
+def test_data_logger_keeps_the_index(tmp_path, t0):
+    path = str(tmp_path / "log.csv")
+    logger = DataLogger(path, buffered=False, index=True)
+    for i in range(50):
+        logger.log_values({"temp": float(i)}, {}, timestamp=t0 + timedelta(minutes=i))
+    rows = logger.offset_index.range(t0 + timedelta(minutes=10), t0 + timedelta(minutes=12), ["temp"])
+    assert rows["temp"].tolist() == [10.0, 11.0]
+    logger.close()
@@ -0,0 +1,40 @@
+# tests/test_query_many.py
+
+import pytest
+
+from reactor.protocol import QUERIES
+
+
+def test_one_transaction_reads_every_value(reactor, device):
+    values = reactor.query_many(["sensors", "pumps", "ph_setpoint", "light_on_time", "/21i0000"])
+    assert values["sensors"]["temp"] == pytest.approx(device.temp, abs=0.1)
+    assert values["pumps"]["heater_pump"] == 0.0
+    assert values["ph_setpoint"] == 7.5
+    assert values["light_on_time"] == "0800"
+    assert values["/21i0000"] == "/21iAS-100;VR;1.0"         # raw commands return the raw answer
+    assert reactor.ser.stats["commands"] == 5
+
+
+def test_unanswered_query_does_not_fail_the_batch(reactor, device):
+    handle, silent = device.handle, QUERIES["ph_setpoint"].command(21)
+    device.handle = lambda cmd: None if cmd == silent else handle(cmd)
+    values = reactor.query_many(["temp_setpoint", "ph_setpoint", "brightness"], timeout=0.2)
+    assert values == {"temp_setpoint": 20.0, "ph_setpoint": None, "brightness": 25}
+
+
+def test_answer_to_another_command_is_not_used(reactor, device):
+    handle, wrong = device.handle, QUERIES["temp_setpoint"].command(21)
+    device.handle = lambda cmd: handle(wrong) if cmd == QUERIES["ph_setpoint"].command(21) else handle(cmd)
+    values = reactor.query_many(["ph_setpoint", "brightness"], timeout=0.2)
+    assert values == {"ph_setpoint": None, "brightness": 25}
+
+
+def test_read_snapshot_publishes_the_values(reactor):
+    snapshot = reactor.read_snapshot()
+    assert snapshot.complete
+    assert reactor.samples.latest().ph_setpoint == 7.5
+
+
+def test_not_connected(reactor):
+    reactor._connected = False
+    assert reactor.query_many(["sensors", "ph_setpoint"]) == {"sensors": None, "ph_setpoint": None}
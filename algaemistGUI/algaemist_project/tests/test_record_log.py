@@ -0,0 +1,68 @@
+# tests/test_record_log.py
+
+import math
+import os
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from reactor.column_store import to_epoch_ms
+from reactor.record_log import HEADER, RECORD, RecordLog, load_dataframe, load_records
+from reactor.utils import DataLogger
+
+
+@pytest.fixture
+def path(tmp_path, samples):
+    """A record log holding `samples`, flushed every 4 records."""
+    path = str(tmp_path / "run.rec")
+    log = RecordLog(path, flush_rows=4)
+    for sample in samples:
+        log.append(*sample)
+    log.close()
+    return path
+
+
+def test_round_trip(path, samples):
+    assert os.path.getsize(path) == HEADER.size + 10 * RECORD.size
+    records, comments = load_records(path)
+    assert records["timestamp"].tolist() == [to_epoch_ms(timestamp) for timestamp, *_ in samples]
+    assert records["temp"].tolist() == [sensors["temp"] for _, sensors, _, _ in samples]
+    assert records["pH"][0] == np.float32(7.25)
+    assert np.isnan(records["air"]).all()
+    assert comments == {0: "start"}
+
+
+def test_reopened_log_appends(path, t0):
+    log = RecordLog(path)
+    assert log.records == 10
+    log.append(t0 + timedelta(seconds=10), {"temp": 30.0}, {}, comment="end")
+    log.close()
+    records, comments = load_records(path)
+    assert records["temp"].tolist()[-2:] == [29.0, 30.0]
+    assert comments == {0: "start", 10: "end"}
+
+
+def test_torn_record_is_dropped(path, t0):
+    with open(path, "ab") as f:
+        f.write(b"\0" * 10)                 # crash in the middle of a record
+    log = RecordLog(path)
+    log.append(t0 + timedelta(seconds=10), {"temp": 30.0}, {})
+    log.close()
+    assert load_records(path)[0]["temp"].tolist()[-2:] == [29.0, 30.0]
+
+
+def test_other_files_are_refused(tmp_path):
+    path = tmp_path / "run.rec"
+    path.write_bytes(b"x" * 100)
+    with pytest.raises(ValueError):
+        load_records(str(path))
+
+
+def test_dataframe_and_data_logger(tmp_path, t0):
+    logger = DataLogger(str(tmp_path / "data" / "log.csv"), records=True)
+    logger.log_values({"temp": 20.5}, {"co2_pump": 1.0}, "note", timestamp=t0)
+    logger.close()
+    df = load_dataframe(str(tmp_path / "data" / "log.rec"))
+    assert df["timestamp"].iloc[0] == t0
+    assert math.isclose(df["temp"].iloc[0], 20.5) and df["comments"].iloc[0] == "note"
@@ -0,0 +1,71 @@
+# tests/test_rolling_log.py
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from reactor.rolling_log import SEGMENT_FORMAT, RollingLog
+from reactor.utils import DataLogger
+
+
+HEADER = ["timestamp", "temp", "pH"]
+
+
+@pytest.fixture
+def log(tmp_path):
+    """An emergency log keeping the last 72 hours."""
+    return RollingLog(str(tmp_path / "emergency_log"), HEADER, hours=72)
+
+
+def test_rows_are_split_into_hourly_segments(log):
+    now = datetime.now().replace(minute=30, second=0, microsecond=0)
+    log.append([20.0, 7.0], now - timedelta(hours=1))
+    log.append([20.5, 7.1], now)
+    log.append([21.0, 7.2], now + timedelta(minutes=10))
+    assert len(log.segments()) == 2
+    rows = list(log.rows())
+    assert rows[0] == HEADER
+    assert [r[1] for r in rows[1:]] == ["20.0", "20.5", "21.0"]
+
+
+def test_retention_deletes_whole_segments(tmp_path):
+    log = RollingLog(str(tmp_path / "emergency_log"), HEADER, hours=2)
+    now = datetime.now()
+    for hours_ago in (5, 4, 1, 0):
+        log.append([20.0, 7.0], now - timedelta(hours=hours_ago))
+    names = [os.path.basename(p) for p in log.segments()]
+    assert len(names) == 2
+    assert names[0] == (now - timedelta(hours=1)).strftime(SEGMENT_FORMAT) + ".csv"
+
+
+def test_rows_since(log):
+    now = datetime.now().replace(microsecond=0)
+    for minutes_ago in (90, 30, 5):
+        log.append([float(minutes_ago), 7.0], now - timedelta(minutes=minutes_ago))
+    rows = list(log.rows(since=now - timedelta(minutes=45)))[1:]
+    assert [r[1] for r in rows] == ["30.0", "5.0"]
+
+
+def test_export_and_import_round_trip(log, tmp_path):
+    now = datetime.now().replace(microsecond=0)
+    for minutes_ago in (120, 60, 0):
+        log.append([float(minutes_ago), 7.0], now - timedelta(minutes=minutes_ago))
+    log.export_csv(str(tmp_path / "export.csv"))
+    copy = RollingLog(str(tmp_path / "copy"), HEADER, hours=72)
+    copy.import_csv(str(tmp_path / "export.csv"))
+    assert list(copy.rows()) == list(log.rows())
+
+
+def test_data_logger_moves_an_old_single_file_log(tmp_path):
+    path = str(tmp_path / ".data" / "emergency_log.csv")
+    os.makedirs(os.path.dirname(path))
+    now = datetime.now().replace(microsecond=0)
+    with open(path, "w") as f:
+        f.write("timestamp,temp,pH,light_prim,light_sec,air,co2,heater_pump,cooler_pump,co2_pump,turb_pump\n")
+        f.write(f"{now:%Y-%m-%d %H:%M:%S},20.0,7.0,1,2,3,4,5,6,7,8\n")
+    logger = DataLogger(str(tmp_path / "data" / "log.csv"), buffered=False)
+    logger.max_log_values({"temp": 21.0, "pH": 7.1}, {"heater_pump": 0.0}, path=path)
+    rows = logger.retention_rows(path)
+    assert [values["temp"] for _, values in rows] == [20.0, 21.0]
+    assert os.path.exists(path + ".bak") and not os.path.exists(path)
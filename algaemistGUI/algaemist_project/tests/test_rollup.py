@@ -0,0 +1,57 @@
+# tests/test_rollup.py
+
+import csv
+import math
+from datetime import datetime
+
+from reactor.rollup import Rollups, load_tier, rollup_path
+
+
+def at(minute, second=0):
+    return datetime(2025, 11, 13, 12, minute, second)
+
+
+def test_buckets_start_at_whole_minutes(tmp_path):
+    log = str(tmp_path / "run.csv")
+    rollups = Rollups(rollup_path(log), tiers={"1min": 60, "10min": 600})
+    for timestamp in (at(0, 59), at(1), at(9, 59), at(10)):
+        rollups.append(timestamp, {"temp": 20.0}, {})
+    rollups.close()
+    minutes = load_tier(log, "1min")
+    assert [t.strftime("%H:%M:%S") for t in minutes["timestamp"]] == ["12:00:00", "12:01:00", "12:09:00", "12:10:00"]
+    ten_minutes = load_tier(log, "10min")
+    assert [t.strftime("%H:%M") for t in ten_minutes["timestamp"]] == ["12:00", "12:10"]
+    assert ten_minutes["temp_count"].tolist() == [3, 1]
+
+
+def test_mean_min_max_skip_missing_values(tmp_path):
+    log = str(tmp_path / "run.csv")
+    rollups = Rollups(rollup_path(log), tiers={"1min": 60})
+    rollups.append(at(0, 0), {"temp": 20.0, "pH": 7.0}, {"heater_pump": 0.0})
+    rollups.append(at(0, 20), {"temp": 22.0, "pH": None}, {"heater_pump": 50.0})
+    rollups.append(at(0, 40), {"temp": 27.0, "pH": math.nan}, {})
+    rollups.close()
+    row = load_tier(log, "1min").iloc[0]
+    assert (row["temp_mean"], row["temp_min"], row["temp_max"], row["temp_count"]) == (23.0, 20.0, 27.0, 3)
+    assert (row["pH_mean"], row["pH_count"]) == (7.0, 1)
+    assert (row["heater_pump_mean"], row["heater_pump_max"], row["heater_pump_count"]) == (25.0, 50.0, 2)
+    assert row["co2_count"] == 0 and math.isnan(row["co2_mean"])
+
+
+def test_reopened_rollups_merge_the_continued_bucket(tmp_path):
+    log = str(tmp_path / "run.csv")
+    rollups = Rollups(rollup_path(log), tiers={"1min": 60})
+    rollups.append(at(0, 10), {"temp": 20.0}, {})
+    rollups.append(at(0, 20), {"temp": 21.0}, {})
+    rollups.close()                         # restart in the middle of the 12:00 bucket
+    rollups = Rollups(rollup_path(log), tiers={"1min": 60})
+    rollups.append(at(0, 30), {"temp": 25.0}, {})
+    rollups.append(at(1, 0), {"temp": 30.0}, {})
+    rollups.close()
+    with open(rollups.tier_path("1min"), newline="") as f:
+        assert sum(1 for row in csv.reader(f) if row[0] == "timestamp") == 1     # one header
+    df = load_tier(log, "1min")
+    assert len(df) == 2
+    first = df.iloc[0]
+    assert (first["temp_mean"], first["temp_min"], first["temp_max"], first["temp_count"]) == (22.0, 20.0, 25.0, 3)
+    assert df["temp_mean"].iloc[1] == 30.0
@@ -0,0 +1,134 @@
+# tests/test_sample_bus.py
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from reactor.acquisition import AcquisitionService
+from reactor.reactor import Reactor
+from reactor.sample_bus import SampleBus
+from reactor.snapshot import ReactorSnapshot
+from reactor.virtual_device import VirtualSerial
+
+
+SENSORS = {"temp": 20.5, "pH": 7.3}
+PUMPS = {"heater_pump": 0.0}
+
+
+def test_update_merges_into_the_latest_sample(t0):
+    bus = SampleBus()
+    bus.update({"sensors": SENSORS}, t0)
+    snapshot = bus.update({"pumps": PUMPS, "ph_setpoint": 7.5}, t0 + timedelta(seconds=5))
+    assert snapshot.sensors == SENSORS and snapshot.pumps == PUMPS and snapshot.ph_setpoint == 7.5
+    assert snapshot.timestamp == t0 + timedelta(seconds=5)
+    assert bus.latest() is snapshot
+    assert bus.stats()["published"] == 2
+
+
+def test_values_not_read_again_keep_their_read_time(t0):
+    bus = SampleBus()
+    bus.update({"sensors": SENSORS}, t0)
+    snapshot = bus.update({"pumps": PUMPS}, t0 + timedelta(seconds=30))
+    assert snapshot.read_time("sensors") == t0
+    assert snapshot.read_time("pumps") == t0 + timedelta(seconds=30)
+    now = t0 + timedelta(seconds=30)
+    assert snapshot.fresh(["pumps"], 10, now=now)
+    assert not snapshot.fresh(["sensors", "pumps"], 10, now=now)
+    assert not snapshot.fresh(["brightness"], 10, now=now)     # never read
+
+
+def test_read_at_overrides_the_read_time(t0):
+    bus = SampleBus()
+    read = t0 - timedelta(seconds=3)
+    snapshot = bus.update({"sensors": SENSORS}, t0, read_at={"sensors": read})
+    assert snapshot.read_time("sensors") == read
+
+
+def test_queue_subscription_drains_and_counts_drops(t0):
+    bus = SampleBus()
+    subscription = bus.subscribe("gui", maxsize=2)
+    for i in range(3):
+        bus.update({"sensors": {"temp": float(i)}}, t0 + timedelta(seconds=i))
+    assert [s.sensors["temp"] for s in subscription.drain()] == [1.0, 2.0]
+    assert subscription.drain() == []
+    assert subscription.stats() == {"delivered": 3, "dropped": 1, "queued": 0}
+
+
+def test_callback_every_and_fields(t0):
+    bus = SampleBus()
+    delivered = []
+    bus.subscribe("log", callback=delivered.append, every=60, fields=("sensors", "pumps"))
+    bus.update({"sensors": SENSORS}, t0)                                  # no pumps yet
+    bus.update({"pumps": PUMPS}, t0 + timedelta(seconds=1))
+    bus.update({"sensors": SENSORS}, t0 + timedelta(seconds=30))          # too soon
+    bus.update({"sensors": SENSORS}, t0 + timedelta(seconds=61))
+    assert [s.timestamp for s in delivered] == [t0 + timedelta(seconds=1), t0 + timedelta(seconds=61)]
+
+
+def test_max_age_holds_back_stale_values(t0):
+    bus = SampleBus()
+    delivered = []
+    bus.subscribe("emergency_log", callback=delivered.append, fields=("sensors", "pumps"), max_age=10)
+    bus.update({"sensors": SENSORS, "pumps": PUMPS}, t0)
+    bus.update({"ph_setpoint": 7.5}, t0 + timedelta(seconds=60))          # sensors, pumps a minute old
+    bus.update({"sensors": SENSORS}, t0 + timedelta(seconds=61))          # pumps still stale
+    bus.update({"pumps": PUMPS}, t0 + timedelta(seconds=62))
+    assert [s.timestamp for s in delivered] == [t0, t0 + timedelta(seconds=62)]
+
+
+def test_failing_callback_does_not_stop_the_others(t0):
+    bus = SampleBus()
+    delivered = []
+    bus.subscribe("broken", callback=lambda snapshot: 1 / 0)
+    bus.subscribe("ok", callback=delivered.append)
+    bus.update({"sensors": SENSORS}, t0)
+    assert len(delivered) == 1
+
+
+def test_unsubscribe(t0):
+    bus = SampleBus()
+    subscription = bus.subscribe("gui")
+    subscription.close()
+    bus.update({"sensors": SENSORS}, t0)
+    assert subscription.drain() == []
+    assert bus.stats()["subscribers"] == {}
+
+
+def test_snapshot_dict_round_trip(t0):
+    snapshot = ReactorSnapshot(timestamp=t0, sensors=SENSORS, pumps=PUMPS, ph_setpoint=7.5,
+                               read_at={"sensors": t0 - timedelta(seconds=2)})
+    assert ReactorSnapshot.from_dict(snapshot.to_dict()) == snapshot
+
+
+def test_reactor_sample_is_shared_and_not_stale(reactor, device):
+    first = reactor.sample(max_age=60)
+    assert first.sensors["temp"] == pytest.approx(device.temp, abs=0.01)
+    commands = reactor.ser.stats["commands"]
+    assert reactor.sample(max_age=60) == first            # fresh enough, no serial traffic
+    assert reactor.ser.stats["commands"] == commands
+
+    device.handle = lambda cmd: None                    # the reactor stops answering
+    stale = reactor.sample(max_age=0)
+    assert stale.sensors is None and stale.pumps is None
+
+
+def test_sensors_channel_reads_only_sensors(device):
+    reactor = Reactor(addr=21, cache_ttl=0.01)          # settings expire between two sensor reads
+    reactor.ser = VirtualSerial(device, latency=0.0)
+    reactor._connected = True
+    sent = []
+    handle = device.handle
+    device.handle = lambda cmd: sent.append(cmd[3]) or handle(cmd)
+    acquisition = AcquisitionService(reactor, intervals={"sensors": 0.05, "pumps": 3600, "settings": 3600})
+    try:
+        acquisition.start()
+        time.sleep(1.5)                                 # every channel was read once
+        sent.clear()
+        time.sleep(0.5)
+        assert sent and set(sent) == {"x"}
+        assert acquisition.latest().fresh(["sensors"], 1)
+    finally:
+        acquisition.stop()
+        reactor.disconnect()
+        reactor.data_logger.close()
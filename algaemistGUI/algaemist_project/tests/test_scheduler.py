@@ -0,0 +1,73 @@
+# tests/test_scheduler.py
+
+from reactor.scheduler import PollScheduler
+
+
+class Clock:
+    """A monotonic clock the test moves by hand."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ticks_follow_the_deadline_grid():
+    clock = Clock()
+    scheduler = PollScheduler(clock=clock)
+    runs = []
+
+    def poll():
+        runs.append(clock.now)
+        clock.now += 0.5                    # the poll takes half a second
+
+    scheduler.add_channel("sensors", 2, poll)
+    assert scheduler.run_pending() == 1.5
+    clock.now = 1.0
+    assert scheduler.run_pending() == 1.0
+    clock.now = 2.5                         # woken up late
+    assert scheduler.run_pending() == 1.0   # next deadline is still 4.0, not 2.5 + 2
+    assert runs == [0.0, 2.5]
+    stats = scheduler.stats()["sensors"]
+    assert stats["runs"] == 2 and stats["late"] == 1 and stats["missed"] == 0
+    assert stats["max_lateness_s"] == 0.5 and stats["last_duration_s"] == 0.5
+
+
+def test_overrun_catches_up_once_and_counts_missed_ticks():
+    clock = Clock()
+    scheduler = PollScheduler(clock=clock)
+    runs = []
+
+    def poll():
+        runs.append(clock.now)
+        if len(runs) == 1:
+            clock.now += 3.5                # the first poll overruns three deadlines
+
+    scheduler.add_channel("sensors", 1, poll)
+    assert scheduler.run_pending() == 0.5
+    assert runs == [0.0, 3.5]               # one catch-up run, not three back to back
+    stats = scheduler.stats()["sensors"]
+    assert stats["runs"] == 2 and stats["missed"] == 2 and stats["late"] == 1
+
+
+def test_channels_poll_at_their_own_rate():
+    clock = Clock()
+    scheduler = PollScheduler(clock=clock)
+    runs = []
+    scheduler.add_channel("sensors", 2, lambda: runs.append(("sensors", clock.now)))
+    scheduler.add_channel("settings", 5, lambda: runs.append(("settings", clock.now)), offset=1)
+    for second in range(12):
+        clock.now = float(second)
+        scheduler.run_pending()
+    assert [t for name, t in runs if name == "sensors"] == [0, 2, 4, 6, 8, 10]
+    assert [t for name, t in runs if name == "settings"] == [1, 6, 11]
+
+    scheduler.set_interval("sensors", 4)    # next tick one new interval after the last one (10)
+    scheduler.trigger("settings")
+    clock.now = 12.0
+    scheduler.run_pending()
+    clock.now = 14.0
+    scheduler.run_pending()
+    assert runs[-2:] == [("settings", 12.0), ("sensors", 14.0)]
+    assert scheduler.stats()["sensors"]["interval_s"] == 4
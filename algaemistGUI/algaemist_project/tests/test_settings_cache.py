@@ -0,0 +1,86 @@
+# tests/test_settings_cache.py
+
+import time
+
+from reactor.cache import SettingsCache
+from reactor.reactor import Reactor
+from reactor.virtual_device import VirtualSerial
+
+
+def test_get_put_and_ttl():
+    cache = SettingsCache(ttl=0.05)
+    assert cache.get("ph_setpoint", "miss") == "miss"
+    cache.put("ph_setpoint", 7.5)
+    assert cache.get("ph_setpoint") == 7.5
+    assert cache.contains("ph_setpoint")
+    time.sleep(0.06)
+    assert cache.get("ph_setpoint", "miss") == "miss"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_falsy_values_are_cached_but_not_none():
+    cache = SettingsCache()
+    cache.put("light_mode", 0)
+    cache.put("turb_setpoint", None)
+    assert cache.get("light_mode", "miss") == 0
+    assert cache.get("turb_setpoint", "miss") == "miss"
+
+
+def test_ttl_zero_disables_the_cache():
+    cache = SettingsCache(ttl=0)
+    cache.put("ph_setpoint", 7.5)
+    assert cache.get("ph_setpoint") is None
+
+
+def test_invalidate():
+    cache = SettingsCache()
+    cache.put("ph_setpoint", 7.5)
+    cache.put("temp_setpoint", 20.0)
+    cache.invalidate("ph_setpoint")
+    assert not cache.contains("ph_setpoint") and cache.contains("temp_setpoint")
+    cache.invalidate()
+    assert not cache.contains("temp_setpoint")
+
+
+def test_settings_are_read_once(reactor):
+    assert reactor.query("ph_setpoint") == 7.5
+    commands = reactor.ser.stats["commands"]
+    assert reactor.query("ph_setpoint") == 7.5
+    assert reactor.query_many(["ph_setpoint", "sensors"])["ph_setpoint"] == 7.5
+    assert reactor.ser.stats["commands"] == commands + 1      # only the sensors
+
+
+def test_setter_writes_through(reactor, device):
+    reactor.query("temp_setpoint")
+    assert reactor.apply("set_temp_day", 22.5)
+    commands = reactor.ser.stats["commands"]
+    assert reactor.query("temp_setpoint") == 22.5 == device.temp_setpoint
+    assert reactor.ser.stats["commands"] == commands
+
+
+def test_unconfirmed_write_drops_the_entry(reactor, device):
+    reactor.query("turb_setpoint")
+    device.handle = lambda cmd: None         # the reactor stops answering
+    reactor.apply("set_turbidity", 400)
+    assert not reactor.settings_cache.contains("turb_setpoint")
+
+
+def test_device_changes_show_after_the_ttl(device):
+    reactor = Reactor(addr=21, cache_ttl=0.05)
+    reactor.ser = VirtualSerial(device, latency=0.0)
+    reactor._connected = True
+    try:
+        assert reactor.query("ph_setpoint") == 7.5
+        device.ph_setpoint = 6.0                 # changed on the device panel
+        assert reactor.query("ph_setpoint") == 7.5
+        time.sleep(0.06)
+        assert reactor.query("ph_setpoint") == 6.0
+    finally:
+        reactor.disconnect()
+        reactor.data_logger.close()
+
+
+def test_control_states_are_not_cached(reactor, device):
+    assert reactor.query("ph_control_on") is True
+    device.ph_control_on = False
+    assert reactor.query("ph_control_on") is False
@@ -0,0 +1,69 @@
+# tests/test_sqlite_store.py
+
+from datetime import datetime, timedelta
+
+from reactor.sqlite_store import SQLiteStore
+from reactor.utils import DataLogger
+
+
+def filled_store(path, t0, count=10, **kwargs):
+    store = SQLiteStore(path, batch_rows=4, **kwargs)
+    for i in range(count):
+        store.append(t0 + timedelta(minutes=i), {"temp": 20.0 + i, "pH": 7.0}, {"heater_pump": float(i)},
+                     comment="start" if i == 0 else None)
+    return store
+
+
+def test_range_round_trip(tmp_path, t0):
+    store = filled_store(str(tmp_path / "run.sqlite"), t0)
+    rows = store.range()
+    assert len(rows) == 10
+    assert rows[0] == {"timestamp": t0, "temp": 20.0, "pH": 7.0, "light_prim": None, "light_sec": None,
+                       "air": None, "co2": None, "heater_pump": 0.0, "cooler_pump": None,
+                       "co2_pump": None, "turb_pump": None}
+    assert store.events() == [(t0, "start")]
+    store.close()
+
+
+def test_time_window_and_channels(tmp_path, t0):
+    store = filled_store(str(tmp_path / "run.sqlite"), t0)
+    rows = store.range(t0 + timedelta(minutes=2), t0 + timedelta(minutes=5), ["temp"])
+    assert rows == [{"timestamp": t0 + timedelta(minutes=i), "temp": 20.0 + i} for i in (2, 3, 4)]
+    store.close()
+
+
+def test_reopened_database_keeps_its_rows(tmp_path, t0):
+    path = str(tmp_path / "run.sqlite")
+    filled_store(path, t0, 3).close()
+    store = SQLiteStore(path)
+    assert [r["temp"] for r in store.range()] == [20.0, 21.0, 22.0]
+    store.close()
+
+
+def test_prune(tmp_path, t0):
+    store = filled_store(str(tmp_path / "run.sqlite"), t0)
+    store.prune(hours=5 / 60, now=t0 + timedelta(minutes=9))
+    assert [r["timestamp"] for r in store.range()][0] == t0 + timedelta(minutes=4)
+    assert store.events() == []
+    store.close()
+
+
+def test_csv_import(tmp_path, t0):
+    logger = DataLogger(str(tmp_path / "log.csv"), buffered=False)
+    for i in range(3):
+        logger.log_values({"temp": 20.0 + i}, {}, timestamp=t0 + timedelta(seconds=i))
+    store = SQLiteStore(str(tmp_path / "log.sqlite"))
+    store.import_csv(str(tmp_path / "log.csv"))
+    assert [r["temp"] for r in store.range()] == [20.0, 21.0, 22.0]
+    store.close()
+
+
+def test_data_logger_keeps_the_emergency_log_in_sqlite(tmp_path):
+    logger = DataLogger(str(tmp_path / "data" / "log.csv"), sqlite=True)
+    path = str(tmp_path / ".data" / "emergency_log.csv")
+    now = datetime.now().replace(microsecond=0)
+    logger.max_log_values({"temp": 20.5}, {"heater_pump": 1.0}, path=path, timestamp=now)
+    logger.log_values({"temp": 21.0}, {}, timestamp=now)
+    assert logger.retention_rows(path)[0][0] == now
+    assert [r["temp"] for r in logger.database.range()] == [21.0]
+    logger.close()
@@ -0,0 +1,114 @@
+# tests/test_web.py
+
+import base64
+import hashlib
+import json
+import os
+import socket
+import struct
+from datetime import datetime
+from types import SimpleNamespace
+
+from reactor.sample_bus import SampleBus
+from reactor.snapshot import ReactorSnapshot
+from reactor.web import WEBSOCKET_GUID, WebDashboard, _Feed, _Viewer, flatten
+
+
+def message(frame: bytes) -> dict:
+    """JSON of one server text frame."""
+    assert frame[0] == 0x81
+    return json.loads(frame[4:] if frame[1] == 126 else frame[2:])
+
+
+def test_flatten():
+    snapshot = ReactorSnapshot(datetime(2025, 11, 13, 12, 0, 0), sensors={"temp": 20.5},
+                               pumps={"co2_pump": 5.0}, ph_setpoint=7.5)
+    values = flatten(snapshot)
+    assert values["sensors.temp"] == 20.5 and values["pumps.co2_pump"] == 5.0
+    assert values["ph_setpoint"] == 7.5 and values["brightness"] is None
+    assert "timestamp" not in values and "read_at" not in values
+
+
+def test_feed_sends_only_changes():
+    bus = SampleBus()
+    feed = _Feed(SimpleNamespace(addr=21, samples=bus))
+    first = message(feed.delta(bus.update({"sensors": {"temp": 20.5, "pH": 7.1}}, datetime(2025, 11, 13, 12, 0, 0))))
+    assert first["addr"] == 21 and first["t"] == "2025-11-13T12:00:00"
+    assert first["changes"]["sensors.temp"] == 20.5 and first["changes"]["ph_setpoint"] is None
+    assert feed.delta(bus.update({"sensors": {"temp": 20.5, "pH": 7.1}}, datetime(2025, 11, 13, 12, 0, 2))) is None
+    second = message(feed.delta(bus.update({"sensors": {"temp": 20.6, "pH": 7.1}}, datetime(2025, 11, 13, 12, 0, 4))))
+    assert second["changes"] == {"sensors.temp": 20.6}
+    full = message(feed.full())
+    assert full["t"] == "2025-11-13T12:00:04" and full["full"]["sensors.pH"] == 7.1
+    assert feed.messages == 2
+
+
+def test_viewer_that_falls_behind_is_resynced():
+    viewer = _Viewer(maxsize=2)
+    viewer.push(b"1")
+    viewer.push(b"2")
+    assert not viewer.resync
+    viewer.push(b"3")
+    assert viewer.resync and viewer.dropped == 3 and viewer.frames.empty()
+
+
+class _Connection:
+    """Client side of a dashboard WebSocket."""
+
+    def __init__(self, port):
+        self.sock = socket.create_connection(("127.0.0.1", port), timeout=5)
+        self.file = self.sock.makefile("rb")
+
+    def handshake(self, key):
+        self.sock.sendall(f"GET /ws HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+                          f"Sec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode())
+        status = self.file.readline()
+        headers = {}
+        for line in iter(self.file.readline, b"\r\n"):
+            name, value = line.decode().split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+        return status, headers
+
+    def send(self, opcode, payload=b""):
+        mask = os.urandom(4)
+        masked = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
+        self.sock.sendall(struct.pack(">BB", 0x80 | opcode, 0x80 | len(payload)) + mask + masked)
+
+    def receive(self):
+        """(opcode, payload) of the next server frame."""
+        first, length = self.file.read(2)
+        if length == 126:
+            length = struct.unpack(">H", self.file.read(2))[0]
+        return first & 0x0F, self.file.read(length)
+
+    def close(self):
+        self.file.close()
+        self.sock.close()
+
+
+def test_websocket_round_trip():
+    bus = SampleBus()
+    bus.update({"sensors": {"temp": 20.5}}, datetime(2025, 11, 13, 12, 0, 0))
+    dashboard = WebDashboard([SimpleNamespace(addr=21, samples=bus)], host="127.0.0.1", port=0)
+    dashboard.start()
+    connection = _Connection(dashboard.port)
+    try:
+        key = base64.b64encode(os.urandom(16)).decode()
+        status, headers = connection.handshake(key)
+        assert b" 101 " in status
+        accept = base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+        assert headers["sec-websocket-accept"] == accept
+
+        opcode, payload = connection.receive()
+        assert opcode == 0x1 and json.loads(payload)["full"]["sensors.temp"] == 20.5
+        bus.update({"sensors": {"temp": 20.7}}, datetime(2025, 11, 13, 12, 0, 2))
+        opcode, payload = connection.receive()
+        assert json.loads(payload) == {"addr": 21, "t": "2025-11-13T12:00:02", "changes": {"sensors.temp": 20.7}}
+
+        connection.send(0x9, b"hi")                         # ping
+        assert connection.receive() == (0xA, b"hi")
+        connection.send(0x8, struct.pack(">H", 1000))       # close
+        assert connection.receive() == (0x8, struct.pack(">H", 1000))
+    finally:
+        connection.close()
+        dashboard.stop()
@@ -41,12 +41,13 @@ def safe_sensor_read(reactor, max_retries=20):
     Attempt to read all sensors from the reactor.
     Retries up to max_retries times if the read fails.
     Returns sensor readings if successful, else None.
+    The reading is shared with the data logger (same sample, same timestamp).
     """
     sensors = None
     counter = 0
     while sensors is None and counter < max_retries:
         counter += 1
-        sensors = reactor.read_all_sensors()
+        sensors = reactor.sample().sensors
         
     if sensors is not None:
         return sensors